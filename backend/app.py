@@ -1,16 +1,45 @@
+import os
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from itertools import islice
 from typing import List, Optional, Dict, Any
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
+import numpy as np
 
 from models import Player, SuggestionV2, ScoringRules, LeagueContext, StrategyProfile
 import providers.sportsdata as sportsdata  # robust module import
-from logic.util import normalize_players
+from providers import get_provider, complete_bundle, VOLATILE_FEEDS
+from logic.util import build_player_table, volatile_updates
+from store.table import PlayerTable, PlayerView, dumps
+from store.refresher import RefreshScheduler
+from store.indexes import DraftIndex
+from store.events import EventHub, suggestion_delta
+from store.sessions import Catalog, DraftSession, SessionStore, catalog_key, settings_hash
+from store.shared import SharedState
 from logic.engine_v2.reproject import reproject_points
-from logic.engine_v2.utility import suggest_v2
+from logic.engine_v2.utility import suggest_v2, suggest_v2_by_position, MAX_SUGGESTIONS
+from logic.engine_v2.state import EngineState
+from logic.engine_v2.features import static_features
 
 # ---- FastAPI app + CORS ----
-app = FastAPI(title="Fantasy Draft Assistant API", version="1.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    SCHEDULER.start()
+    follower = asyncio.create_task(_follow_shared()) if SESSIONS.shared is not None else None
+    yield
+    if follower is not None:
+        follower.cancel()
+    await SCHEDULER.stop()
+    # release the pooled SportsData connections
+    await sportsdata.aclose()
+    # park live drafts on disk so a restart picks them back up
+    SESSIONS.flush()
+
+
+app = FastAPI(title="Fantasy Draft Assistant API", version="1.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -18,19 +47,37 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
+# ---- Data source (FFL_PROVIDER: sportsdata | fixture | synthetic) ----
+PROVIDER = get_provider()
+
 # ---- In-memory data store ----
-DATA: Dict[str, Any] = {
-    "players": {},      # pid -> Player
-    "undrafted": set(), # set[pid]
-    "drafted": [],      # list[{"playerId": int, "teamName": str}]
-    "history": [],      # events (optional for engine)
-    "rules": ScoringRules().dict(),
-    "context": LeagueContext().dict(),
-    "strategy": StrategyProfile().dict(),
-    "opponents": {},
-}
+# One read-only catalog per season (columnar table + search index), shared by every draft on it.
+# Draft state (picks, history, rules/context/strategy/opponents, push channel) lives in a
+# DraftSession keyed by draft id (?draft=<id> or X-Draft-Id; "default" if omitted).
+# FFL_MAX_LIVE_DRAFTS sessions stay in memory; idle ones beyond that are parked in FFL_SESSION_DIR.
+# Every change is journaled there too (append-only log, snapshot every FFL_SNAPSHOT_EVERY events),
+# so a crashed/restarted backend resumes each draft where it was.
+# FFL_STATE_DB=<path>.sqlite switches to shared state for `uvicorn --workers N`: journals go to
+# that SQLite (WAL) database and catalogs are published next to it as memory-mapped columns,
+# so every worker sees every draft and the catalog is held once in the page cache.
+SESSIONS = SessionStore(
+    root=os.getenv("FFL_SESSION_DIR") or os.path.join(os.path.dirname(__file__), ".cache", "sessions"),
+    max_live=int(os.getenv("FFL_MAX_LIVE_DRAFTS", "16")),
+    shared=SharedState(os.environ["FFL_STATE_DB"]) if os.getenv("FFL_STATE_DB") else None,
+    snapshot_every=int(os.getenv("FFL_SNAPSHOT_EVERY", "50")),
+    fsync_every=int(os.getenv("FFL_JOURNAL_FSYNC_EVERY", "8")),
+    fsync_seconds=float(os.getenv("FFL_JOURNAL_FSYNC_SECONDS", "1.0")),
+)
+SESSIONS.default_catalog.source = PROVIDER
+
+# The suggestion list pushed with each event (same default view the UI fetches)
+PUSH_SUGGEST_COUNT = 12
+PUSH_PING_SECONDS = 15.0
+# How often a worker looks for other workers' changes to drafts it is pushing (shared state)
+SHARED_POLL_SECONDS = float(os.getenv("FFL_SHARED_POLL_SECONDS", "0.25"))
 
 # ---- Request models ----
 class DraftReq(BaseModel):
@@ -40,43 +87,281 @@ class DraftReq(BaseModel):
 class UndraftReq(BaseModel):
     playerId: int
 
+class BulkPick(BaseModel):
+    teamName: str
+    playerId: Optional[int] = None
+    # or resolve by name (fuzzy), optionally narrowed by NFL team / position
+    name: Optional[str] = None
+    team: Optional[str] = None
+    pos: Optional[str] = None
+
+class BulkDraftReq(BaseModel):
+    picks: List[BulkPick]
+
+
+# ---- Sessions ----
+def _open_session(draft_id: Optional[str]) -> DraftSession:
+    """The draft, caught up with whatever other workers changed (no-op on one worker)."""
+    _sync_catalogs()
+    s = SESSIONS.get(draft_id)
+    _catch_up(s)
+    return s
+
+
+def _session_for(draft_id: Optional[str]) -> DraftSession:
+    try:
+        return _open_session(draft_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@contextmanager
+def _writing(s: DraftSession):
+    """
+    Scope of a draft change: the session lock plus, with shared state, the cross-worker
+    write transaction. Catches up first, so the change applies to the latest state and
+    its journal version is the next one.
+    """
+    with s.lock, s.transaction():
+        _catch_up(s)
+        yield
+
+
+def _catch_up(s: DraftSession) -> None:
+    """Apply other workers' changes to this draft and push them to our subscribers."""
+    # under the session lock, so a concurrent local write never reuses one of these versions
+    with s.lock:
+        for ev in s.catch_up(SESSIONS.catalog):
+            t, v = ev["t"], ev["v"]
+            if t == "draft":
+                _publish(s, "draft", version=v, pid=ev["pid"], teamName=ev["teamName"], pos=ev.get("pos"), removed=[ev["pid"]])
+            elif t == "bulk":
+                picks = [{k: p.get(k) for k in ("pid", "teamName", "pos")} for p in ev["picks"]]
+                _publish(s, "bulk", version=v, picks=picks, removed=[p["pid"] for p in picks])
+            elif t == "undraft":
+                table = s.bind()
+                _publish(s, "undraft", version=v, pid=ev["pid"], added=table.to_dicts(table.rows_of([ev["pid"]])))
+            elif t in ("reset", "catalog"):
+                _publish(s, "reset", suggest=False, version=v)
+            else:
+                _publish(s, t, version=v)
+        s.events.advance(s.synced)
+
+
+def _sync_catalogs() -> None:
+    """Pick up catalogs other workers published; a refresh is pushed like a local one."""
+    for catalog, old, changed in SESSIONS.sync_catalogs(get_provider):
+        if changed is None:
+            continue   # rebuilt: drafts re-apply their picks on next use
+        catalog.projections.carry(old, catalog.table, changed)
+        rows = catalog.table.to_dicts(catalog.table.rows_of(changed))
+        for s in SESSIONS.live(catalog):
+            _publish(s, "refresh", changed=changed, rows=rows)
+
+
+def _sync_watched() -> None:
+    _sync_catalogs()
+    for s in SESSIONS.live():
+        if s.events.subscribers:
+            _catch_up(s)
+
+
+async def _follow_shared() -> None:
+    """Shared state: push other workers' changes to this worker's subscribers without waiting for a request."""
+    while True:
+        await asyncio.sleep(SHARED_POLL_SECONDS)
+        try:
+            await asyncio.to_thread(_sync_watched)
+        except Exception as e:
+            print("shared state sync error:", e)
+
+
+def _session(request: Request, draft: Optional[str] = None) -> DraftSession:
+    """Request dependency: the draft named by ?draft= or the X-Draft-Id header."""
+    return _session_for(draft or request.headers.get("x-draft-id"))
+
+
+# ---- Conditional GETs ----
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """304 if the client's If-None-Match already names `etag` (checked before any real work)."""
+    inm = request.headers.get("if-none-match")
+    if inm and (inm.strip() == "*" or etag in [t.strip() for t in inm.split(",")]):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    return None
+
+
+def _tag(response: Response, etag: str) -> None:
+    # no-cache = "revalidate every time", so browsers send If-None-Match on their own
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+
 
 # ---- Helpers ----
-def _my_bye_counts() -> Dict[int, int]:
+def _my_bye_counts(s: DraftSession, table: PlayerTable) -> Dict[int, int]:
     """Count byes on MY roster; used by engine for balancing bye weeks."""
     counts: Dict[int, int] = {}
-    pid_map: Dict[int, Player] = DATA["players"]
-    for d in DATA["drafted"]:
-        if d.get("teamName") != "ME":
-            continue
-        pid = d["playerId"]
-        p = pid_map.get(pid)
-        if not p:
-            continue
+    for p in table.views(s.index.team_rows(table, "ME")):
         if p.bye_week is None:
             continue
         counts[p.bye_week] = counts.get(p.bye_week, 0) + 1
     return counts
 
 
-async def _fetch_all_wrapper(season: Optional[int] = None) -> Dict[str, Any]:
+def _pool_views(s: DraftSession, table: PlayerTable, pos: Optional[str] = None) -> List[PlayerView]:
+    """UNDRAFTED players in board order; all players if undrafted got wiped so the UI never blanks."""
+    return table.views(s.index.iter_rows(table, pos))
+
+
+def _parse_fields(fields: Optional[str]) -> List[str]:
+    """?fields=name,team,adp -> Player field names (player_id always included); empty = all fields."""
+    if not fields:
+        return list(Player.model_fields)
+    wanted = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in wanted if f not in Player.model_fields]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return ["player_id"] + [f for f in dict.fromkeys(wanted) if f != "player_id"]
+
+
+def _player_page(
+    s: DraftSession,
+    table: PlayerTable,
+    pos: Optional[str],
+    q: Optional[str],
+    cursor: Optional[int],
+    limit: Optional[int],
+    fields: Optional[str],
+) -> Response:
     """
-    Call whichever entrypoint exists in providers.sportsdata.
-    Expected to return a dict with keys: players, projections, byes, depth, season_stats
+    One page of UNDRAFTED players in board order, as plain dicts of the requested fields.
+    `cursor` is the player_id of the last row of the previous page (X-Next-Cursor); paging
+    resumes right after it on the current board, so picks made in between never shift a page.
+    Rows are read straight from the table columns and returned as a ready Response, skipping
+    Player construction and response_model re-validation; cost is O(page), not O(catalog).
+    Full rows are spliced from the table's cached per-player JSON fragments.
     """
-    # Try the common names in order:
-    if hasattr(sportsdata, "fetch_all"):
-        return await sportsdata.fetch_all(season)
-    if hasattr(sportsdata, "fetch_all_data"):
-        return await sportsdata.fetch_all_data(season)
-    if hasattr(sportsdata, "fetch_all_sources"):
-        return await sportsdata.fetch_all_sources(season)
-    if hasattr(sportsdata, "get_all"):
-        return await sportsdata.get_all(season)
-    raise RuntimeError(
-        "providers.sportsdata is missing a fetch_all-like function. "
-        "Please expose fetch_all(season) or alias your existing entrypoint."
-    )
+    cols = _parse_fields(fields)
+    start = 0
+    if cursor is not None:
+        i = table.row_of(cursor)
+        if i is None:
+            raise HTTPException(status_code=400, detail="Unknown cursor")
+        at = np.flatnonzero(table.order(pos) == i)
+        start = int(at[0]) + 1 if at.size else 0
+    rows = s.index.iter_rows(table, pos, start=start)
+    if q:
+        # name/team filter through the prebuilt search index (prefix, nickname, team, typo-tolerant)
+        hits = s.catalog.search.matches(q)
+        rows = (i for i in rows if i in hits)
+    if limit is not None:
+        page = list(islice(rows, max(1, limit) + 1))
+        more = len(page) > max(1, limit)
+        page = page[:max(1, limit)]
+    else:
+        page, more = list(rows), False
+    headers = {"X-Next-Cursor": str(table.value(page[-1], "player_id"))} if more else {}
+    if not fields:
+        return Response(table.json_array(page), media_type="application/json", headers=headers)
+    return JSONResponse(table.to_dicts(page, cols), headers=headers)
+
+
+def _fill_missing_projections(table: PlayerTable, players: List[PlayerView]) -> None:
+    """
+    Only fill missing projected_points (do NOT overwrite feed values), in the default
+    rules: the catalog is shared, each draft's own scoring lives in its ProjectionCache entry.
+    """
+    try:
+        pts = reproject_points(players, ScoringRules())
+        table.fill_missing_projections([p.row for p in players], pts)
+    except Exception:
+        pass
+
+
+def _patched_copy(table: PlayerTable, raw: Dict[str, Any]):
+    changes = volatile_updates(raw, table)
+    if not changes:
+        return table, []
+    new = table.copy()
+    changed = new.patch(changes)
+    _fill_missing_projections(new, new.views(new.rows_of(changed)))
+    static_features(new)   # re-derive features for rows whose injury/depth changed
+    return new, changed
+
+
+def _suggest_delta(s: DraftSession) -> Dict[str, Any]:
+    """Recompute the pushed suggestion list and diff it against what subscribers last got."""
+    hub: EventHub = s.events
+    rows = [x.model_dump() for x in _suggestions(s, s.bind(), PUSH_SUGGEST_COUNT)]
+    delta = suggestion_delta(hub.last_suggest, rows)
+    hub.last_suggest = rows
+    return {"suggest": delta}
+
+
+def _publish(s: DraftSession, kind: str, suggest: bool = True, version: Optional[int] = None, **payload: Any) -> int:
+    """Broadcast a state change to the draft's push subscribers; returns its new state version."""
+    return s.events.publish(kind, (lambda: _suggest_delta(s)) if suggest else None, version=version, **payload)
+
+
+async def _refresh_volatile(
+    catalog: Catalog,
+    feeds=VOLATILE_FEEDS,
+    offline: Optional[bool] = None,
+    revalidate: bool = False,
+) -> List[int]:
+    """
+    Fetch the volatile feeds, diff + patch a copy of the catalog in a worker thread,
+    then swap it in with a single assignment: readers hold either the old table or
+    the new one, never a half-patched one. Returns the changed player ids.
+    """
+    if not len(catalog.table):
+        return []
+    raw = await catalog.source.fetch_volatile(catalog.season, offline=offline, feeds=feeds, revalidate=revalidate)
+    table: PlayerTable = catalog.table
+    new, changed = await asyncio.to_thread(_patched_copy, table, raw)
+    if changed:
+        if not SESSIONS.swap_catalog(catalog, table, new, changed):
+            # a re-init (or another worker's refresh) landed while we were building; it wins
+            return []
+        # move cached rule projections onto the new table, re-scoring only the changed players
+        await asyncio.to_thread(catalog.projections.carry, table, new, changed)
+        rows = new.to_dicts(new.rows_of(changed))
+        for s in SESSIONS.live(catalog):
+            await asyncio.to_thread(_publish, s, "refresh", changed=changed, rows=rows)
+    return changed
+
+
+async def _refresh_all(feeds=VOLATILE_FEEDS, revalidate: bool = False) -> List[int]:
+    if SESSIONS.shared is not None and not SESSIONS.shared.claim("refresh", SCHEDULER.interval * 0.8):
+        return []   # another worker has this round
+    changed: List[int] = []
+    for catalog in list(SESSIONS.catalogs.values()):
+        changed += await _refresh_volatile(catalog, feeds=feeds, revalidate=revalidate)
+    return changed
+
+
+# ---- Background refresh (FFL_REFRESH_SECONDS, 0 = off; FFL_REFRESH_FEEDS) ----
+SCHEDULER = RefreshScheduler(
+    tick=lambda: _refresh_all(
+        feeds=tuple(f.strip() for f in os.getenv("FFL_REFRESH_FEEDS", "injuries,depth").split(",") if f.strip()),
+        revalidate=True,
+    ),
+    interval=float(os.getenv("FFL_REFRESH_SECONDS", "300")),
+)
+
+
+async def _fetch_all_wrapper(
+    season: Optional[int] = None,
+    offline: Optional[bool] = None,
+    provider: Optional[str] = None,
+):
+    """
+    Fetch the raw feed bundle from the configured provider (or a named one).
+    Returns (raw, provider); raw has keys: players, byes, depth, projections, season_stats, injuries
+    offline=True asks the provider to serve from its on-disk cache only.
+    """
+    src = get_provider(provider) if provider else PROVIDER
+    raw = complete_bundle(await src.fetch_all(season, offline=offline))
+    return raw, src
 
 
 # ---- Endpoints ----
@@ -86,194 +371,394 @@ def health():
 
 
 @app.get("/api/init")
-async def init(season: Optional[int] = None):
+async def init(
+    season: Optional[int] = None,
+    offline: Optional[bool] = None,
+    provider: Optional[str] = None,
+    reload: bool = False,
+    reset: bool = True,
+    s: DraftSession = Depends(_session),
+):
     """
-    Fetch all data from SportsData and build our in-memory dataset.
+    Start this draft on the season's catalog, building the catalog if needed.
+    ?reset=false keeps the draft's picks (e.g. a page reload mid-draft).
+    The catalog is shared by every draft on the season: it is only re-fetched on the
+    first init, with ?reload=true, or when ?provider= names a different source.
+    SportsData feeds come through the on-disk cache; ?offline=true never touches the network.
+    ?provider=synthetic|fixture overrides FFL_PROVIDER for this init.
     """
-    try:
-        raw = await _fetch_all_wrapper(season)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"SportsData fetch failed: {e}")
-
-    players = normalize_players(raw)
-
-    DATA["players"] = players
-    DATA["undrafted"] = set(players.keys())
-    DATA["drafted"] = []
-    # Keep rules/context/strategy unless you want to reset them too
-
+    key = catalog_key(season)
+    catalog = SESSIONS.catalogs.get(key)
+    stale = (
+        catalog is None or reload or not len(catalog.table)
+        or (provider is not None and getattr(catalog.source, "name", None) != provider)
+    )
+    if stale:
+        try:
+            raw, src = await _fetch_all_wrapper(season, offline=offline, provider=provider)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Provider fetch failed: {e}")
+
+        table = build_player_table(raw)
+        _fill_missing_projections(table, table.views())
+        if catalog is None:
+            catalog = Catalog(key, source=src, season=season)
+        catalog.source, catalog.season = src, season
+        catalog.rebuild(table)   # other drafts on this season re-apply their picks lazily
+        SESSIONS.publish_catalog(catalog)
+    else:
+        SESSIONS.put_catalog(catalog)
+
+    with _writing(s):
+        moved = s.catalog is not catalog
+        s.bind(catalog)
+        if reset:
+            s.reset()
+        # Keep rules/context/strategy unless you want to reset them too
+        _publish(s, "reset", suggest=False)
+        if reset:
+            s.record({"t": "reset", "catalog": catalog.key})
+        elif moved:
+            s.record({"t": "catalog", "catalog": catalog.key})
+
+    table = catalog.table
+    byes = table.column("bye_week")
     return {
-        "players_count": len(players),
-        "depth_teams": len({p.team for p in players.values() if p.team}),
-        "bye_count": len({p.bye_week for p in players.values() if p.bye_week}),
+        "players_count": len(table),
+        "depth_teams": len(set(table.team[table.team >= 0].tolist())),
+        "bye_count": len(set(byes[byes > 0].tolist())),
+        "draft": s.draft_id,
     }
 
 
+@app.post("/api/refresh")
+async def refresh(offline: Optional[bool] = None, s: DraftSession = Depends(_session)):
+    """
+    Re-pull only the volatile feeds (injuries, depth, projections), diff them against
+    the catalog and patch just the players that changed. Draft state is untouched.
+    """
+    if not len(s.catalog.table):
+        raise HTTPException(status_code=409, detail="No catalog yet; call /api/init first")
+    try:
+        changed = await _refresh_volatile(s.catalog, offline=offline)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Provider fetch failed: {e}")
+    return {"changed": changed, "changed_count": len(changed)}
+
+
 @app.get("/api/players", response_model=List[Player])
-def list_players(q: Optional[str] = None, pos: Optional[str] = None):
+def list_players(
+    request: Request,
+    q: Optional[str] = None,
+    pos: Optional[str] = None,
+    cursor: Optional[int] = None,
+    limit: Optional[int] = None,
+    fields: Optional[str] = None,
+    s: DraftSession = Depends(_session),
+):
     """
     Return UNDRAFTED players (with optional filters).
     If undrafted set is empty (bad state), fall back to all players so UI never blanks.
+    ?limit=50 pages through the board (next page: ?cursor=<X-Next-Cursor>);
+    ?fields=name,team,adp trims each row to those fields (+ player_id).
     """
-    # Primary source = undrafted
-    if DATA["undrafted"]:
-        players = [p for pid, p in DATA["players"].items() if pid in DATA["undrafted"]]
-    else:
-        # Fallback so the UI doesn't go blank if undrafted got wiped
-        players = list(DATA["players"].values())
-
-    # Filters
-    if pos:
-        players = [p for p in players if (p.position or "").upper() == pos.upper()]
-    if q:
-        ql = q.lower()
-        players = [p for p in players if ql in p.name.lower() or (p.team and ql in p.team.lower())]
-
-    # Only fill missing projected_points (do NOT overwrite feed values)
-    rules = ScoringRules(**DATA["rules"])
-    try:
-        pts = reproject_points(players, rules)
-        for i, p in enumerate(players):
-            if p.projected_points is None:
-                try:
-                    p.projected_points = float(pts[i])
-                except Exception:
-                    pass
-    except Exception:
-        pass
-
-    # Sort: projection desc, ADP asc, Name
-    players.sort(key=lambda p: (-(p.projected_points or 0.0), p.adp or 9999, p.name))
-    return players
+    # Primary source = undrafted (fallback: everyone, so the UI doesn't go blank), already
+    # in board order: projection desc, ADP asc, Name. Missing projections were filled at init.
+    table = s.bind()  # one snapshot per request (refresh swaps the catalog)
+    etag = s.etag()
+    cached = _not_modified(request, etag)
+    if cached:
+        return cached
+    out = _player_page(s, table, pos, q, cursor, limit, fields)
+    _tag(out, etag)
+    return out
 
 
 @app.get("/api/undrafted", response_model=List[Player])
-def get_undrafted(pos: Optional[str] = None, q: Optional[str] = None):
+def get_undrafted(
+    request: Request,
+    pos: Optional[str] = None,
+    q: Optional[str] = None,
+    cursor: Optional[int] = None,
+    limit: Optional[int] = None,
+    fields: Optional[str] = None,
+    s: DraftSession = Depends(_session),
+):
     """
     Direct UNDRAFTED list with optional filters — useful as a frontend fallback.
+    Same paging (cursor/limit) and sparse fieldsets (fields=) as /api/players.
     """
-    if DATA["undrafted"]:
-        players = [DATA["players"][pid] for pid in DATA["undrafted"]]
-    else:
-        players = list(DATA["players"].values())
+    table = s.bind()
+    etag = s.etag()
+    cached = _not_modified(request, etag)
+    if cached:
+        return cached
+    out = _player_page(s, table, pos, q, cursor, limit, fields)
+    _tag(out, etag)
+    return out
 
-    # Filters
-    if pos:
-        players = [p for p in players if (p.position or "").upper() == pos.upper()]
-    if q:
-        ql = q.lower()
-        players = [p for p in players if ql in p.name.lower() or (p.team and ql in p.team.lower())]
 
-    # Only fill missing projected_points (do NOT overwrite feed values)
-    rules = ScoringRules(**DATA["rules"])
-    try:
-        pts = reproject_points(players, rules)
-        for i, p in enumerate(players):
-            if p.projected_points is None:
-                try:
-                    p.projected_points = float(pts[i])
-                except Exception:
-                    pass
-    except Exception:
-        pass
-
-    return players
+@app.get("/api/typeahead")
+def typeahead(q: str, limit: int = 10, pos: Optional[str] = None, s: DraftSession = Depends(_session)):
+    """
+    Ranked name/team matches among UNDRAFTED players (best match first, then board order).
+    Accent/punctuation-insensitive, understands common nicknames and team abbreviations.
+    """
+    table = s.bind()
+    avail = s.index.available
+    posu = (pos or "").upper()
+    if posu:
+        keep = lambda i: avail[i] and table.position_of(i) == posu
+    else:
+        keep = lambda i: avail[i]
+    rows = s.catalog.search.search(q, table.rank(), limit=max(1, min(limit, 50)), keep=keep)
+    return [
+        {
+            "player_id": table.value(i, "player_id"),
+            "name": table.names[i],
+            "position": table.position_of(i),
+            "team": table.team_of(i),
+            "bye_week": table.value(i, "bye_week"),
+            "adp": table.value(i, "adp"),
+            "projected_points": table.value(i, "projected_points"),
+        }
+        for i in rows
+    ]
 
 
 @app.get("/api/drafted")
-def get_drafted():
-    # Return [{ player, teamName }]
+def get_drafted(request: Request, s: DraftSession = Depends(_session)):
+    # Return [{ player, teamName }], spliced from the cached player JSON fragments
+    table = s.bind()
+    etag = s.etag()
+    cached = _not_modified(request, etag)
+    if cached:
+        return cached
     out = []
-    for d in DATA["drafted"]:
-        pid = d["playerId"]
-        p = DATA["players"].get(pid)
-        if not p:
+    for pid, team_name in s.index.drafted.items():
+        i = table.row_of(pid)
+        if i is None:
             continue
-        out.append({"player": p, "teamName": d["teamName"]})
-    return out
+        out.append(b'{"player":' + table.fragment(i) + b',"teamName":' + dumps(team_name) + b"}")
+    response = Response(b"[" + b",".join(out) + b"]", media_type="application/json")
+    _tag(response, etag)
+    return response
 
 
 @app.post("/api/draft")
-def draft(req: DraftReq):
+def draft(req: DraftReq, s: DraftSession = Depends(_session)):
     pid = req.playerId
-    if pid not in DATA["players"]:
-        raise HTTPException(status_code=404, detail="Unknown player")
-    if pid not in DATA["undrafted"]:
-        # already drafted
-        return {"ok": True}
-    DATA["undrafted"].remove(pid)
-    DATA["drafted"].append({"playerId": pid, "teamName": req.teamName})
-    DATA["history"].append({"t": "draft", "pid": pid, "teamName": req.teamName})
+    with _writing(s):
+        table = s.bind()
+        if pid not in table:
+            raise HTTPException(status_code=404, detail="Unknown player")
+        if not s.index.draft(table, pid, req.teamName):
+            # already drafted
+            return {"ok": True}
+        pos = table.get(pid).position
+        event = {"t": "draft", "pid": pid, "teamName": req.teamName, "pos": pos}
+        s.history.append(event)
+        _publish(s, "draft", pid=pid, teamName=req.teamName, pos=pos, removed=[pid])
+        s.record(event)
     return {"ok": True}
 
 
+def _resolve_pick(s: DraftSession, table: PlayerTable, pick: BulkPick, taken: set) -> Dict[str, Any]:
+    """
+    Map one bulk pick to a player id. Ids are taken as-is; names go through the search
+    index, narrowed by team/pos, preferring players still on the board (and not already
+    claimed earlier in the batch), then best match quality, then board rank.
+    """
+    if pick.playerId is not None:
+        if pick.playerId not in table:
+            return {"error": "Unknown player"}
+        return {"pid": pick.playerId}
+    if not pick.name:
+        return {"error": "Need playerId or name"}
+    hits = s.catalog.search.matches(pick.name)
+    team = (pick.team or "").upper()
+    posu = (pick.pos or "").upper()
+    rank = table.rank()
+    avail = s.index.available
+    cands = sorted(
+        (not avail[i] or int(table.ids[i]) in taken, qual, rank[i], i)
+        for i, qual in hits.items()
+        if (not team or table.team_of(i) == team) and (not posu or table.position_of(i) == posu)
+    )
+    if not cands:
+        return {"error": "No matching player"}
+    best = cands[0]
+    out = {"pid": int(table.ids[best[3]]), "matched": table.names[best[3]]}
+    if len(cands) > 1 and cands[1][:2] == best[:2]:
+        out["ambiguous"] = True   # same quality: went with the higher-ranked player
+    return out
+
+
+@app.post("/api/draft/bulk")
+def draft_bulk(req: BulkDraftReq, s: DraftSession = Depends(_session)):
+    """
+    Apply an ordered list of picks in one go (catching up a board): every pick is
+    resolved first and nothing is applied unless all resolve (422 lists the failures).
+    One push event and one version bump for the whole batch; players already drafted
+    are skipped, as with /api/draft.
+    """
+    with _writing(s):
+        table = s.bind()
+        resolved: List[Dict[str, Any]] = []
+        errors: List[Dict[str, Any]] = []
+        taken: set = set()
+        for n, pick in enumerate(req.picks):
+            r = _resolve_pick(s, table, pick, taken)
+            if "pid" in r and r["pid"] in taken:
+                r = {"error": "Player picked twice in this batch"}
+            if "error" in r:
+                errors.append({"index": n, **r, **pick.dict(exclude_none=True)})
+                continue
+            taken.add(r["pid"])
+            resolved.append({**r, "teamName": pick.teamName})
+        if errors:
+            raise HTTPException(status_code=422, detail={"unresolved": errors})
+
+        events: List[Dict[str, Any]] = []
+        skipped: List[int] = []
+        for r in resolved:
+            pid = r["pid"]
+            if not s.index.draft(table, pid, r["teamName"]):
+                skipped.append(pid)
+                continue
+            events.append({"t": "draft", "pid": pid, "teamName": r["teamName"], "pos": table.get(pid).position})
+        if events:
+            s.history.extend(events)
+            _publish(
+                s, "bulk",
+                picks=[{k: e[k] for k in ("pid", "teamName", "pos")} for e in events],
+                removed=[e["pid"] for e in events],
+            )
+            s.record({"t": "bulk", "picks": events})
+        return {
+            "ok": True,
+            "version": s.events.version,
+            "applied": len(events),
+            "skipped": skipped,
+            "picks": resolved,
+        }
+
+
 @app.post("/api/undraft")
-def undraft(req: UndraftReq):
+def undraft(req: UndraftReq, s: DraftSession = Depends(_session)):
     pid = req.playerId
-    # Remove latest matching drafted entry (in case drafted more than once in history)
-    for i in range(len(DATA["drafted"]) - 1, -1, -1):
-        if DATA["drafted"][i]["playerId"] == pid:
-            DATA["drafted"].pop(i)
-            break
-    DATA["undrafted"].add(pid)
-    DATA["history"].append({"t": "undraft", "pid": pid})
+    with _writing(s):
+        table = s.bind()
+        if s.index.undraft(table, pid):
+            event = {"t": "undraft", "pid": pid}
+            s.history.append(event)
+            _publish(s, "undraft", pid=pid, added=table.to_dicts(table.rows_of([pid])))
+            s.record(event)
     return {"ok": True}
 
 
 @app.post("/api/rules")
-def set_rules(rules: ScoringRules):
-    DATA["rules"] = rules.dict()
+def set_rules(rules: ScoringRules, s: DraftSession = Depends(_session)):
+    with _writing(s):
+        s.rules = rules.dict()
+        # start scoring the catalog under the new rules now; suggest waits on it if it gets there first
+        s.catalog.projections.prime(s.bind(), settings_hash(s.rules), s.rules)
+        _publish(s, "rules")
+        s.record({"t": "rules", "rules": s.rules})
     return {"ok": True}
 
 
 @app.post("/api/context")
-def set_context(ctx: LeagueContext):
-    DATA["context"] = ctx.dict()
+def set_context(ctx: LeagueContext, s: DraftSession = Depends(_session)):
+    with _writing(s):
+        s.context = ctx.dict()
+        _publish(s, "context")
+        s.record({"t": "context", "context": s.context})
     return {"ok": True}
 
 
 @app.post("/api/strategy")
-def set_strategy(strategy: StrategyProfile):
-    DATA["strategy"] = strategy.dict()
+def set_strategy(strategy: StrategyProfile, s: DraftSession = Depends(_session)):
+    with _writing(s):
+        s.strategy = strategy.dict()
+        _publish(s, "strategy")
+        s.record({"t": "strategy", "strategy": s.strategy})
     return {"ok": True}
 
 
 @app.get("/api/suggest_v2", response_model=List[SuggestionV2])
-def suggest_v2_endpoint(count: int = 12, pos: Optional[str] = None):
-    # Prepare inputs for the engine
-    all_players = (
-        [DATA["players"][pid] for pid in DATA["undrafted"]]
-        if DATA["undrafted"]
-        else list(DATA["players"].values())
-    )
-    rules = ScoringRules(**DATA["rules"])
-    ctx = LeagueContext(**DATA["context"])
-    strategy = StrategyProfile(**DATA["strategy"])
-    bye_counts = _my_bye_counts()
+def suggest_v2_endpoint(
+    request: Request,
+    response: Response,
+    count: int = 12,
+    pos: Optional[str] = None,
+    s: DraftSession = Depends(_session),
+):
+    table = s.bind()
+    etag = s.etag()
+    cached = _not_modified(request, etag)
+    if cached:
+        return cached   # nothing changed since the client's copy: the engine never runs
+    _tag(response, etag)
+    return _suggestions(s, table, count, pos)
+
+
+def _engine(s: DraftSession, table: PlayerTable, points: Dict[int, float]) -> EngineState:
+    """The draft's suggest_v2 boards; rebuilt when the catalog table or the projections change."""
+    eng = s.engine
+    if eng is None or not eng.matches(table, points):
+        eng = s.engine = EngineState.for_table(table, points, s.index.available)
+    return eng
+
+
+def _rankings(s: DraftSession, table: PlayerTable, by_position: bool):
+    """Run the engine at full depth: the unfiltered ranking, or {pos: ranking} for every position."""
+    index: DraftIndex = s.index
+    all_players = _pool_views(s, table)
+    # the engine reads my roster from `players` too (it filters drafted ids out of the pool)
+    my_players = table.views(index.team_rows(table, "ME"))
+    points = s.catalog.points(table, s.rules)
+    engine = _engine(s, table, points)
+    with engine.lock:
+        engine.sync(index.available)
+        return (suggest_v2_by_position if by_position else suggest_v2)(
+            players=all_players + my_players,
+            drafted=index.drafted,
+            rules=ScoringRules(**s.rules),
+            ctx=LeagueContext(**s.context),
+            my_bye_counts=_my_bye_counts(s, table),
+            strategy=StrategyProfile(**s.strategy),
+            count=MAX_SUGGESTIONS,
+            history=s.history,
+            opponents_needs=s.opponents,
+            projections=points,
+            engine=engine,
+        )
 
+
+def _suggestions(s: DraftSession, table: PlayerTable, count: int = 12, pos: Optional[str] = None) -> List[SuggestionV2]:
+    """
+    Served from the draft's SuggestionCache: the engine runs once per draft state version,
+    catalog revision and settings; counts are prefixes of the full-depth ranking and a
+    position filter reads that position's ranking (all positions are ranked in one pass).
+    """
+    key = (s.events.version, s.catalog.key, s.catalog.rev, settings_hash(s.rules, s.context, s.strategy, s.opponents))
+    view = (pos or "").upper() or None
     try:
-        scored = suggest_v2(
-            players=all_players,
-            drafted=DATA["drafted"],
-            rules=rules,
-            ctx=ctx,
-            my_bye_counts=bye_counts,
-            strategy=strategy,
-            count=count,
-            pos=pos,
-            history=DATA["history"],
-            opponents_needs=DATA["opponents"],
-        )
-        return scored
+        with s.lock:
+            if view is None:
+                ranked = s.suggested.get(key, None, lambda: _rankings(s, table, False))
+            else:
+                ranked = s.suggested.get(key, "by_position", lambda: _rankings(s, table, True)).get(view, [])
+        return ranked[:max(1, min(count, MAX_SUGGESTIONS))]
     except Exception as e:
         # Graceful fallback so UI always shows something
         print("suggest_v2 error:", e)
-        pool = all_players
-        if pos:
-            pool = [p for p in pool if (p.position or "").upper() == pos.upper()]
-        pool = sorted(pool, key=lambda p: (-(p.projected_points or 0.0), p.adp or 9999, p.name))
+        pool = _pool_views(s, table, pos)  # board order
         fallback = [
-            SuggestionV2(player=p, score=float(p.projected_points or 0.0))
+            SuggestionV2(player=p.to_player(), score=float(p.projected_points or 0.0))
             for p in pool[:max(1, count)]
         ]
         return fallback
@@ -281,26 +766,110 @@ def suggest_v2_endpoint(count: int = 12, pos: Optional[str] = None):
 
 # Back-compat route for older frontends
 @app.get("/api/suggest", response_model=List[SuggestionV2])
-def suggest_compat(count: int = 12, pos: Optional[str] = None):
-    return suggest_v2_endpoint(count=count, pos=pos)
+def suggest_compat(
+    request: Request,
+    response: Response,
+    count: int = 12,
+    pos: Optional[str] = None,
+    s: DraftSession = Depends(_session),
+):
+    return suggest_v2_endpoint(request, response, count=count, pos=pos, s=s)
+
+
+# ---- Push channel ----
+# Each message is {"v": state version, "type": ..., ...}. Types:
+#   hello/reset/ping            -> {v} (reset: reload everything)
+#   draft                       -> pid, teamName, pos, removed=[pid], suggest
+#   bulk                        -> picks=[{pid, teamName, pos}], removed=[pid...], suggest
+#   undraft                     -> pid, added=[player row], suggest
+#   refresh                     -> changed=[pid], rows=[player row], suggest
+#   rules / context / strategy  -> suggest
+# suggest = {"from": k, "rows": [...], "size": n}: keep your first k suggestions, replace the rest.
+# Reconnect with ?since=<last v> (SSE: Last-Event-ID) to replay what you missed.
+@app.websocket("/api/ws")
+async def ws_events(ws: WebSocket, since: Optional[int] = None, draft: Optional[str] = None):
+    try:
+        s = await asyncio.to_thread(_open_session, draft or ws.headers.get("x-draft-id"))
+    except ValueError:
+        await ws.close(code=1008)
+        return
+    await ws.accept()
+    hub: EventHub = s.events
+    q, first = hub.subscribe(since)
+    try:
+        for _, text in first:
+            await ws.send_text(text)
+        while True:
+            try:
+                item = await asyncio.wait_for(q.get(), PUSH_PING_SECONDS)
+            except asyncio.TimeoutError:
+                item = hub.ping()
+            if item is None:
+                break
+            await ws.send_text(item[1])
+    except (WebSocketDisconnect, RuntimeError, OSError):
+        pass
+    finally:
+        hub.unsubscribe(q)
+    try:
+        await ws.close()
+    except (RuntimeError, OSError):
+        pass
+
+
+@app.get("/api/events")
+async def sse_events(request: Request, since: Optional[int] = None, s: DraftSession = Depends(_session)):
+    """Server-Sent Events flavour of /api/ws (EventSource reconnects resume via Last-Event-ID)."""
+    last = request.headers.get("last-event-id")
+    if since is None and last and last.isdigit():
+        since = int(last)
+    hub: EventHub = s.events
+    q, first = hub.subscribe(since)
+
+    async def stream():
+        try:
+            for v, text in first:
+                yield f"id: {v}\ndata: {text}\n\n"
+            while True:
+                try:
+                    item = await asyncio.wait_for(q.get(), PUSH_PING_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                if item is None:
+                    return
+                yield f"id: {item[0]}\ndata: {item[1]}\n\n"
+        finally:
+            hub.unsubscribe(q)
+
+    return StreamingResponse(stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
 
 
 # Debug helper to confirm feed mapping
 @app.get("/api/feed_status")
-def feed_status():
-    players = DATA["players"]
-    und = DATA["undrafted"]
-    with_proj = (
-        sum(1 for pid in und if players[pid].projected_points is not None)
-        if und else sum(1 for p in players.values() if p.projected_points is not None)
-    )
-    with_adp = (
-        sum(1 for pid in und if (players[pid].adp or 0) > 0)
-        if und else sum(1 for p in players.values() if (p.adp or 0) > 0)
-    )
+def feed_status(request: Request, response: Response, s: DraftSession = Depends(_session)):
+    table = s.bind()
+    index: DraftIndex = s.index
+    status = {
+        "refresh": SCHEDULER.status(),
+        "version": s.events.version,
+        "subscribers": s.events.subscribers,
+        "draft": s.draft_id,
+        "sessions": SESSIONS.stats(),
+    }
+    # the cheap bookkeeping is part of the tag; the catalog scans below only run on a miss
+    etag = s.etag()[:-1] + "." + settings_hash(status) + '"'
+    cached = _not_modified(request, etag)
+    if cached:
+        return cached
+    _tag(response, etag)
+    rows = index.rows(table)
+    proj = table.column("projected_points")[rows]
+    adp = table.column("adp")[rows]
     return {
-        "players_count": len(players),
-        "undrafted_count": len(und),
-        "with_projected_points": with_proj,
-        "with_adp": with_adp,
+        "players_count": len(table),
+        "undrafted_count": index.remaining,
+        "with_projected_points": int((~np.isnan(proj)).sum()),
+        "with_adp": int((adp > 0).sum()),
+        **status,
     }
@@ -0,0 +1,60 @@
+"""
+Offline benchmark for the ingest + suggestion path, driven by the synthetic provider.
+
+    python bench.py                       # ~real pool size
+    python bench.py --players 25000       # 10x pool
+    python bench.py --fixture fixtures/   # replay a recorded bundle instead
+"""
+import time
+import asyncio
+import argparse
+from statistics import median
+
+from models import ScoringRules, LeagueContext, StrategyProfile
+from providers.fixture import FixtureProvider
+from providers.synthetic import SyntheticProvider
+from logic.util import normalize_players, build_player_table
+from logic.engine_v2.utility import suggest_v2
+
+
+def _timed(fn, repeat: int):
+    times, out = [], None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        times.append((time.perf_counter() - t0) * 1000.0)
+    return out, median(times)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--players", type=int, default=2500)
+    ap.add_argument("--teams", type=int, default=32)
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--fixture", default=None, help="replay this fixture dir instead of generating")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--count", type=int, default=12)
+    args = ap.parse_args()
+
+    src = FixtureProvider(args.fixture) if args.fixture else SyntheticProvider(args.players, args.teams, args.seed)
+    raw, t_fetch = _timed(lambda: asyncio.run(src.fetch_all()), 1)
+    players, t_norm = _timed(lambda: normalize_players(raw), args.repeat)
+    table, t_table = _timed(lambda: build_player_table(raw), args.repeat)
+
+    pool = table.views()
+    rules = ScoringRules(league_size=min(args.teams, 12))
+    ctx = LeagueContext(teams=min(args.teams, 12))
+    sugg, t_sugg = _timed(lambda: suggest_v2(
+        players=pool, drafted={}, rules=rules, ctx=ctx, my_bye_counts={},
+        strategy=StrategyProfile(), count=args.count,
+    ), args.repeat)
+
+    print(f"provider        {src.name}: {len(raw['players'])} raw players")
+    print(f"fetch           {t_fetch:9.1f} ms")
+    print(f"normalize       {t_norm:9.1f} ms  ({len(players)} fantasy players)")
+    print(f"player table    {t_table:9.1f} ms  ({table.nbytes() / 1024:.0f} KiB)")
+    print(f"suggest_v2      {t_sugg:9.1f} ms  (top {len(sugg)})")
+
+
+if __name__ == "__main__":
+    main()
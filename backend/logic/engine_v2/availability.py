@@ -1,5 +1,6 @@
 from typing import Tuple, List, Dict
 import math
+import numpy as np
 from statistics import pstdev
 from models import LeagueContext, Player
 
@@ -28,6 +29,22 @@ def _adaptive_sigma(pos: str, pool: List[Player]) -> float:
         return SIGMA_BY_POS_DEFAULT.get(pos, 12.0)
     return max(6.0, min(20.0, pstdev(adps) or SIGMA_BY_POS_DEFAULT.get(pos, 12.0)))
 
+def adaptive_sigmas(positions: np.ndarray, adp: np.ndarray) -> Dict[str, float]:
+    """_adaptive_sigma for every position at once (positions upper-cased, adp NaN = none)."""
+    out: Dict[str, float] = {}
+    has = ~np.isnan(adp)
+    for pos in set(positions.tolist()):
+        adps = adp[has & (positions == pos)]
+        default = SIGMA_BY_POS_DEFAULT.get(pos, 12.0)
+        out[pos] = default if len(adps) < 8 else max(6.0, min(20.0, float(adps.std()) or default))
+    return out
+
+def survival_with_adp(adp: np.ndarray, sigma: np.ndarray, next_pick: int) -> np.ndarray:
+    """availability_prob_with_adp over arrays (an ADP of 0 counts as undrafted, like `p.adp or 999`)."""
+    z = (next_pick - np.where(adp == 0.0, 999.0, adp)) / sigma / math.sqrt(2.0)
+    cdf = 0.5 * (1.0 + np.array([math.erf(v) for v in z.tolist()], dtype=np.float64))
+    return np.clip(cdf, 0.0, 1.0)
+
 def availability_prob_with_adp(p: Player, next_pick: int, pool: List[Player]) -> float:
     pos = (p.position or "").upper()
     adp = float(p.adp or 999.0)
@@ -45,7 +62,15 @@ def availability_prob_no_adp(
     """
     Estimate survive probability using only live room signals.
     """
-    pos = (p.position or "").upper()
+    return survival_no_adp((p.position or "").upper(), recent_pos_pick_rates, opponents_need_counts, picks_gap)
+
+def survival_no_adp(
+    pos: str,
+    recent_pos_pick_rates: Dict[str, float],
+    opponents_need_counts: Dict[str, int],
+    picks_gap: int
+) -> float:
+    """availability_prob_no_adp for an upper-cased position (the same for every player there)."""
     # weight recent pick rate by opponents' needs share
     total_need = sum(opponents_need_counts.values()) or 1
     need_share = opponents_need_counts.get(pos, 0) / total_need
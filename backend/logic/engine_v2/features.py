@@ -0,0 +1,140 @@
+from typing import Dict, Optional, Sequence
+import numpy as np
+from models import Player
+from store.table import PlayerTable, POSITIONS, NA
+
+
+def pool_columns(players: Sequence[Player]) -> Dict[str, np.ndarray]:
+    """
+    The Player fields suggest_v2 reads, as one array per field over `players`:
+    player_id, position (upper-cased, "" if none), team / injury_status (object, None if
+    missing), adp / projected_points (NaN if missing), age, years_exp, bye_week,
+    depth_order, committee_size (NA if missing), and the FEATURE_COLUMNS.
+    Table views of one PlayerTable are gathered from its columns (features included, see
+    static_features), anything else is read attribute by attribute and its features
+    computed here (same split as reproject.player_columns).
+    """
+    t = getattr(players[0], "table", None) if players else None
+    if t is not None:
+        rows = [p.row for p in players if getattr(p, "table", None) is t]
+        if len(rows) == len(players):
+            return table_columns(t, np.array(rows, dtype=np.int64))
+
+    def ints(name: str) -> np.ndarray:
+        return np.array([NA if getattr(p, name) is None else getattr(p, name) for p in players], dtype=np.int64)
+
+    def floats(name: str) -> np.ndarray:
+        return np.array([np.nan if getattr(p, name) is None else float(getattr(p, name)) for p in players], dtype=np.float64)
+
+    out = {
+        "player_id": np.array([p.player_id for p in players], dtype=np.int64),
+        "position": np.array([(p.position or "").upper() for p in players], dtype=object),
+        "team": np.array([p.team for p in players], dtype=object),
+        "injury_status": np.array([p.injury_status for p in players], dtype=object),
+    }
+    for c in ("adp", "projected_points"):
+        out[c] = floats(c)
+    for c in ("age", "years_exp", "bye_week", "depth_order", "committee_size"):
+        out[c] = ints(c)
+    out.update(feature_columns(out))
+    return out
+
+
+def table_columns(t: PlayerTable, rows: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """pool_columns straight from a PlayerTable's columns, for `rows` (default: every row), plus `row`."""
+    if rows is None:
+        rows = np.arange(len(t))
+    out = _catalog_columns(t, rows)
+    out.update({c: v[rows] for c, v in static_features(t).items()})
+    return out
+
+
+def _catalog_columns(t: PlayerTable, rows: np.ndarray) -> Dict[str, np.ndarray]:
+    out = {
+        "row": rows,
+        "player_id": t.ids[rows],
+        "position": np.array(POSITIONS + ("",), dtype=object)[t.pos[rows]],
+        "team": np.array(t.team_names + [None], dtype=object)[t.team[rows]],
+        "injury_status": np.array(t.injury_names, dtype=object)[t.injury[rows]],
+    }
+    for c in ("adp", "projected_points"):
+        out[c] = t.floats[c][rows]
+    for c in ("age", "years_exp", "bye_week", "depth_order", "committee_size"):
+        out[c] = t.ints[c][rows].astype(np.int64)
+    return out
+
+
+def static_features(t: PlayerTable) -> Dict[str, np.ndarray]:
+    """
+    The table's FEATURE_COLUMNS (row-indexed). Computed for every row the first time
+    (catalog build does it up front), then only for rows patched since (refresh of
+    injuries/depth); values are stored on the table and shared by every draft on it.
+    """
+    if not t.features:
+        t.features = feature_columns(_catalog_columns(t, np.arange(len(t))))
+        t.stale_features.clear()
+    elif t.stale_features:
+        rows = np.array(sorted(t.stale_features), dtype=np.int64)
+        t.stale_features.clear()
+        for c, v in feature_columns(_catalog_columns(t, rows)).items():
+            t.features[c][rows] = v
+    return t.features
+
+
+def feature_columns(c: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Every per-player feature that depends on catalog fields only, over pool_columns."""
+    status = _status(c)
+    return {
+        "role_certainty_mult": role_certainty_mult(c),
+        "injury_risk": injury_risk(c, status),
+        "age_penalty": age_penalty(c),
+        "rookie_volatility": rookie_volatility(c),
+        "role_uncertainty": role_uncertainty(c, status),
+    }
+
+
+# ---- Per-player risk features (arrays over pool_columns) ----
+def _status(c: Dict[str, np.ndarray]) -> np.ndarray:
+    return np.array([(s or "").upper() for s in c["injury_status"]], dtype=object)
+
+
+
+def role_certainty_mult(c: Dict[str, np.ndarray]) -> np.ndarray:
+    """x0.95 for a 3+ back committee, x0.95 again for depth 3+."""
+    return np.where(c["committee_size"] >= 3, 0.95, 1.0) * np.where(c["depth_order"] >= 3, 0.95, 1.0)
+
+
+def injury_risk(c: Dict[str, np.ndarray], status: Optional[np.ndarray] = None) -> np.ndarray:
+    """1.0 out (OUT/IR/PUP/SUSPENDED), 0.6 questionable/doubtful, else 0."""
+    status = _status(c) if status is None else status
+    out = np.isin(status, ("OUT", "IR", "PUP", "SUSPENDED"))
+    shaky = np.isin(status, ("QUESTIONABLE", "DOUBTFUL"))
+    return np.where(out, 1.0, np.where(shaky, 0.6, 0.0))
+
+
+# position -> (age the penalty starts at, years to a full point)
+_AGE_CURVE = {"RB": (26, 10.0), "WR": (28, 12.0), "TE": (28, 12.0), "QB": (32, 14.0)}
+
+
+def age_penalty(c: Dict[str, np.ndarray]) -> np.ndarray:
+    age, pos = c["age"], c["position"]
+    out = np.zeros(len(age), dtype=np.float64)
+    for p, (start, span) in _AGE_CURVE.items():
+        m = (pos == p) & (age != NA)
+        out[m] = np.maximum(0.0, (age[m] - start) / span)
+    return out
+
+
+def rookie_volatility(c: Dict[str, np.ndarray]) -> np.ndarray:
+    return np.where(c["years_exp"] == 0, 1.0, 0.0)
+
+
+def role_uncertainty(c: Dict[str, np.ndarray], status: Optional[np.ndarray] = None) -> np.ndarray:
+    """tiers._role_uncertainty over columns: committee 3+, depth 3+, rookie, injured/questionable."""
+    status = _status(c) if status is None else status
+    u = np.zeros(len(status), dtype=np.float64)
+    u += np.where(c["committee_size"] >= 3, 0.5, 0.0)
+    u += np.where(c["depth_order"] >= 3, 0.5, 0.0)
+    u += np.where(c["years_exp"] == 0, 0.2, 0.0)
+    u += np.where(np.isin(status, ("OUT", "IR", "PUP", "SUSPENDED", "QUESTIONABLE")), 0.5, 0.0)
+    return np.minimum(1.0, u)
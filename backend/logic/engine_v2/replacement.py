@@ -1,4 +1,6 @@
-from typing import Dict, List, Tuple
+import heapq
+from itertools import chain, islice, repeat
+from typing import Dict, List, Sequence
 from models import Player, ScoringRules
 
 def _group(players: List[Player], proj: List[float]) -> Dict[str, List[float]]:
@@ -20,30 +22,29 @@ def _base_requirements(rules: ScoringRules) -> Dict[str, int]:
         "K":  rules.roster_k,
     }
 
-def replacement_levels(players: List[Player], proj: List[float], rules: ScoringRules, teams: int) -> Dict[str, float]:
-    pos_map = _group(players, proj)
+def replacement_from_sorted(pos_map: Dict[str, Sequence[float]], rules: ScoringRules, teams: int) -> Dict[str, float]:
+    """
+    replacement_levels over points already grouped by position and sorted best first.
+    Flex slots go, one at a time, to the best player left after the starters at RB/WR/TE
+    (ties to the earlier of RB, WR, TE; 0 once a position runs dry): a k-way merge of the
+    three tails, so it costs O(flex slots) however deep the pool is.
+    """
     req = _base_requirements(rules)
     needed: Dict[str, int] = {k: max(0, int(req.get(k, 0) * teams)) for k in ("QB","RB","WR","TE","DST","K")}
 
     # flex alloc across RB/WR/TE
     flex_slots = max(0, rules.roster_flex) * teams
-    ptr = {"RB": needed.get("RB",0), "WR": needed.get("WR",0), "TE": needed.get("TE",0)}
-    for _ in range(flex_slots):
-        cand: List[Tuple[str, float]] = []
-        for pos in ("RB","WR","TE"):
-            arr = pos_map.get(pos, [])
-            idx = ptr[pos]
-            val = arr[idx] if idx < len(arr) else 0.0
-            cand.append((pos, val))
-        cand.sort(key=lambda x: x[1], reverse=True)
-        pick_pos, _ = cand[0]
-        needed[pick_pos] = needed.get(pick_pos, 0) + 1
-        ptr[pick_pos] += 1
+    tails = [
+        zip(repeat(pos), chain(islice(pos_map.get(pos, []), needed[pos], None), repeat(0.0)))
+        for pos in ("RB","WR","TE")
+    ]
+    for pick_pos, _ in islice(heapq.merge(*tails, key=lambda x: -x[1]), flex_slots):
+        needed[pick_pos] += 1
 
     repl: Dict[str, float] = {}
     for pos, arr in pos_map.items():
         n = needed.get(pos, 0)
-        if not arr:
+        if not len(arr):
             repl[pos] = 0.0
             continue
         idx = min(max(0, n - 1), len(arr) - 1)
@@ -51,5 +52,8 @@ def replacement_levels(players: List[Player], proj: List[float], rules: ScoringR
         repl[pos] = sum(window) / len(window)
     return repl
 
+def replacement_levels(players: List[Player], proj: List[float], rules: ScoringRules, teams: int) -> Dict[str, float]:
+    return replacement_from_sorted(_group(players, proj), rules, teams)
+
 # export starter requirements for utility
 _base_requirements_export = _base_requirements
@@ -1,36 +1,55 @@
-from typing import List
+from typing import List, Sequence, Tuple
+import numpy as np
 from models import Player, ScoringRules
+from store.table import STAT_COLUMNS, POS_CODE, NA
+from logic.engine_v2.scoring import compile_rules, score_stats
 
-def _v(v):
-    return float(v or 0.0)
 
-def reproject_points(players: List[Player], rules: ScoringRules) -> List[float]:
-    out: List[float] = []
-    for p in players:
-        pos = (p.position or "").upper()
-        pts = 0.0
-        pts += _v(p.passing_yards)   * rules.pass_yd
-        pts += _v(p.passing_tds)     * rules.pass_td
-        pts += _v(p.interceptions)   * rules.pass_int
-        pts += _v(p.rushing_yards)   * rules.rush_yd
-        pts += _v(p.rushing_tds)     * rules.rush_td
-        pts += _v(p.receiving_yards) * rules.rec_yd
-        pts += _v(p.receiving_tds)   * rules.rec_td
-        pts += _v(p.receptions)      * rules.ppr
-        if pos == "TE" and rules.te_premium:
-            pts += _v(p.receptions) * rules.te_premium
-        pts += -2.0 * _v(p.fumbles_lost)
-        pts +=  2.0 * _v(p.two_pt_conversions)
+def player_columns(players: Sequence[Player]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (stats matrix with missing = 0, position codes, committee size, depth order, feed projection)
+    for `players`. Table views of one PlayerTable are sliced straight out of its columns;
+    anything else (Player models, mixed tables) is read attribute by attribute.
+    """
+    t = getattr(players[0], "table", None) if players else None
+    if t is not None and all(getattr(p, "table", None) is t for p in players):
+        rows = np.fromiter((p.row for p in players), dtype=np.int64, count=len(players))
+        stats = np.nan_to_num(t.stats[rows], nan=0.0)
+        pos = t.pos[rows]
+        committee = t.ints["committee_size"][rows]
+        depth = t.ints["depth_order"][rows]
+        proj = t.floats["projected_points"][rows]
+        return stats, pos, committee, depth, proj
+    n = len(players)
+    stats = np.array([[float(getattr(p, c) or 0.0) for c in STAT_COLUMNS] for p in players], dtype=np.float64).reshape(n, len(STAT_COLUMNS))
+    pos = np.array([POS_CODE.get((p.position or "").upper(), NA) for p in players], dtype=np.int64)
+    committee = np.array([p.committee_size if p.committee_size is not None else NA for p in players], dtype=np.int64)
+    depth = np.array([p.depth_order if p.depth_order is not None else NA for p in players], dtype=np.int64)
+    proj = np.array([np.nan if p.projected_points is None else float(p.projected_points) for p in players], dtype=np.float64)
+    return stats, pos, committee, depth, proj
+
 
-        if pos in ("K","DST") and (pts == 0.0) and (p.projected_points is not None):
-            pts = float(p.projected_points)
-        if pts == 0.0 and p.projected_points is not None:
-            pts = float(p.projected_points)
+def reproject_matrix(players: Sequence[Player], rulesets: Sequence[ScoringRules]) -> np.ndarray:
+    """
+    League-scored projections for every player under every ruleset: a (players x rulesets)
+    matrix. Each ruleset is compiled once (scoring.compile_rules: stat weights, position
+    weights such as the TE premium, bonuses, position multipliers) and evaluated over the
+    stats matrix in one product; per-player rules are masks over the result:
+    - no stat line (0 points) -> the feed's projected_points
+    - position multipliers
+    - light role/committee dampening (committee >= 3: x0.98, depth >= 3: x0.97), floored at 0
+    """
+    if not players or not rulesets:
+        return np.zeros((len(players), len(rulesets)), dtype=np.float64)
+    stats, pos, committee, depth, proj = player_columns(players)
+    pts, mult = score_stats(stats, pos, [compile_rules(r) for r in rulesets])
+    fallback = (pts == 0.0) & ~np.isnan(proj)[:, None]
+    pts = np.where(fallback, np.nan_to_num(proj, nan=0.0)[:, None], pts)
+    pts *= mult
+    damp = np.where(committee >= 3, 0.98, 1.0) * np.where(depth >= 3, 0.97, 1.0)
+    pts *= damp[:, None]
+    return np.maximum(pts, 0.0)
 
-        # light role/committee dampening
-        if p.committee_size and p.committee_size >= 3:
-            pts *= 0.98
-        if p.depth_order and p.depth_order >= 3:
-            pts *= 0.97
-        out.append(max(0.0, pts))
-    return out
+
+def reproject_points(players: List[Player], rules: ScoringRules) -> List[float]:
+    return reproject_matrix(players, [rules])[:, 0].tolist()
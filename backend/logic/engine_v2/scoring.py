@@ -0,0 +1,107 @@
+import json
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from models import ScoringRules, STAT_FIELDS
+from store.table import POSITIONS, POS_CODE
+
+# ScoringRules field giving the base points per unit of each stat
+_RULE_FOR_STAT = {
+    "passing_yards": "pass_yd", "passing_tds": "pass_td", "interceptions": "pass_int",
+    "rushing_yards": "rush_yd", "rushing_tds": "rush_td",
+    "receptions": "ppr", "receiving_yards": "rec_yd", "receiving_tds": "rec_td",
+    "fumbles_lost": "fumble_lost", "two_pt_conversions": "two_pt",
+}
+_STAT = {c: i for i, c in enumerate(STAT_FIELDS)}
+_OTHER = len(POSITIONS)   # position row for players without a fantasy position
+
+
+def _erfc(x: np.ndarray) -> np.ndarray:
+    """Complementary error function, vectorized (Numerical Recipes erfcc, |rel err| < 1.2e-7)."""
+    z = np.abs(x)
+    t = 1.0 / (1.0 + 0.5 * z)
+    r = t * np.exp(-z * z - 1.26551223 + t * (1.00002368 + t * (0.37409196 + t * (0.09678418 + t * (
+        -0.18628806 + t * (0.27886807 + t * (-1.13520398 + t * (1.48851587 + t * (-0.82215223 + t * 0.17087277)))))))))
+    return np.where(x >= 0, r, 2.0 - r)
+
+
+class CompiledScoring:
+    """
+    One ScoringRules (+ its custom ScoringSpec) lowered to arrays over the stat columns:
+
+    - weights:    points per unit of each stat (STAT_FIELDS order)
+    - pos_weights:(positions + 1) x stats extra points by position (TE premium lives here)
+    - multiplier: per-position factor on the total
+    - bonuses:    (stat column, threshold, points, per_game)
+
+    A per-game bonus on season projections is expected value: games x P(game >= threshold),
+    with a game's stat ~ Normal(season / games, game_cv x that mean).
+    """
+
+    def __init__(self, rules: ScoringRules):
+        spec = rules.custom
+        self.weights = np.array([float(getattr(rules, _RULE_FOR_STAT[c])) for c in STAT_FIELDS], dtype=np.float64)
+        self.pos_weights = np.zeros((len(POSITIONS) + 1, len(STAT_FIELDS)), dtype=np.float64)
+        self.pos_weights[POS_CODE["TE"], _STAT["receptions"]] += float(rules.te_premium or 0.0)
+        self.multiplier = np.ones(len(POSITIONS) + 1, dtype=np.float64)
+        self.bonuses: List[Tuple[int, float, float, bool]] = []
+        self.games, self.game_cv = 17, 0.45
+        if spec is not None:
+            for stat, w in spec.stats.items():
+                self.weights[_STAT[stat]] += w
+            for pos, ws in spec.position_stats.items():
+                for stat, w in ws.items():
+                    self.pos_weights[POS_CODE[pos], _STAT[stat]] += w
+            for pos, m in spec.position_multipliers.items():
+                self.multiplier[POS_CODE[pos]] = m
+            self.bonuses = [(_STAT[b.stat], b.threshold, b.points, b.per_game) for b in spec.bonuses]
+            self.games, self.game_cv = spec.games, spec.game_cv
+        self.has_pos_weights = bool(self.pos_weights.any())
+
+    def bonus_points(self, stats: np.ndarray) -> np.ndarray:
+        out = np.zeros(stats.shape[0], dtype=np.float64)
+        for j, threshold, points, per_game in self.bonuses:
+            total = stats[:, j]
+            if not per_game:
+                out += np.where(total >= threshold, points, 0.0)
+                continue
+            mean = total / self.games
+            sd = np.maximum(self.game_cv * mean, 1e-9)
+            p_hit = 0.5 * _erfc((threshold - mean) / (sd * np.sqrt(2.0)))
+            out += np.where(mean > 0, points * self.games * p_hit, 0.0)
+        return out
+
+
+@lru_cache(maxsize=64)
+def _compile(key: str) -> CompiledScoring:
+    return CompiledScoring(ScoringRules(**json.loads(key)))
+
+
+def compile_rules(rules: ScoringRules) -> CompiledScoring:
+    """Validated rules -> CompiledScoring, cached by content (the same ruleset compiles once)."""
+    return _compile(json.dumps(rules.model_dump(), sort_keys=True))
+
+
+def score_stats(stats: np.ndarray, pos_codes: np.ndarray, compiled: Sequence[CompiledScoring]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Raw points (players x rulesets) for a stats matrix with missing = 0 and position codes
+    (POS_CODE, -1 = none), plus the matching per-position multipliers. One matrix product
+    for the base weights; position weights and bonuses only for rulesets that have them.
+    """
+    pos = np.where(pos_codes < 0, _OTHER, pos_codes)
+    pts = stats @ np.stack([c.weights for c in compiled], axis=1)
+    for k, c in enumerate(compiled):
+        if c.has_pos_weights:
+            pts[:, k] += np.einsum("ns,ns->n", stats, c.pos_weights[pos])
+        if c.bonuses:
+            pts[:, k] += c.bonus_points(stats)
+    mult = np.stack([c.multiplier[pos] for c in compiled], axis=1)
+    return pts, mult
+
+
+def statline_points(fields: Dict[str, Optional[float]], position: Optional[str], rules: Optional[ScoringRules] = None) -> float:
+    """Points for one per-stat dict (Player stat field -> value) under `rules` (default: ScoringRules())."""
+    stats = np.array([[float(fields.get(c) or 0.0) for c in STAT_FIELDS]], dtype=np.float64)
+    pos = np.array([POS_CODE.get((position or "").upper(), -1)], dtype=np.int64)
+    pts, mult = score_stats(stats, pos, [compile_rules(rules or ScoringRules())])
+    return float(pts[0, 0] * mult[0, 0])
@@ -0,0 +1,177 @@
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from models import ScoringRules
+from store.table import PlayerTable
+from logic.engine_v2.replacement import replacement_from_sorted
+from logic.engine_v2.tiers import scan_tiers
+from logic.engine_v2.features import table_columns
+
+# a pick this far below the last tier decision can't move it: a decision at i reads the
+# players i..i+3 and whether more than 8 are left after i
+_TIER_LOOKAHEAD = 3
+_TIER_SUPPLY = 9
+
+
+class PositionBoard:
+    """
+    One position's undrafted players, best first (points desc, then board rank): their
+    rows, points, board ranks and role uncertainty. Draft/undraft remove or insert one
+    entry in place; the points list and the tier scan are kept across calls and only
+    redone from the first decision the change can reach.
+    """
+
+    def __init__(self, rows: np.ndarray, pts: np.ndarray, rank: np.ndarray, unc: np.ndarray):
+        order = np.lexsort((rank, -pts))
+        self.rows = rows[order]
+        self.pts = pts[order]
+        self.rank = rank[order]
+        self.unc = unc[order]
+        self._lists: Optional[Tuple[List[float], List[float]]] = None
+        self._scan: Optional[Tuple[Tuple, List[int], bool]] = None   # (factors, heads, complete)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def points(self) -> List[float]:
+        return self._as_lists()[0]
+
+    def _as_lists(self) -> Tuple[List[float], List[float]]:
+        if self._lists is None:
+            self._lists = (self.pts.tolist(), self.unc.tolist())
+        return self._lists
+
+    def _changed_at(self, i: int, before: int) -> None:
+        self._lists = None
+        if self._scan is None:
+            return
+        key, heads, _ = self._scan
+        cut = min(i - _TIER_LOOKAHEAD, min(before, len(self)) - _TIER_SUPPLY)
+        self._scan = (key, [h for h in heads if h <= cut] or [0], False)
+
+    def remove(self, row: int) -> bool:
+        hit = np.flatnonzero(self.rows == row)
+        if not len(hit):
+            return False
+        i, before = int(hit[0]), len(self)
+        self.rows, self.pts, self.rank, self.unc = (np.delete(a, i) for a in (self.rows, self.pts, self.rank, self.unc))
+        self._changed_at(i, before)
+        return True
+
+    def insert(self, row: int, pts: float, rank: int, unc: float) -> None:
+        lo = int(np.searchsorted(-self.pts, -pts, side="left"))
+        hi = int(np.searchsorted(-self.pts, -pts, side="right"))
+        i, before = lo + int(np.searchsorted(self.rank[lo:hi], rank)), len(self)
+        self.rows = np.insert(self.rows, i, row)
+        self.pts = np.insert(self.pts, i, pts)
+        self.rank = np.insert(self.rank, i, rank)
+        self.unc = np.insert(self.unc, i, unc)
+        self._changed_at(i, before)
+
+    def tier_heads(self, pos: str, upto: int, factors: Tuple[float, float], min_size: int) -> Tuple[List[int], bool]:
+        """
+        Tier starts (indices into the board) far enough down to cover the first `upto`
+        players, and whether the whole board is tiered (tiers.scan_tiers). Resumes the
+        last scan when the factors are unchanged.
+        """
+        key = (factors, min_size)
+        if self._scan is None or self._scan[0] != key:
+            self._scan = (key, [0], False)
+        _, heads, complete = self._scan
+        if not complete and heads[-1] < upto:
+            pts, unc = self._as_lists()
+            complete = scan_tiers(pos, pts, unc.__getitem__, heads, upto, factors, min_size)
+            self._scan = (key, heads, complete)
+        return heads, complete
+
+
+class EngineState:
+    """
+    The per-position boards suggest_v2 reads (sorted points, replacement levels, tiers),
+    held across calls for one draft over one (PlayerTable, projections) pair. sync()
+    applies the picks/undos since the last call as removals/insertions on the affected
+    positions only, so a pick costs O(players at that position) instead of a re-sort and
+    re-tier of the pool. `pts` / `rank` / `unc` are per row (points, board rank, role
+    uncertainty), `available` the mask last synced to; `lock` serializes sync + read.
+    """
+
+    # more changed rows than this (reset, bulk import) and the boards are rebuilt
+    REBUILD_AT = 64
+
+    def __init__(self, positions: np.ndarray, pts: np.ndarray, rank: np.ndarray, unc: np.ndarray,
+                 available: Optional[np.ndarray] = None, table: Optional[PlayerTable] = None,
+                 points: Optional[Dict[int, float]] = None):
+        self.table = table
+        self.points = points
+        self.keys = sorted(set(positions.tolist()))
+        self._pos_idx = np.searchsorted(np.array(self.keys, dtype=object), positions) if len(positions) else positions
+        self.pts, self.rank, self.unc = pts, rank, unc
+        self.available = np.ones(len(pts), dtype=bool) if available is None else available.copy()
+        self.version = 0
+        self.lock = threading.RLock()
+        self._build()
+
+    @classmethod
+    def for_table(cls, table: PlayerTable, points: Dict[int, float], available: np.ndarray) -> "EngineState":
+        """Every row of `table` with league points from `points` (pid -> pts, e.g. ProjectionCache)."""
+        cols = table_columns(table)
+        pts = np.fromiter((points[pid] for pid in cols["player_id"].tolist()), dtype=np.float64, count=len(table))
+        rank = np.asarray(table.rank(), dtype=np.int64)
+        return cls(cols["position"], pts, rank, cols["role_uncertainty"], available, table, points)
+
+    @classmethod
+    def for_pool(cls, cols: Dict[str, np.ndarray], pts: np.ndarray) -> "EngineState":
+        """One-off state over a pool (pool_columns); rows are pool indices, ties keep pool order."""
+        return cls(cols["position"], pts, np.arange(len(pts)), cols["role_uncertainty"])
+
+    def _build(self) -> None:
+        rows = np.flatnonzero(self.available)
+        pos_idx = self._pos_idx[rows]
+        self.boards: Dict[str, PositionBoard] = {}
+        for j, k in enumerate(self.keys):
+            r = rows[pos_idx == j]
+            self.boards[k] = PositionBoard(r, self.pts[r], self.rank[r], self.unc[r])
+
+    def matches(self, table: Optional[PlayerTable], points: Optional[Dict[int, float]]) -> bool:
+        return table is not None and table is self.table and points is self.points
+
+    def pool_order(self, rows: np.ndarray, keys: Sequence[str]) -> Optional[Dict[str, np.ndarray]]:
+        """
+        For a pool given as its state rows (in board order), each position's pool indices
+        best first; None unless the boards of `keys` hold exactly those rows.
+        """
+        if len(rows) > 1 and np.any(np.diff(self.rank[rows]) <= 0):
+            return None
+        at = np.full(len(self.pts), -1, dtype=np.int64)
+        at[rows] = np.arange(len(rows))
+        out: Dict[str, np.ndarray] = {}
+        for k in keys:
+            board = self.boards.get(k)
+            if board is None:
+                return None
+            out[k] = at[board.rows]
+            if len(out[k]) and out[k].min() < 0:
+                return None
+        return out if sum(len(v) for v in out.values()) == len(rows) else None
+
+    def sync(self, available: np.ndarray) -> None:
+        """Bring the boards in line with an availability mask (DraftIndex.available)."""
+        changed = np.flatnonzero(available != self.available)
+        if not len(changed):
+            return
+        self.version += 1
+        if len(changed) > self.REBUILD_AT:
+            self.available = available.copy()
+            self._build()
+            return
+        for i in changed.tolist():
+            board = self.boards[self.keys[self._pos_idx[i]]]
+            if available[i]:
+                board.insert(i, float(self.pts[i]), int(self.rank[i]), float(self.unc[i]))
+            else:
+                board.remove(i)
+            self.available[i] = available[i]
+
+    def replacement(self, keys: Sequence[str], rules: ScoringRules, teams: int) -> Dict[str, float]:
+        """replacement_levels over the boards of `keys` only (a pos-filtered pool has one)."""
+        return replacement_from_sorted({k: self.boards[k].points() for k in keys if k in self.boards}, rules, teams)
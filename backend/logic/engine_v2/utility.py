@@ -1,11 +1,16 @@
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence
+import numpy as np
 from models import Player, ScoringRules, SuggestionV2, LeagueContext, StrategyProfile
 from logic.engine_v2.reproject import reproject_points
-from logic.engine_v2.replacement import replacement_levels, _base_requirements_export
-from logic.engine_v2.availability import current_and_next_pick, availability_prob_with_adp, availability_prob_no_adp
+from logic.engine_v2.replacement import _base_requirements_export
+from logic.engine_v2.availability import current_and_next_pick, adaptive_sigmas, survival_with_adp, survival_no_adp
 from logic.engine_v2.runs import compute_run_pressure, recent_pos_pick_rates
-from logic.engine_v2.tiers import compute_tiers_per_player
-from logic.engine_v2.normalize import zscore_to_unit
+from logic.engine_v2.tiers import TIER_MIN_SIZE, _scan_factors
+from logic.engine_v2.state import EngineState
+from logic.engine_v2.features import pool_columns
+
+def _as_player(p) -> Player:
+    return p.to_player() if hasattr(p, "to_player") else p
 
 def _market_delta(pick_no: int, p: Player, round_no: int) -> float:
     if p.adp is None: return 0.0
@@ -13,58 +18,131 @@ def _market_delta(pick_no: int, p: Player, round_no: int) -> float:
     damp = max(0.4, 1.0 - 0.03 * (round_no - 1))
     return max(-20.0, min(20.0, raw * damp))
 
-def _role_certainty_mult(p: Player) -> float:
-    mult = 1.0
-    if p.committee_size and p.committee_size >= 3: mult *= 0.95
-    if p.depth_order and p.depth_order >= 3: mult *= 0.95
-    return mult
-
-def _injury_risk(p: Player) -> float:
-    s = (p.injury_status or "").upper()
-    if s in ("OUT","IR","PUP","SUSPENDED"): return 1.0
-    if s in ("QUESTIONABLE","DOUBTFUL"): return 0.6
-    return 0.0
-
-def _age_penalty(p: Player) -> float:
-    if p.age is None: return 0.0
-    pos = (p.position or "").upper()
-    a = p.age
-    if pos == "RB": return max(0.0, (a - 26) / 10.0)  # small above 26
-    if pos == "WR": return max(0.0, (a - 28) / 12.0)
-    if pos == "TE": return max(0.0, (a - 28) / 12.0)
-    if pos == "QB": return max(0.0, (a - 32) / 14.0)
-    return 0.0
-
-def _rookie_volatility(p: Player) -> float:
-    if p.years_exp is not None and p.years_exp == 0:
-        return 1.0
-    return 0.0
-
-def _stack_bonus(p: Player, my_qb_teams: List[str]) -> float:
-    if p.position in ("WR","TE") and p.team and p.team in my_qb_teams:
-        return 1.0
-    return 0.0
-
-def _team_concentration_penalty(p: Player, my_team_counts: Dict[str,int]) -> float:
-    if not p.team: return 0.0
-    c = my_team_counts.get(p.team, 0)
-    # only care about starters later; keep tiny
-    return 0.2 * max(0, c - 2)
-
-def _bye_penalty(p: Player, my_bye_counts: Dict[int, int], round_no: int, bench_pick: bool) -> float:
-    if not p.bye_week: return 0.0
-    overlap = my_bye_counts.get(p.bye_week, 0)
-    if overlap <= 2: return 0.0
+def _team_concentration_penalty(teams: np.ndarray, my_team_counts: Dict[str,int]) -> np.ndarray:
+    out = np.zeros(len(teams), dtype=np.float64)
+    for team, c in my_team_counts.items():
+        # only care about starters later; keep tiny
+        out[teams == team] = 0.2 * max(0, c - 2)
+    return out
+
+def _bye_penalty(byes: np.ndarray, my_bye_counts: Dict[int, int], round_no: int, bench_pick: bool) -> np.ndarray:
+    out = np.zeros(len(byes), dtype=np.float64)
     base = 0.6 if bench_pick else 1.0
     fade = max(0.3, 1.0 - (round_no - 1) * 0.06)
-    return base * (overlap - 2) * fade
+    for bye, overlap in my_bye_counts.items():
+        if bye and overlap > 2:
+            out[byes == bye] = base * (overlap - 2) * fade
+    return out
+
+def _signed_unit(x: np.ndarray) -> np.ndarray:
+    """min(1, x) mapped 0..1 -> -1..1 where x > 0; 0 where the feature is absent."""
+    return np.where(x > 0, np.minimum(1.0, x) * 2.0 - 1.0, 0.0)
+
+# Score components in feature-matrix column order, and their sign in the score
+COMPONENTS = ("V", "T", "A", "R", "Sx", "N", "F", "St", "By", "Tm", "In", "Ag", "Rl", "Rv", "Hc", "GK")
+_PENALTIES = ("By", "Tm", "In", "Ag", "Rv")
+
+# Round/seat weights: (last round of the band, weights in COMPONENTS order)
+ROUND_WEIGHTS = (
+    (3,    (1.00, 0.35, 0.25, 0.15, 0.25, 0.20, 0.10, 0.06, 0.12, 0.05, 0.20, 0.06, 0.10, 0.10, 0.05, 0.30)),
+    (6,    (0.90, 0.30, 0.30, 0.22, 0.28, 0.22, 0.12, 0.08, 0.10, 0.06, 0.16, 0.06, 0.12, 0.08, 0.06, 0.35)),
+    (10,   (0.75, 0.25, 0.35, 0.28, 0.26, 0.22, 0.15, 0.10, 0.08, 0.06, 0.14, 0.06, 0.14, 0.06, 0.10, 0.45)),
+    (None, (0.60, 0.18, 0.35, 0.30, 0.24, 0.18, 0.18, 0.12, 0.06, 0.06, 0.10, 0.06, 0.16, 0.04, 0.14, 0.60)),
+)
+
+def score_weights(round_no: int, bench_pick: bool) -> np.ndarray:
+    """Signed weight vector over COMPONENTS for this round band (+ bench tweaks)."""
+    W = dict(zip(COMPONENTS, next(w for last, w in ROUND_WEIGHTS if last is None or round_no <= last)))
+    if bench_pick:
+        W["Rv"] *= 0.8   # less penalty for rookies late
+        W["In"] *= 0.9   # slightly less injury-averse
+        W["St"] *= 1.1   # slightly more okay with stacking/upside
+    return np.array([-W[k] if k in _PENALTIES else W[k] for k in COMPONENTS], dtype=np.float64)
+
+# Value range of each component before it is computed (score bounds for pruning)
+_COL = {c: j for j, c in enumerate(COMPONENTS)}
+_Z_RANGE = {"T": (0.0, 0.5), "R": (0.0, 1.0)}
+_Z_LO = np.array([_Z_RANGE.get(c, (-1.0, 1.0))[0] for c in COMPONENTS], dtype=np.float64)
+_Z_HI = np.array([_Z_RANGE.get(c, (-1.0, 1.0))[1] for c in COMPONENTS], dtype=np.float64)
+MAX_SUGGESTIONS = 40   # count is capped here; a smaller count is a prefix of this ranking
+_PRUNE_EPS = 1e-9   # bounds are summed in a different order than the final product
+
+def _score_bounds(lo: np.ndarray, hi: np.ndarray, w: np.ndarray):
+    """(worst, best) score per row when each component lies anywhere in lo..hi."""
+    a, b = lo * w, hi * w
+    return np.minimum(a, b).sum(axis=1), np.maximum(a, b).sum(axis=1)
+
+def _kth_largest(x: np.ndarray, k: int) -> float:
+    """Pruning threshold: the k-th largest worst-case score (-inf while there are <= k rows)."""
+    if len(x) <= k:
+        return -np.inf
+    return float(np.partition(x, len(x) - k)[len(x) - k])
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k best scores, best first, ties in input order (argpartition, then sort only those)."""
+    if len(scores) > k:
+        cut = scores[np.argpartition(-scores, k - 1)[:k]].min()
+        cand = np.flatnonzero(scores >= cut)
+    else:
+        cand = np.arange(len(scores))
+    return cand[np.argsort(-scores[cand], kind="stable")][:k]
 
 def _bench_pick(rules: ScoringRules, my_counts: Dict[str,int]) -> bool:
     req = (rules.roster_qb + rules.roster_rb + rules.roster_wr + rules.roster_te + rules.roster_dst + rules.roster_k + rules.roster_flex)
     have = sum(my_counts.get(p,0) for p in ("QB","RB","WR","TE","DST","K"))
     return have >= req
 
-def suggest_v2(
+def _suggestion(p, score: float, z: List[float], proj: float, tier_gap: float, k: str, runp: float) -> SuggestionV2:
+    comps = {
+        "Proj": round(proj,1),
+        "VORPz": round(z[0],3),
+        "TierGap": round(tier_gap,2),
+        "AvailZ": round(z[2],3),
+        "RunPress": round(z[3],3),
+        "ScarcityZ": round(z[4],3),
+        "NeedZ": round(z[5],3),
+        "MustFillZ": round(z[6],3),
+        "Stack": round(z[7],3),
+        "ByeZ": round(z[8],3),
+        "TeamConcZ": round(z[9],3),
+        "InjuryZ": round(z[10],3),
+        "AgeZ": round(z[11],3),
+        "RoleZ": round(z[12],3),
+        "RookieZ": round(z[13],3),
+        "HandcuffZ": round(z[14],3),
+    }
+
+    reasons = [f"VORP strong" if z[0]>0 else "VORP modest"]
+    if z[1]>0.2: reasons.append("Tier cliff if you wait")
+    if z[2]>0.2: reasons.append("Low survival to next pick")
+    if runp>0.2: reasons.append(f"{k} run detected")
+    if z[6]>0.2: reasons.append("Must-fill starter")
+    if z[7]>0: reasons.append("Stack bonus")
+    if z[8]>0: reasons.append("Bye overlap")
+    if z[10]>0.2: reasons.append("Injury risk")
+    if z[14]>0.2: reasons.append("Handcuff value")
+
+    return SuggestionV2(player=_as_player(p), score=score, components=comps, reasons=reasons)
+
+class Ranking(Sequence[SuggestionV2]):
+    """Suggestions best first; each SuggestionV2 (and its Player) is built the first time it is read."""
+
+    def __init__(self, items: List[tuple]):
+        self._items = items   # _suggestion arguments per row
+        self._built: List[Optional[SuggestionV2]] = [None] * len(items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        s = self._built[i]
+        if s is None:
+            s = self._built[i] = _suggestion(*self._items[i])
+        return s
+
+def _rank(
     players: List[Player],
     drafted: Dict[int, str],
     rules: ScoringRules,
@@ -75,22 +153,71 @@ def suggest_v2(
     pos: Optional[str] = None,
     history: Optional[List[Dict]] = None,
     opponents_needs: Optional[Dict[str, Dict[str,int]]] = None,  # teamName -> pos -> remaining starters needed
-) -> List[SuggestionV2]:
-
-    pool = [p for p in players if p.player_id not in drafted]
-    if pos:
-        posu = pos.upper()
-        pool = [p for p in pool if (p.position or "").upper() == posu]
-
-    # projections in league scoring
-    proj = reproject_points(pool, rules)
+    projections: Optional[Dict[int, float]] = None,  # player_id -> league points, precomputed for these rules
+    engine: Optional[EngineState] = None,  # the draft's per-position boards over `projections`, synced by the caller
+    by_position: bool = False,
+) -> Dict[Optional[str], "Ranking"]:
+    """
+    suggest_v2's ranking. With by_position every position is ranked on its own, exactly as
+    suggest_v2(pos=that position) would (replacement, VORP normalization and the top
+    `count` per position), all in one pass over the pool; `pos` is ignored then. Keyed by
+    position, or by None for the single ranking.
+    """
+
+    cols = pool_columns(players)
+    # the draft's boards stand in for the per-player lookups below when they are over these
+    # table rows and projections (the caller keeps them synced to `drafted`)
+    if engine is not None and not ("row" in cols and engine.matches(getattr(players[0], "table", None), projections)):
+        engine = None
+    if engine is not None:
+        keep = engine.available[cols["row"]]
+    else:
+        keep = np.fromiter((pid not in drafted for pid in cols["player_id"].tolist()), dtype=bool, count=len(players))
+    if pos and not by_position:
+        keep &= cols["position"] == pos.upper()
+    idx = np.flatnonzero(keep)
+    if not len(idx):
+        return {}
+    pool = [players[i] for i in idx.tolist()]
+    cols = {k: v[idx] for k, v in cols.items()}
+    n = len(pool)
+
+    # projections in league scoring (cached per catalog/rules when the caller has them)
+    if engine is not None:
+        pts = engine.pts[cols["row"]]
+    elif projections is None:
+        pts = np.asarray(reproject_points(pool, rules), dtype=np.float64)
+    else:
+        pids = cols["player_id"].tolist()
+        missing = [i for i, pid in enumerate(pids) if pid not in projections]
+        extra = dict(zip(missing, reproject_points([pool[i] for i in missing], rules))) if missing else {}
+        pts = np.asarray([projections[pid] if pid in projections else extra[i] for i, pid in enumerate(pids)], dtype=np.float64)
+    posp = cols["position"]
+    keys = sorted(set(posp.tolist()))
+    # per-position constants are computed once per key and broadcast through pos_idx
+    pos_idx = np.searchsorted(np.array(keys, dtype=object), posp)
+
+    def per_pos(values) -> np.ndarray:
+        return np.asarray([values[k] for k in keys], dtype=np.float64)[pos_idx]
+
+    # rankings: one per position (by_position) or one over the pool
+    groups: List[Optional[str]] = list(keys) if by_position else [None]
+    grp = pos_idx if by_position else np.zeros(n, dtype=np.int64)
+
+    # per-position boards (best first): the caller's when they hold exactly this pool, else
+    # built for this call
+    by_pos = engine.pool_order(cols["row"], keys) if engine is not None else None
+    state = engine if by_pos is not None else EngineState.for_pool(cols, pts)
+    if by_pos is None:
+        by_pos = state.pool_order(np.arange(n), keys)
 
     # replacement and VORP
-    repl = replacement_levels(pool, proj, rules, ctx.teams)
-    vorp_list = []
-    for p, pts in zip(pool, proj):
-        rpos = (p.position or "").upper()
-        vorp_list.append(pts - float(repl.get(rpos, 0.0)))
+    if by_position:
+        repl = {k: state.replacement([k], rules, ctx.teams)[k] for k in keys}
+    else:
+        repl = state.replacement(keys, rules, ctx.teams)
+    repl_val = per_pos({k: float(repl.get(k, 0.0)) for k in keys})
+    vorp = pts - repl_val
 
     # picks + gap
     pick_no, next_pick = current_and_next_pick(ctx)
@@ -100,20 +227,16 @@ def suggest_v2(
     run_press = compute_run_pressure(history or [], window=10, picks_gap=picks_gap)
     pos_rates = recent_pos_pick_rates(history or [], window=10)
 
-    # per-player tiering with adaptive tolerance
-    pid_to_tier, pos_to_order, pos_to_pts, tier_heads = compute_tiers_per_player(
-        pool, proj, ctx.round, picks_gap, run_press, strategy=strategy.archetype
-    )
-
     # my roster state
     my_ids = {pid for pid, team in drafted.items() if team == "ME"}
-    my_players = [p for p in players if p.player_id in my_ids]
-    my_qb_teams = [p.team for p in my_players if (p.position or "").upper() == "QB" and p.team]
+    my_players = [p for p in players if p.player_id in my_ids] if my_ids else []
+    my_qb_teams = {p.team for p in my_players if (p.position or "").upper() == "QB" and p.team}
+    my_rb_teams = {p.team for p in my_players if (p.position or "").upper() == "RB" and p.team}
     my_counts: Dict[str,int] = {}
     my_team_counts: Dict[str,int] = {}
     for p in my_players:
-        posp = (p.position or "").upper()
-        my_counts[posp] = my_counts.get(posp,0) + 1
+        mpos = (p.position or "").upper()
+        my_counts[mpos] = my_counts.get(mpos,0) + 1
         if p.team:
             my_team_counts[p.team] = my_team_counts.get(p.team,0) + 1
 
@@ -127,179 +250,201 @@ def suggest_v2(
             for k in opp_need_count:
                 opp_need_count[k] += max(0, needs.get(k,0))
 
-    results: List[SuggestionV2] = []
-
-    # precompute means/std for normalization
-    import math
-    def mean_std(vals: List[float]):
-        if not vals: return (0.0, 1.0)
-        m = sum(vals)/len(vals)
-        s = (sum((v-m)*(v-m) for v in vals)/len(vals))**0.5 or 1.0
-        return m, s
-
-    mu_vorp, sd_vorp = mean_std(vorp_list)
-
-    # compute per-candidate features and score
-    for idx, (p, pts) in enumerate(zip(pool, proj)):
-        posp = (p.position or "").upper()
-        vorp = vorp_list[idx]
-
-        # TierGap: estimate drop to best expected at next pick for same pos
-        order = pos_to_order.get(posp, [])
-        pts_arr = pos_to_pts.get(posp, [])
-        try:
-            rank = order.index(p.player_id)
-        except ValueError:
-            rank = 0
-        # expected next: subtract expected taken at this position = picks_gap * pos_rates[pos]
-        taken = int(round(picks_gap * pos_rates.get(posp, 0.0)))
-        idx_next = min(rank + max(0, taken), len(pts_arr) - 1) if pts_arr else 0
-        next_best = pts_arr[idx_next] if pts_arr else 0.0
-        tier_gap = max(0.0, pts - next_best)
-
-        # Availability: ADP if present else live rates + opponents' needs
-        if p.adp is not None:
-            survive = availability_prob_with_adp(p, next_pick, pool)
-        else:
-            survive = availability_prob_no_adp(p, next_pick, pos_rates, opp_need_count, picks_gap)
-        can_i_wait = 1.0 - survive  # higher = more urgent
-
-        # Scarcity index: combine tier remaining & position remaining
-        # remaining in player's tier:
-        tier_id = pid_to_tier.get(p.player_id, 1)
-        tier_head_idx, _ = tier_heads.get((posp, tier_id), (0, pts))
-        # naive: remaining in tier ~ players after current rank up to before next tier head
-        # (approximate by density around rank)
-        tier_size_est = max(1, sum(1 for pid in order if pid_to_tier.get(pid,1) == tier_id))
-        rank_in_tier = sum(1 for i2 in range(0, rank+1) if pid_to_tier.get(order[i2],1) == tier_id)
-        tier_remaining_ratio = max(0.0, (tier_size_est - rank_in_tier) / max(1, tier_size_est))
-        # position remaining above replacement: compare rank to replacement index
-        # find replacement projection for pos
-        repl_val = float(repl.get(posp, 0.0))
-        above_rep_total = sum(1 for v in pts_arr if v >= repl_val)
-        pos_remaining_ratio = max(0.0, (above_rep_total - (rank+1)) / max(1, above_rep_total))
-        # scarcity: 70% tier, 30% pos
-        scarcity = 0.7*(1.0 - tier_remaining_ratio) + 0.3*(1.0 - pos_remaining_ratio)
-
-        # Needs & must-fill
-        base_req = _base_requirements_export(rules)
-        need_raw = max(0, base_req.get(posp, 0) - my_counts.get(posp, 0))
-        total_need = sum(max(0, base_req.get(k,0) - my_counts.get(k,0)) for k in base_req) or 1
-        need_frac = need_raw / total_need
-        must_fill = 0.0
-        # soft thresholds: if past 1/3 of draft and still missing starters, escalate
-        starters_total = sum(base_req.values()) + rules.roster_flex
-        my_starters_have = (my_counts.get("QB",0)+my_counts.get("RB",0)+my_counts.get("WR",0)
-                            +my_counts.get("TE",0)+my_counts.get("DST",0)+my_counts.get("K",0))
-        draft_progress = (ctx.round-1)/max(1, ctx.total_rounds-1)
-        if draft_progress > 0.33 and need_raw > 0:
-            must_fill = (draft_progress - 0.33) * 1.5 * need_frac  # grows into late draft
-
-        # Risk & stability
-        role_mult = _role_certainty_mult(p)
-        injury_risk = _injury_risk(p)
-        age_pen = _age_penalty(p)
-        rookie_vol = _rookie_volatility(p)
-        role_stability = 1.0 - ((1.0 - role_mult) * 0.8)  # convert to bonus in [~0.9..1.0]
-
-        # Handcuff: if RB depth_order==2 and same team as my RB starter(s)
-        handcuff = 0.0
-        if posp == "RB" and p.depth_order and p.depth_order == 2 and p.team:
-            have_rb = any((mp.position or "").upper()=="RB" and mp.team==p.team for mp in my_players)
-            if have_rb:
-                handcuff = 1.0 * (0.5 + 0.5*injury_risk)
-
-        # Stack & bye & team concentration
-        stack = _stack_bonus(p, [t for t in my_qb_teams if t])
-        bye_pen = _bye_penalty(p, my_bye_counts, ctx.round, bench_pick)
-        team_conc = _team_concentration_penalty(p, my_team_counts)
-
-        # K/DST gate
-        kdst_gate = 1.0 if (ctx.round >= ctx.kdst_gate_round or posp not in ("K","DST")) else 0.0
-
-        # Strategy nudges
-        if strategy.archetype == "EliteTE" and posp == "TE" and ctx.round <= 4:
-            vorp *= 1.08
-        if strategy.archetype == "LateQB" and posp == "QB" and ctx.round <= 8:
-            vorp *= 0.92
-        if strategy.archetype == "ZeroRB" and posp == "RB" and ctx.round <= 3:
-            vorp *= 0.9
-
-        # Normalize to [-1..1]
-        Z_VORP       = zscore_to_unit(vorp, mu_vorp, sd_vorp)
-        Z_TierGap    = zscore_to_unit(tier_gap, 0.0, max(1.0, abs(tier_gap))) if tier_gap>0 else 0.0
-        Z_Avail      = (can_i_wait*2.0 - 1.0)  # 0..1 -> -1..1
-        Z_Run        = min(1.0, run_press.get(posp, 0.0))  # already >=0
-        Z_Scarcity   = (max(0.0, min(1.0, scarcity))*2.0 - 1.0)
-        Z_Need       = (need_frac*2.0 - 1.0)
-        Z_MustFill   = (max(0.0, min(1.0, must_fill))*2.0 - 1.0)
-        Z_Stack      = (stack*2.0 - 1.0) if stack>0 else 0.0
-        Z_Bye        = (min(1.0, bye_pen)*2.0 - 1.0) if bye_pen>0 else 0.0
-        Z_TeamConc   = (min(1.0, team_conc)*2.0 - 1.0) if team_conc>0 else 0.0
-        Z_Injury     = (min(1.0, injury_risk)*2.0 - 1.0) if injury_risk>0 else 0.0
-        Z_Age        = (min(1.0, age_pen)*2.0 - 1.0) if age_pen>0 else 0.0
-        Z_Role       = ((role_stability-0.9)/0.1) - 1.0  # roughly map ~[0.9..1.0] to [-1..1]
-        Z_RookieVol  = (min(1.0, rookie_vol)*2.0 - 1.0) if rookie_vol>0 else 0.0
-        Z_Handcuff   = (min(1.0, handcuff)*2.0 - 1.0) if handcuff>0 else 0.0
-        Z_Gate       = (kdst_gate*2.0 - 1.0)
-
-        # Round/seat weights
-        if ctx.round <= 3:
-            W = {"V":1.00,"T":0.35,"A":0.25,"R":0.15,"Sx":0.25,"N":0.20,"F":0.10,"St":0.06,
-                 "By":0.12,"Tm":0.05,"In":0.20,"Ag":0.06,"Rl":0.10,"Rv":0.10,"Hc":0.05,"GK":0.30}
-        elif ctx.round <= 6:
-            W = {"V":0.90,"T":0.30,"A":0.30,"R":0.22,"Sx":0.28,"N":0.22,"F":0.12,"St":0.08,
-                 "By":0.10,"Tm":0.06,"In":0.16,"Ag":0.06,"Rl":0.12,"Rv":0.08,"Hc":0.06,"GK":0.35}
-        elif ctx.round <= 10:
-            W = {"V":0.75,"T":0.25,"A":0.35,"R":0.28,"Sx":0.26,"N":0.22,"F":0.15,"St":0.10,
-                 "By":0.08,"Tm":0.06,"In":0.14,"Ag":0.06,"Rl":0.14,"Rv":0.06,"Hc":0.10,"GK":0.45}
-        else:
-            W = {"V":0.60,"T":0.18,"A":0.35,"R":0.30,"Sx":0.24,"N":0.18,"F":0.18,"St":0.12,
-                 "By":0.06,"Tm":0.06,"In":0.10,"Ag":0.06,"Rl":0.16,"Rv":0.04,"Hc":0.14,"GK":0.60}
-
-        # Bench tweaks
-        if _bench_pick(rules, my_counts):
-            W["Rv"] *= 0.8   # less penalty for rookies late
-            W["In"] *= 0.9   # slightly less injury-averse
-            W["St"] *= 1.1   # slightly more okay with stacking/upside
-
-        score = (
-            W["V"]*Z_VORP + W["T"]*Z_TierGap + W["A"]*Z_Avail + W["R"]*Z_Run + W["Sx"]*Z_Scarcity
-            + W["N"]*Z_Need + W["F"]*Z_MustFill + W["St"]*Z_Stack
-            - W["By"]*Z_Bye - W["Tm"]*Z_TeamConc - W["In"]*Z_Injury - W["Ag"]*Z_Age
-            + W["Rl"]*Z_Role - W["Rv"]*Z_RookieVol + W["Hc"]*Z_Handcuff + W["GK"]*Z_Gate
-        )
-
-        comps = {
-            "Proj": round(pts,1),
-            "VORPz": round(Z_VORP,3),
-            "TierGap": round(tier_gap,2),
-            "AvailZ": round(Z_Avail,3),
-            "RunPress": round(min(1.0, run_press.get(posp,0.0)),3),
-            "ScarcityZ": round(Z_Scarcity,3),
-            "NeedZ": round(Z_Need,3),
-            "MustFillZ": round(Z_MustFill,3),
-            "Stack": round(Z_Stack,3),
-            "ByeZ": round(Z_Bye,3),
-            "TeamConcZ": round(Z_TeamConc,3),
-            "InjuryZ": round(Z_Injury,3),
-            "AgeZ": round(Z_Age,3),
-            "RoleZ": round(Z_Role,3),
-            "RookieZ": round(Z_RookieVol,3),
-            "HandcuffZ": round(Z_Handcuff,3),
-        }
-
-        reasons = [f"VORP strong" if Z_VORP>0 else "VORP modest"]
-        if Z_TierGap>0.2: reasons.append("Tier cliff if you wait")
-        if Z_Avail>0.2: reasons.append("Low survival to next pick")
-        if run_press.get(posp,0.0)>0.2: reasons.append(f"{posp} run detected")
-        if Z_MustFill>0.2: reasons.append("Must-fill starter")
-        if Z_Stack>0: reasons.append("Stack bonus")
-        if Z_Bye>0: reasons.append("Bye overlap")
-        if Z_Injury>0.2: reasons.append("Injury risk")
-        if Z_Handcuff>0.2: reasons.append("Handcuff value")
-
-        results.append(SuggestionV2(player=p, score=float(score), components=comps, reasons=reasons))
-
-    results.sort(key=lambda s: s.score, reverse=True)
-    return results[:max(1, min(count, 40))]
+    # normalization over each ranking's pool (before strategy nudges)
+    mu_vorp = np.zeros(len(groups), dtype=np.float64)
+    sd_vorp = np.ones(len(groups), dtype=np.float64)
+    for g in range(len(groups)):
+        v = vorp[grp == g]
+        mu_vorp[g] = float(v.mean())
+        sd_vorp[g] = float(v.std()) or 1.0
+
+    # Needs & must-fill
+    base_req = _base_requirements_export(rules)
+    total_need = sum(max(0, base_req.get(k,0) - my_counts.get(k,0)) for k in base_req) or 1
+    need_raw = {k: max(0, base_req.get(k, 0) - my_counts.get(k, 0)) for k in keys}
+    need_frac = {k: need_raw[k] / total_need for k in keys}
+    draft_progress = (ctx.round-1)/max(1, ctx.total_rounds-1)
+    # soft thresholds: if past 1/3 of draft and still missing starters, escalate (grows into late draft)
+    must_fill = {k: (draft_progress - 0.33) * 1.5 * need_frac[k] if draft_progress > 0.33 and need_raw[k] > 0 else 0.0
+                 for k in keys}
+
+    # K/DST gate
+    kdst_gate = {k: 1.0 if (ctx.round >= ctx.kdst_gate_round or k not in ("K","DST")) else 0.0 for k in keys}
+
+    # Strategy nudges
+    nudge = {k: 1.0 for k in keys}
+    if strategy.archetype == "EliteTE" and ctx.round <= 4:
+        nudge["TE"] = 1.08
+    if strategy.archetype == "LateQB" and ctx.round <= 8:
+        nudge["QB"] = 0.92
+    if strategy.archetype == "ZeroRB" and ctx.round <= 3:
+        nudge["RB"] = 0.9
+    vorp = vorp * per_pos({k: nudge.get(k, 1.0) for k in keys})
+
+    # Handcuff: RB2 on the same team as one of my RBs
+    teams = cols["team"]
+    handcuff = np.zeros(n, dtype=np.float64)
+    for team in my_rb_teams:
+        m = (posp == "RB") & (cols["depth_order"] == 2) & (teams == team)
+        handcuff[m] = 1.0 * (0.5 + 0.5*cols["injury_risk"][m])
+
+    # Stack & bye & team concentration
+    stack = np.zeros(n, dtype=np.float64)
+    for team in my_qb_teams:
+        stack[((posp == "WR") | (posp == "TE")) & (teams == team)] = 1.0
+    bye_pen = _bye_penalty(cols["bye_week"], my_bye_counts, ctx.round, bench_pick)
+    team_conc = _team_concentration_penalty(teams, my_team_counts)
+
+    # Normalized components in [-1..1], one column per COMPONENTS entry, held as a range
+    # lo..hi: cheap columns are exact from the start, the others begin as their full
+    # range and are filled in only for candidates that can still make the top `count`
+    w = score_weights(ctx.round, bench_pick)
+    top_k = max(1, min(count, MAX_SUGGESTIONS))
+    lo = np.tile(_Z_LO, (n, 1))
+    hi = np.tile(_Z_HI, (n, 1))
+
+    def exact(c: str, value, rows=slice(None)) -> None:
+        lo[rows, _COL[c]] = value
+        hi[rows, _COL[c]] = value
+
+    mu, sd = mu_vorp[grp], sd_vorp[grp]
+    exact("V", np.where(sd > 1e-9, np.clip((vorp - mu) / sd, -2.0, 2.0) / 2.0, 0.0))
+    exact("R", per_pos({k: min(1.0, run_press.get(k, 0.0)) for k in keys}))  # already >=0
+    exact("N", per_pos(need_frac)*2.0 - 1.0)
+    exact("F", np.clip(per_pos(must_fill), 0.0, 1.0)*2.0 - 1.0)
+    exact("St", _signed_unit(stack))
+    exact("By", _signed_unit(bye_pen))
+    exact("Tm", _signed_unit(team_conc))
+    exact("Hc", _signed_unit(handcuff))
+    exact("GK", per_pos(kdst_gate)*2.0 - 1.0)
+
+    # Risk & stability: catalog-only features, precomputed per player (features.static_features)
+    role_stability = 1.0 - ((1.0 - cols["role_certainty_mult"]) * 0.8)  # convert to bonus in [~0.9..1.0]
+    exact("In", _signed_unit(cols["injury_risk"]))
+    exact("Ag", _signed_unit(cols["age_penalty"]))
+    exact("Rl", ((role_stability-0.9)/0.1) - 1.0)  # roughly map ~[0.9..1.0] to [-1..1]
+    exact("Rv", _signed_unit(cols["rookie_volatility"]))
+
+    # Per position, best first (the board order the tiers use): each candidate's rank, the
+    # best expected at next pick after picks_gap * pos_rates[pos] players there are taken
+    # (TierGap), and how many are above replacement
+    rank = np.zeros(n, dtype=np.int64)
+    next_best = np.zeros(n, dtype=np.float64)
+    above_rep_total = np.zeros(n, dtype=np.float64)
+    for k in keys:
+        members = by_pos[k]
+        rank[members] = np.arange(len(members))
+        pts_arr = pts[members]
+        taken = int(round(picks_gap * pos_rates.get(k, 0.0)))
+        next_best[members] = pts_arr[np.minimum(rank[members] + max(0, taken), len(pts_arr) - 1)]
+        above_rep_total[members] = np.count_nonzero(pts_arr >= float(repl.get(k, 0.0)))
+    tier_gap = np.maximum(0.0, pts - next_best)
+    exact("T", np.where(tier_gap > 0, np.clip(tier_gap / np.maximum(1.0, tier_gap), -2.0, 2.0) / 2.0, 0.0))
+
+    # Scarcity index: 70% remaining in the player's tier, 30% remaining above replacement;
+    # until tiered, the tier part can be anything in 0..1
+    pos_remaining_ratio = np.maximum(0.0, (above_rep_total - (rank + 1)) / np.maximum(1.0, above_rep_total))
+    lo[:, _COL["Sx"]] = np.clip(0.3*(1.0 - pos_remaining_ratio), 0.0, 1.0)*2.0 - 1.0
+    hi[:, _COL["Sx"]] = np.clip(0.7 + 0.3*(1.0 - pos_remaining_ratio), 0.0, 1.0)*2.0 - 1.0
+
+    # Availability: live rates + opponents' needs without ADP (the same for the whole position)
+    adp = cols["adp"]
+    no_adp = np.isnan(adp)
+    survive_no_adp = per_pos({k: survival_no_adp(k, pos_rates, opp_need_count, picks_gap) for k in keys})
+    exact("A", (1.0 - survive_no_adp[no_adp])*2.0 - 1.0, no_adp)
+
+    # Pruning, pass 1: a candidate whose best case (its own VORP, everything still open at
+    # its most favourable value) is below the top_k-th best worst case cannot be returned
+    def cutoff(low: np.ndarray, g: np.ndarray) -> np.ndarray:
+        # per row, the top_k-th best worst case of its ranking
+        return np.array([_kth_largest(low[g == j], top_k) for j in range(len(groups))])[g]
+
+    low, high = _score_bounds(lo, hi, w)
+    rows = np.flatnonzero(high >= cutoff(low, grp) - _PRUNE_EPS)
+
+    # Availability with ADP (sigma from the whole position's ADPs)
+    with_adp = rows[~no_adp[rows]]
+    sigma = per_pos(adaptive_sigmas(posp, adp))[with_adp]
+    survive = survival_with_adp(adp[with_adp], sigma, next_pick)
+    exact("A", (1.0 - survive)*2.0 - 1.0, with_adp)  # higher = more urgent
+
+    # Pruning, pass 2: only the tier part of scarcity is open now. What is left sets how
+    # deep each position has to be tiered (per-position ceiling: a position with no
+    # candidate left is not tiered at all)
+    low, high = _score_bounds(lo[rows], hi[rows], w)
+    rows = rows[high >= cutoff(low, grp[rows]) - _PRUNE_EPS]
+    depth: Dict[str, int] = {}
+    for j, r in zip(pos_idx[rows].tolist(), rank[rows].tolist()):
+        depth[keys[j]] = max(depth.get(keys[j], 0), r + 1)
+
+    # per-player tiering with adaptive tolerance, down to `depth` (resumed on the board from
+    # the last call where the picks since can't have moved it); tiers are contiguous runs of
+    # the position order starting at the heads
+    tier_start = np.zeros(n, dtype=np.int64)
+    tier_size_est = np.ones(n, dtype=np.int64)
+    for k in depth:
+        factors = _scan_factors(k, ctx.round, picks_gap, run_press.get(k, 0.0), strategy.archetype)
+        h, _ = state.boards[k].tier_heads(k, depth[k], factors, TIER_MIN_SIZE.get(k, 2))
+        members = by_pos[k][:depth[k]]
+        starts = np.array(h + [len(by_pos[k])], dtype=np.int64)
+        t_idx = np.searchsorted(starts, rank[members], side="right") - 1
+        tier_start[members] = starts[t_idx]
+        tier_size_est[members] = np.maximum(1, starts[t_idx + 1] - starts[t_idx])
+    rank_in_tier = rank - tier_start + 1
+    tier_remaining_ratio = np.maximum(0.0, (tier_size_est - rank_in_tier) / np.maximum(1, tier_size_est))
+    scarcity = 0.7*(1.0 - tier_remaining_ratio) + 0.3*(1.0 - pos_remaining_ratio)
+    exact("Sx", (np.clip(scarcity, 0.0, 1.0)*2.0 - 1.0)[rows], rows)
+
+    Z = lo
+    scores = (Z[rows] * w).sum(axis=1)   # row by row: a score never depends on which other rows are left
+
+    # what each returned row needs; components, reasons and Player models are built from
+    # it only when the suggestion is read (pool entries may be table views)
+    out: Dict[Optional[str], Ranking] = {}
+    for j, g in enumerate(groups):
+        mine = rows[grp[rows] == j]
+        sc = scores[grp[rows] == j]
+        out[g] = Ranking([
+            (pool[i], float(sc[r]), Z[i].tolist(), float(pts[i]), float(tier_gap[i]), posp[i], run_press.get(posp[i], 0.0))
+            for r, i in ((r, int(mine[r])) for r in _top_k(sc, top_k).tolist())
+        ])
+    return out
+
+def suggest_v2(
+    players: List[Player],
+    drafted: Dict[int, str],
+    rules: ScoringRules,
+    ctx: LeagueContext,
+    my_bye_counts: Dict[int, int],
+    strategy: StrategyProfile,
+    count: int = 12,
+    pos: Optional[str] = None,
+    history: Optional[List[Dict]] = None,
+    opponents_needs: Optional[Dict[str, Dict[str,int]]] = None,  # teamName -> pos -> remaining starters needed
+    projections: Optional[Dict[int, float]] = None,  # player_id -> league points, precomputed for these rules
+    engine: Optional[EngineState] = None,  # the draft's per-position boards over `projections`, synced by the caller
+) -> List[SuggestionV2]:
+    return list(_rank(players, drafted, rules, ctx, my_bye_counts, strategy, count, pos, history,
+                      opponents_needs, projections, engine).get(None, []))
+
+
+def suggest_v2_by_position(
+    players: List[Player],
+    drafted: Dict[int, str],
+    rules: ScoringRules,
+    ctx: LeagueContext,
+    my_bye_counts: Dict[int, int],
+    strategy: StrategyProfile,
+    count: int = 12,
+    history: Optional[List[Dict]] = None,
+    opponents_needs: Optional[Dict[str, Dict[str,int]]] = None,
+    projections: Optional[Dict[int, float]] = None,
+    engine: Optional[EngineState] = None,
+) -> Dict[str, Ranking]:
+    """
+    suggest_v2(pos=k) for every position k in the pool, computed together: {k: suggestions}.
+    Each Ranking builds its suggestions as they are read, so a caller that only shows one
+    position pays for that one.
+    """
+    return _rank(players, drafted, rules, ctx, my_bye_counts, strategy, count, None, history,
+                 opponents_needs, projections, engine, by_position=True)
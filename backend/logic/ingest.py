@@ -0,0 +1,161 @@
+import codecs
+import json
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+# ---- What we keep from each feed ----
+FANTASY_POSITIONS = ("QB", "RB", "WR", "TE", "K", "DST")
+
+PLAYER_KEYS = ("PlayerID", "Name", "ShortName", "FirstName", "LastName", "Position", "Team",
+               "Age", "Experience")
+STAT_KEYS = ("PassingYards", "PassingTouchdowns", "Interceptions", "RushingYards", "RushingTouchdowns",
+             "Receptions", "ReceivingYards", "ReceivingTouchdowns", "FumblesLost",
+             "TwoPointConversionPasses", "TwoPointConversionRuns", "TwoPointConversionReceptions")
+PROJECTION_KEYS = ("PlayerID", "FantasyPointsPPR", "FantasyPoints",
+                   "AverageDraftPositionPPR", "AverageDraftPosition", "ADP") + STAT_KEYS
+
+_decoder = json.JSONDecoder()
+_WS = " \t\n\r"
+_CHUNK = 1 << 18   # bytes of body decoded to str at a time
+
+
+def _text_chunks(body: str | bytes) -> Iterator[str]:
+    if isinstance(body, str):
+        yield body
+        return
+    dec = codecs.getincrementaldecoder("utf-8")()
+    view = memoryview(body)
+    for start in range(0, len(view), _CHUNK):
+        yield dec.decode(view[start:start + _CHUNK], final=start + _CHUNK >= len(view))
+
+
+def iter_json_array(text: str | bytes) -> Iterator[Any]:
+    """
+    Decode a top-level JSON array one element at a time, so callers can drop
+    elements (and fields) before the next one is materialized. A bytes body is
+    decoded to str a chunk at a time (no full str copy next to it); only the
+    current element, and the undecoded rest of its chunk, is held as Python objects.
+    """
+    chunks = _text_chunks(text)
+    buf, i, eof, opened = "", 0, False, False
+    while True:
+        skip = _WS + "," if opened else _WS
+        while i < len(buf) and buf[i] in skip:
+            i += 1
+        if i < len(buf):
+            if not opened:
+                if buf[i] != "[":
+                    # not an array (error object, null...) — hand back whatever it is
+                    yield _decoder.decode(buf[i:] + "".join(chunks))
+                    return
+                opened, i = True, i + 1
+                continue
+            if buf[i] == "]":
+                return
+            try:
+                item, end = _decoder.raw_decode(buf, i)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = -1   # element runs past this chunk
+            # only trust an element once its "," or "]" is in view: a scalar at the end of
+            # a chunk (a "1." before "5e3" arrives) may decode short
+            j = end
+            while 0 <= j < len(buf) and buf[j] in _WS:
+                j += 1
+            if end != -1 and (eof or (j < len(buf) and buf[j] in ",]")):
+                yield item
+                i = end
+                continue
+        elif eof:
+            return
+        nxt = next(chunks, None)
+        if nxt is None:
+            eof = True
+        else:
+            buf, i = buf[i:] + nxt, 0
+
+
+def _is_fantasy(pos: Any) -> bool:
+    return str(pos or "").upper() in FANTASY_POSITIONS
+
+
+def _pick(row: Dict[str, Any], keys: Iterable[str]) -> Dict[str, Any]:
+    return {k: row[k] for k in keys if row.get(k) is not None}
+
+
+def slim_player(row: Any) -> Optional[Dict[str, Any]]:
+    if not isinstance(row, dict) or row.get("PlayerID") is None or not _is_fantasy(row.get("Position")):
+        return None
+    return _pick(row, PLAYER_KEYS)
+
+
+def slim_projection(row: Any) -> Optional[Dict[str, Any]]:
+    if not isinstance(row, dict) or row.get("PlayerID") is None:
+        return None
+    if row.get("Position") is not None and not _is_fantasy(row.get("Position")):
+        return None
+    return _pick(row, PROJECTION_KEYS)
+
+
+def slim_injury(row: Any) -> Optional[Dict[str, Any]]:
+    if not isinstance(row, dict) or row.get("PlayerID") is None:
+        return None
+    if row.get("Position") is not None and not _is_fantasy(row.get("Position")):
+        return None
+    return _pick(row, ("PlayerID", "Status"))
+
+
+def iter_depth_rows(row: Any) -> Iterator[Dict[str, Any]]:
+    """
+    DepthChartsAll comes back per team ({Offense: [...], SpecialTeams: [...], ...});
+    older/flat shapes are one row per player. Yield flat {PlayerID, DepthOrder} rows either way.
+    """
+    if not isinstance(row, dict):
+        return
+    if row.get("PlayerID") is not None:
+        if row.get("Position") is None or _is_fantasy(row.get("Position")):
+            yield _pick(row, ("PlayerID", "DepthOrder"))
+        return
+    for unit in ("Offense", "SpecialTeams"):
+        for d in row.get(unit) or []:
+            if isinstance(d, dict) and d.get("PlayerID") is not None and _is_fantasy(d.get("Position")):
+                yield _pick(d, ("PlayerID", "DepthOrder"))
+
+
+def slim_depth(row: Any) -> List[Dict[str, Any]]:
+    return list(iter_depth_rows(row))
+
+
+# feed -> per-element filter; None drops the element, a list is spliced in (depth teams -> rows)
+FEED_FILTERS: Dict[str, Callable[[Any], Any]] = {
+    "players": slim_player,
+    "projections": slim_projection,
+    "season_stats": slim_projection,
+    "injuries": slim_injury,
+    "depth": slim_depth,
+}
+
+
+def slim_feed(feed: str, items: Iterable[Any]) -> List[Any]:
+    """Run a feed (decoded list or streaming iterator) through its filter."""
+    keep = FEED_FILTERS.get(feed)
+    if keep is None:
+        return list(items)
+    out: List[Any] = []
+    for item in items:
+        v = keep(item)
+        if v is None:
+            continue
+        if isinstance(v, list):
+            out.extend(v)
+        else:
+            out.append(v)
+    return out
+
+
+def decode_feed(feed: str, body: str | bytes) -> Any:
+    """Streaming decode of a raw response body, filtered as we go."""
+    items = iter_json_array(body)
+    if feed not in FEED_FILTERS:
+        return list(items)
+    return slim_feed(feed, items)
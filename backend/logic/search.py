@@ -0,0 +1,156 @@
+import re
+import heapq
+import unicodedata
+from typing import Callable, Dict, List, Optional, Set
+
+from store.table import PlayerTable
+
+# Common short forms <-> given names (both directions get indexed)
+NICKNAMES: Dict[str, List[str]] = {
+    "mike": ["michael"], "chris": ["christopher"], "matt": ["matthew"], "josh": ["joshua"],
+    "nick": ["nicholas", "nicolas"], "tony": ["anthony"], "rob": ["robert"], "bob": ["robert"],
+    "bobby": ["robert"], "will": ["william"], "bill": ["william"], "jim": ["james"], "jimmy": ["james"],
+    "dan": ["daniel"], "danny": ["daniel"], "dave": ["david"], "joe": ["joseph"], "jon": ["jonathan"],
+    "ben": ["benjamin"], "sam": ["samuel"], "zach": ["zachary"], "zack": ["zachary"], "alex": ["alexander"],
+    "andy": ["andrew"], "drew": ["andrew"], "tom": ["thomas"], "tommy": ["thomas"], "ken": ["kenneth"],
+    "kenny": ["kenneth"], "greg": ["gregory"], "jeff": ["jeffrey"], "steve": ["steven", "stephen"],
+    "pat": ["patrick"], "cam": ["cameron"], "gabe": ["gabriel"], "jake": ["jacob"], "ty": ["tyler", "tyrone"],
+}
+_NICK_REVERSE: Dict[str, List[str]] = {}
+for _short, _fulls in NICKNAMES.items():
+    for _full in _fulls:
+        _NICK_REVERSE.setdefault(_full, []).append(_short)
+
+TEAM_NAMES: Dict[str, str] = {
+    "ARI": "arizona cardinals", "ATL": "atlanta falcons", "BAL": "baltimore ravens", "BUF": "buffalo bills",
+    "CAR": "carolina panthers", "CHI": "chicago bears", "CIN": "cincinnati bengals", "CLE": "cleveland browns",
+    "DAL": "dallas cowboys", "DEN": "denver broncos", "DET": "detroit lions", "GB": "green bay packers",
+    "HOU": "houston texans", "IND": "indianapolis colts", "JAX": "jacksonville jaguars", "KC": "kansas city chiefs",
+    "LAC": "los angeles chargers", "LAR": "los angeles rams", "LV": "las vegas raiders", "MIA": "miami dolphins",
+    "MIN": "minnesota vikings", "NE": "new england patriots", "NO": "new orleans saints", "NYG": "new york giants",
+    "NYJ": "new york jets", "PHI": "philadelphia eagles", "PIT": "pittsburgh steelers", "SEA": "seattle seahawks",
+    "SF": "san francisco 49ers", "TB": "tampa bay buccaneers", "TEN": "tennessee titans", "WAS": "washington commanders",
+}
+
+_PUNCT_DROP = re.compile(r"[.'`’]")
+_PUNCT_SPACE = re.compile(r"[^a-z0-9]+")
+
+# match quality (lower = better), used before board order when ranking
+Q_EXACT, Q_PREFIX, Q_NICK, Q_TEAM, Q_FUZZY = 0, 1, 2, 3, 4
+
+
+def fold(s: str) -> str:
+    """Lowercase, strip accents, drop . and ' (so "Ja'Marr"/"A.J." -> "jamarr"/"aj"), other punctuation -> space."""
+    s = unicodedata.normalize("NFKD", s or "")
+    s = "".join(ch for ch in s if not unicodedata.combining(ch)).lower()
+    s = _PUNCT_DROP.sub("", s)
+    return _PUNCT_SPACE.sub(" ", s).strip()
+
+
+def _trigrams(s: str) -> Set[str]:
+    s = f"  {s} "
+    return {s[i:i + 3] for i in range(len(s) - 2)}
+
+
+class _Node:
+    __slots__ = ("kids", "rows")
+
+    def __init__(self):
+        self.kids: Dict[str, "_Node"] = {}
+        self.rows: Dict[int, int] = {}   # row -> best quality of any term through this node
+
+
+class SearchIndex:
+    """
+    Typeahead over player names and teams, built once per catalog.
+    - prefix trie over folded name tokens, full names, nickname expansions, team abbreviations/names
+    - trigram postings over folded full names for typo-tolerant fallback
+    Each trie node carries its postings, so a prefix lookup is a walk of len(prefix) nodes.
+    """
+
+    def __init__(self, table: PlayerTable):
+        self.root = _Node()
+        self.grams: Dict[str, Set[int]] = {}
+        self.folded: List[str] = []
+        self._gram_counts: List[int] = []
+        for i in range(len(table)):
+            name = fold(table.names[i])
+            self.folded.append(name)
+            tokens = name.split()
+            for t in tokens:
+                self._add(t, i, Q_PREFIX)
+                for alt in NICKNAMES.get(t, []) + _NICK_REVERSE.get(t, []):
+                    self._add(fold(alt), i, Q_NICK)
+            if len(tokens) > 1:
+                self._add(name.replace(" ", ""), i, Q_PREFIX)
+            team = table.team_of(i)
+            if team:
+                self._add(team.lower(), i, Q_TEAM)
+                for t in TEAM_NAMES.get(team, "").split():
+                    self._add(t, i, Q_TEAM)
+            grams = _trigrams(name)
+            self._gram_counts.append(len(grams))
+            for g in grams:
+                self.grams.setdefault(g, set()).add(i)
+
+    def _add(self, term: str, row: int, quality: int) -> None:
+        node = self.root
+        for ch in term:
+            node = node.kids.setdefault(ch, _Node())
+            if node.rows.get(row, 99) > quality:
+                node.rows[row] = quality
+
+    def _prefix(self, term: str) -> Dict[int, int]:
+        node = self.root
+        for ch in term:
+            node = node.kids.get(ch)
+            if node is None:
+                return {}
+        return node.rows
+
+    def _fuzzy(self, q: str, min_sim: float = 0.3) -> Dict[int, int]:
+        grams = _trigrams(q)
+        hits: Dict[int, int] = {}
+        for g in grams:
+            for i in self.grams.get(g, ()):
+                hits[i] = hits.get(i, 0) + 1
+        out: Dict[int, int] = {}
+        for i, shared in hits.items():
+            if shared / (len(grams) + self._gram_counts[i] - shared) >= min_sim:
+                out[i] = Q_FUZZY
+        return out
+
+    def matches(self, q: str) -> Dict[int, int]:
+        """row -> match quality. Every query token must prefix-match; typo fallback via trigrams."""
+        fq = fold(q)
+        if not fq:
+            return {}
+        tokens = fq.split()
+        result: Optional[Dict[int, int]] = None
+        for t in tokens:
+            hit = self._prefix(t)
+            result = hit if result is None else {i: max(qual, hit[i]) for i, qual in result.items() if i in hit}
+            if not result:
+                break
+        if len(tokens) > 1 and not result:
+            result = self._prefix(fq.replace(" ", ""))
+        if not result:
+            return self._fuzzy(fq)
+        exact = [i for i in result if self.folded[i] == fq]
+        if exact:
+            result = dict(result)
+            for i in exact:
+                result[i] = Q_EXACT
+        return result
+
+    def search(
+        self,
+        q: str,
+        rank: List[int],
+        limit: int = 10,
+        keep: Optional[Callable[[int], bool]] = None,
+    ) -> List[int]:
+        """Top `limit` rows by (match quality, board rank); `keep` filters rows (e.g. undrafted only)."""
+        hits = self.matches(q)
+        cand = ((qual, rank[i], i) for i, qual in hits.items() if keep is None or keep(i))
+        return [i for _, _, i in heapq.nsmallest(max(1, limit), cand)]
@@ -1,22 +1,18 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple
 from models import Player
+from logic.ingest import slim_feed
+from logic.engine_v2.scoring import statline_points
+from store.table import PlayerTable
+from logic.engine_v2.features import static_features
 
-# ---- Simple scoring fallback if feed points are missing ----
-def _points_from_statline(stat: dict) -> float:
+# ---- Scoring fallback if feed points are missing ----
+def _points_from_statline(stat: dict, position: Optional[str] = None) -> float:
     """
-    Very simple default (0.5 PPR) if FantasyPoints/FantasyPointsPPR not provided by feed.
+    Points for a raw feed statline when FantasyPoints/FantasyPointsPPR are not provided,
+    in the default ScoringRules(): the catalog is shared by every draft, so league
+    scoring is applied per draft (ProjectionCache), never baked in here.
     """
-    return (
-        (stat.get("PassingYards", 0) * 0.04)
-        + (stat.get("PassingTouchdowns", 0) * 4)
-        + (stat.get("Interceptions", 0) * -2)
-        + (stat.get("RushingYards", 0) * 0.1)
-        + (stat.get("RushingTouchdowns", 0) * 6)
-        + (stat.get("Receptions", 0) * 0.5)
-        + (stat.get("ReceivingYards", 0) * 0.1)
-        + (stat.get("ReceivingTouchdowns", 0) * 6)
-        - (stat.get("FumblesLost", 0) * 2)
-    )
+    return statline_points(_stat_fields(stat), position)
 
 
 def _coerce_float(v: Any) -> Optional[float]:
@@ -28,148 +24,181 @@ def _coerce_float(v: Any) -> Optional[float]:
         return None
 
 
-def normalize_players(raw: Dict[str, Any]) -> Dict[int, Player]:
-    """
-    Build a map of PlayerID -> Player (pydantic model) using all available
-    feed artifacts: players, byes, depth charts, projections, injuries,
-    and (fallback) last-season statlines.
-    """
-    # 1) Seed players from the "players" master list
-    players: Dict[int, Player] = {}
+def _coerce_int(v: Any) -> Optional[int]:
+    f = _coerce_float(v)
+    return int(f) if f is not None else None
+
+
+def _stat_fields(stat: dict) -> Dict[str, Optional[float]]:
+    two_pt = [stat.get(k) for k in ("TwoPointConversionPasses", "TwoPointConversionRuns", "TwoPointConversionReceptions")]
+    two_pt = [x for x in (_coerce_float(v) for v in two_pt) if x is not None]
+    return {
+        "passing_yards": _coerce_float(stat.get("PassingYards")),
+        "passing_tds": _coerce_float(stat.get("PassingTouchdowns")),
+        "interceptions": _coerce_float(stat.get("Interceptions")),
+        "rushing_yards": _coerce_float(stat.get("RushingYards")),
+        "rushing_tds": _coerce_float(stat.get("RushingTouchdowns")),
+        "receptions": _coerce_float(stat.get("Receptions")),
+        "receiving_yards": _coerce_float(stat.get("ReceivingYards")),
+        "receiving_tds": _coerce_float(stat.get("ReceivingTouchdowns")),
+        "fumbles_lost": _coerce_float(stat.get("FumblesLost")),
+        "two_pt_conversions": sum(two_pt) if two_pt else None,
+    }
 
-    for p in raw.get("players", []):
-        pid = p.get("PlayerID")
-        if pid is None:
-            continue
-        pid = int(pid)
 
-        name = p.get("Name") or p.get("ShortName") or (p.get("FirstName", "") + " " + p.get("LastName", ""))
-        pos = (p.get("Position") or "").upper()
-        team = p.get("Team")
-        age = _coerce_float(p.get("Age"))
-
-        players[pid] = Player(
-            player_id=pid,
-            name=(name or "").strip(),
-            position=pos,
-            team=team,
-            age=age if age is not None else None,
-            bye_week=None,
-            adp=None,
-            projected_points=None,
-            depth_order=None,
-            committee_size=None,
-        )
-
-    # 2) Attach bye weeks if present
+def _by_pid(rows: Iterable[Any]) -> Dict[int, dict]:
+    out: Dict[int, dict] = {}
+    for r in rows:
+        pid = _coerce_int(r.get("PlayerID")) if isinstance(r, dict) else None
+        if pid is not None:
+            out[pid] = r
+    return out
+
+
+def _depth_map(raw: Dict[str, Any]) -> Dict[int, int]:
+    depth_map: Dict[int, int] = {}
+    for d in slim_feed("depth", raw.get("depth", [])):
+        pid, order = _coerce_int(d.get("PlayerID")), _coerce_int(d.get("DepthOrder"))
+        if pid is not None and order is not None:
+            depth_map.setdefault(pid, order)
+    return depth_map
+
+
+def _injury_map(raw: Dict[str, Any]) -> Dict[int, Optional[str]]:
+    return {pid: r.get("Status") for pid, r in _by_pid(slim_feed("injuries", raw.get("injuries", []))).items()}
+
+
+def _projection_fields(proj: dict, position: Optional[str] = None) -> Dict[str, Any]:
+    # ---- Projected Points ----
+    fp = proj.get("FantasyPointsPPR")
+    if fp is None:
+        fp = proj.get("FantasyPoints")
+    if fp is None:
+        fp = _points_from_statline(proj, position)
+    out: Dict[str, Any] = {"projected_points": _coerce_float(fp), "adp": None}
+    # ---- ADP ----
+    adp = _coerce_float(proj.get("AverageDraftPositionPPR") or proj.get("AverageDraftPosition") or proj.get("ADP"))
+    if adp is not None and adp > 0:
+        out["adp"] = adp
+    # ---- Per-stat backfill for reproject_points ----
+    out.update(_stat_fields(proj))
+    return out
+
+
+def iter_player_rows(raw: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    One pass over the players master list, joining byes, depth, injuries,
+    projections (+ADP) and (fallback) last-season statlines by key.
+    Non-fantasy positions are dropped before anything is built; each yielded
+    row is a plain dict of Player field -> value. Statlines without feed points
+    are scored with the default rules.
+    """
+    # Small lookup maps first (every feed goes through the same slim filters the
+    # streaming provider path uses, so already-slimmed input passes straight through)
     bye_map: Dict[str, int] = {}
     for b in raw.get("byes", []):
         t = b.get("Team")
         wk = b.get("ByeWeek", b.get("Week"))
         if t and isinstance(wk, int):
             bye_map[t] = wk
+    depth_map = _depth_map(raw)
+    injury_map = _injury_map(raw)
+    proj_map = _by_pid(slim_feed("projections", raw.get("projections", [])))
+    stat_map = _by_pid(slim_feed("season_stats", raw.get("season_stats", [])))
+
+    seeds = slim_feed("players", raw.get("players", []))
+
+    # Committee sizes: same team + position
+    team_pos_counts: Dict[Tuple[str, str], int] = {}
+    for p in seeds:
+        team, pos = p.get("Team"), str(p.get("Position") or "").upper()
+        if team:
+            team_pos_counts[(team, pos)] = team_pos_counts.get((team, pos), 0) + 1
+
+    for p in seeds:
+        pid = int(p["PlayerID"])
+        name = p.get("Name") or p.get("ShortName") or (p.get("FirstName", "") + " " + p.get("LastName", ""))
+        pos = str(p.get("Position") or "").upper()
+        team = p.get("Team")
+        row: Dict[str, Any] = {
+            "player_id": pid,
+            "name": (name or "").strip(),
+            "position": pos,
+            "team": team,
+            "age": _coerce_int(p.get("Age")),
+            "years_exp": _coerce_int(p.get("Experience")),
+            "bye_week": bye_map.get(team) if team else None,
+            "adp": None,
+            "projected_points": None,
+            "depth_order": depth_map.get(pid),
+            "committee_size": team_pos_counts.get((team, pos)) if team else None,
+            "injury_status": injury_map.get(pid),   # Injuries feed only, same source refresh diffs
+        }
+
+        proj = proj_map.get(pid)
+        if proj is not None:
+            row.update(_projection_fields(proj, pos))
+
+        # Fallback: last season stats
+        stat = stat_map.get(pid)
+        if stat is not None:
+            if row["projected_points"] is None:
+                row["projected_points"] = _points_from_statline(stat, pos)
+            if row.get("passing_yards") is None:
+                row.update(_stat_fields(stat))
+
+        yield row
 
-    for p in players.values():
-        if p.team and p.team in bye_map:
-            p.bye_week = bye_map[p.team]
-
-    # 3) Depth
-    for d in raw.get("depth", []):
-        pid = d.get("PlayerID")
-        if pid is None:
-            continue
-        pid = int(pid)
-        if pid not in players:
-            continue
-        depth_order = d.get("DepthOrder")
-        try:
-            if depth_order is not None:
-                players[pid].depth_order = int(depth_order)
-        except Exception:
-            pass
-
-    # 4) Committee sizes
-    team_pos_counts: Dict[str, Dict[str, int]] = {}
-    for p in players.values():
-        if not p.team or not p.position:
-            continue
-        team_pos_counts.setdefault(p.team, {})
-        team_pos_counts[p.team].setdefault(p.position, 0)
-        team_pos_counts[p.team][p.position] += 1
-
-    for p in players.values():
-        if p.team and p.position and p.team in team_pos_counts and p.position in team_pos_counts[p.team]:
-            p.committee_size = team_pos_counts[p.team][p.position]
-
-    # 5) Projections + ADP
-    for proj in raw.get("projections", []):
-        pid = proj.get("PlayerID")
-        if pid is None:
-            continue
-        pid = int(pid)
-        if pid not in players:
-            continue
-
-        # ---- Projected Points ----
-        fp = proj.get("FantasyPointsPPR")
-        if fp is None:
-            fp = proj.get("FantasyPoints")
-        if fp is None:
-            fp = _points_from_statline(proj)
-        fpf = _coerce_float(fp)
-        if fpf is not None:
-            players[pid].projected_points = fpf
-
-        # ---- ADP ----
-        adp = proj.get("AverageDraftPositionPPR") or proj.get("AverageDraftPosition") or proj.get("ADP")
-        adpf = _coerce_float(adp)
-        if adpf is not None and adpf > 0:
-            players[pid].adp = adpf
-
-        # ---- Per-stat backfill for reproject_points ----
-        try:
-            if getattr(players[pid], "passing_yards", None) is None:
-                players[pid].passing_yards = _coerce_float(proj.get("PassingYards"))
-                players[pid].passing_tds = _coerce_float(proj.get("PassingTouchdowns"))
-                players[pid].interceptions = _coerce_float(proj.get("Interceptions"))
-                players[pid].rushing_yards = _coerce_float(proj.get("RushingYards"))
-                players[pid].rushing_tds = _coerce_float(proj.get("RushingTouchdowns"))
-                players[pid].receptions = _coerce_float(proj.get("Receptions"))
-                players[pid].receiving_yards = _coerce_float(proj.get("ReceivingYards"))
-                players[pid].receiving_tds = _coerce_float(proj.get("ReceivingTouchdowns"))
-                players[pid].fumbles_lost = _coerce_float(proj.get("FumblesLost"))
-        except Exception:
-            pass
-
-    # 6) Fallback: last season stats
-    for stat in raw.get("season_stats", []):
-        pid = stat.get("PlayerID")
-        if pid is None:
-            continue
-        pid = int(pid)
-        if pid not in players:
-            continue
-
-        if players[pid].projected_points is None:
-            players[pid].projected_points = _points_from_statline(stat)
-
-        try:
-            if getattr(players[pid], "passing_yards", None) is None:
-                players[pid].passing_yards = _coerce_float(stat.get("PassingYards"))
-                players[pid].passing_tds = _coerce_float(stat.get("PassingTouchdowns"))
-                players[pid].interceptions = _coerce_float(stat.get("Interceptions"))
-                players[pid].rushing_yards = _coerce_float(stat.get("RushingYards"))
-                players[pid].rushing_tds = _coerce_float(stat.get("RushingTouchdowns"))
-                players[pid].receptions = _coerce_float(stat.get("Receptions"))
-                players[pid].receiving_yards = _coerce_float(stat.get("ReceivingYards"))
-                players[pid].receiving_tds = _coerce_float(stat.get("ReceivingTouchdowns"))
-                players[pid].fumbles_lost = _coerce_float(stat.get("FumblesLost"))
-        except Exception:
-            pass
-
-    # 7) Filter to fantasy positions
-    filtered = {
-        pid: p for pid, p in players.items()
-        if (p.position or "") in ("QB", "RB", "WR", "TE", "K", "DST")
-    }
-    return filtered
+
+def normalize_players(raw: Dict[str, Any]) -> Dict[int, Player]:
+    """
+    Build a map of PlayerID -> Player (pydantic model) using all available
+    feed artifacts: players, byes, depth charts, projections, injuries,
+    and (fallback) last-season statlines. Only fantasy positions are built.
+    """
+    return {row["player_id"]: Player(**row) for row in iter_player_rows(raw)}
+
+
+def build_player_table(raw: Dict[str, Any]) -> PlayerTable:
+    """
+    Same join as normalize_players, straight into the columnar catalog (no Player models),
+    with the engine's catalog-only per-player features computed up front.
+    """
+    table = PlayerTable.from_rows(iter_player_rows(raw))
+    static_features(table)
+    return table
+
+
+def volatile_updates(raw: Dict[str, Any], table: PlayerTable) -> Dict[int, Dict[str, Any]]:
+    """
+    Diff a partial bundle of the volatile feeds (injuries, depth, projections)
+    against the catalog: pid -> {field: new value} for players whose values changed.
+    A feed whose fetch failed comes back as None and is skipped, so it never wipes data;
+    an empty injuries/depth feed is a real answer (nobody listed) and clears statuses.
+    Only rows named in a feed (or currently carrying a value it can clear) are visited.
+    """
+    changes: Dict[int, Dict[str, Any]] = {}
+
+    def _diff(pid: int, fields: Dict[str, Any]) -> None:
+        i = table.row_of(pid)
+        if i is None:
+            return
+        for f, v in fields.items():
+            if table.value(i, f) != v:
+                changes.setdefault(pid, {})[f] = v
+
+    if raw.get("injuries") is not None:
+        injury_map = _injury_map(raw)
+        current = table.ids[table.injury != 0].tolist()
+        for pid in set(current) | injury_map.keys():
+            _diff(pid, {"injury_status": injury_map.get(pid)})
+    if raw.get("depth") is not None:
+        depth_map = _depth_map(raw)
+        current = table.ids[table.column("depth_order") >= 0].tolist()
+        for pid in set(current) | depth_map.keys():
+            _diff(pid, {"depth_order": depth_map.get(pid)})
+    if raw.get("projections") is not None:
+        for pid, proj in _by_pid(slim_feed("projections", raw["projections"])).items():
+            i = table.row_of(pid)
+            _diff(pid, _projection_fields(proj, table.position_of(i) if i is not None else None))
+    return changes
@@ -1,5 +1,60 @@
 from typing import List, Optional, Dict, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+# Per-stat projection fields (Player, PlayerTable stats matrix) a scoring rule can weight
+STAT_FIELDS = (
+    "passing_yards", "passing_tds", "interceptions",
+    "rushing_yards", "rushing_tds",
+    "receptions", "receiving_yards", "receiving_tds",
+    "fumbles_lost", "two_pt_conversions",
+)
+SCORING_POSITIONS = ("QB", "RB", "WR", "TE", "K", "DST")
+
+def _check_stat(name: str) -> str:
+    if name not in STAT_FIELDS:
+        raise ValueError(f"unknown stat {name!r} (one of: {', '.join(STAT_FIELDS)})")
+    return name
+
+def _check_pos(name: str) -> str:
+    if name.upper() not in SCORING_POSITIONS:
+        raise ValueError(f"unknown position {name!r} (one of: {', '.join(SCORING_POSITIONS)})")
+    return name.upper()
+
+class YardageBonus(BaseModel):
+    # e.g. {"stat": "passing_yards", "threshold": 300, "points": 3}: +3 for every 300+ yard game
+    stat: str
+    threshold: float = Field(gt=0)
+    points: float
+    per_game: bool = True   # False: a one-off bonus if the season total reaches the threshold
+
+    @field_validator("stat")
+    @classmethod
+    def _stat(cls, v: str) -> str:
+        return _check_stat(v)
+
+class ScoringSpec(BaseModel):
+    """League scoring beyond the fixed ScoringRules fields; compiled once per ruleset (engine_v2/scoring.py)."""
+    stats: Dict[str, float] = Field(default_factory=dict)                       # extra points per unit of a stat
+    position_stats: Dict[str, Dict[str, float]] = Field(default_factory=dict)   # e.g. {"TE": {"receptions": 0.5}}
+    position_multipliers: Dict[str, float] = Field(default_factory=dict)        # e.g. {"QB": 0.9}
+    bonuses: List[YardageBonus] = Field(default_factory=list)
+    games: int = Field(17, ge=1)            # games per season, for per-game bonuses
+    game_cv: float = Field(0.45, gt=0)      # game-to-game spread of a stat, relative to its mean
+
+    @field_validator("stats")
+    @classmethod
+    def _stats(cls, v: Dict[str, float]) -> Dict[str, float]:
+        return {_check_stat(k): w for k, w in v.items()}
+
+    @field_validator("position_stats")
+    @classmethod
+    def _position_stats(cls, v: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+        return {_check_pos(p): {_check_stat(k): w for k, w in ws.items()} for p, ws in v.items()}
+
+    @field_validator("position_multipliers")
+    @classmethod
+    def _position_multipliers(cls, v: Dict[str, float]) -> Dict[str, float]:
+        return {_check_pos(p): m for p, m in v.items()}
 
 class ScoringRules(BaseModel):
     league_size: int = 12
@@ -21,6 +76,9 @@ class ScoringRules(BaseModel):
     rec_yd: float = 0.1
     ppr: float = 0.5
     te_premium: float = 0.0
+    fumble_lost: float = -2.0
+    two_pt: float = 2.0
+    custom: Optional[ScoringSpec] = None   # bonuses, position multipliers, other stat weights
 
 class Player(BaseModel):
     player_id: int
@@ -0,0 +1,26 @@
+import os
+from typing import Optional
+
+from providers.base import Provider, FEED_KEYS, VOLATILE_FEEDS, complete_bundle
+
+
+def get_provider(name: Optional[str] = None) -> Provider:
+    """
+    Pick the data source by name (or FFL_PROVIDER): sportsdata (live, default),
+    fixture (replay recorded JSON from FFL_FIXTURE_DIR) or synthetic (generated pool).
+    """
+    name = (name or os.getenv("FFL_PROVIDER") or "sportsdata").lower()
+    if name == "sportsdata":
+        from providers.sportsdata import SportsDataProvider
+        return SportsDataProvider()
+    if name == "fixture":
+        from providers.fixture import FixtureProvider
+        return FixtureProvider(os.getenv("FFL_FIXTURE_DIR") or "fixtures")
+    if name == "synthetic":
+        from providers.synthetic import SyntheticProvider
+        return SyntheticProvider(
+            players=int(os.getenv("FFL_SYNTH_PLAYERS", "2500")),
+            teams=int(os.getenv("FFL_SYNTH_TEAMS", "32")),
+            seed=int(os.getenv("FFL_SYNTH_SEED", "7")),
+        )
+    raise ValueError(f"Unknown provider: {name}")
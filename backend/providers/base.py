@@ -0,0 +1,33 @@
+from typing import Any, Dict, Optional, Protocol, Sequence, runtime_checkable
+
+# Every provider returns one bundle with exactly these feeds (each a list of raw dicts,
+# SportsData.io field names). normalize_players() only ever sees this shape.
+FEED_KEYS = ("players", "byes", "depth", "projections", "season_stats", "injuries")
+# Feeds that move during a draft; fetch_volatile() returns just these (others come back [])
+VOLATILE_FEEDS = ("injuries", "depth", "projections")
+
+
+@runtime_checkable
+class Provider(Protocol):
+    name: str
+
+    async def fetch_all(self, season: Optional[int] = None, offline: Optional[bool] = None) -> Dict[str, Any]:
+        ...
+
+    async def fetch_volatile(
+        self,
+        season: Optional[int] = None,
+        offline: Optional[bool] = None,
+        feeds: Sequence[str] = VOLATILE_FEEDS,
+        revalidate: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Only `feeds` (subset of VOLATILE_FEEDS); revalidate=True skips cache TTLs and asks the origin.
+        A feed that could not be fetched is None; [] means the source answered with nothing.
+        """
+        ...
+
+
+def complete_bundle(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill in missing/None feeds with [] so downstream code never has to guard."""
+    return {k: (raw.get(k) or []) for k in FEED_KEYS}
@@ -0,0 +1,74 @@
+import os
+import sys
+import json
+import asyncio
+from typing import Any, Dict, Optional, Sequence
+
+from providers.base import FEED_KEYS, VOLATILE_FEEDS, complete_bundle
+
+
+class FixtureProvider:
+    """
+    Replays a recorded bundle from disk: <root>/<feed>.json for each feed in FEED_KEYS.
+    If <root>/<season>/ exists it wins, so one fixture dir can hold several seasons.
+    Missing feed files replay as [] (fetch_volatile: None, i.e. not fetched).
+    """
+    name = "fixture"
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _dir(self, season: Optional[int]) -> str:
+        if season is not None:
+            d = os.path.join(self.root, str(season))
+            if os.path.isdir(d):
+                return d
+        return self.root
+
+    async def fetch_all(self, season: Optional[int] = None, offline: Optional[bool] = None) -> Dict[str, Any]:
+        return self._load(season, FEED_KEYS)
+
+    async def fetch_volatile(
+        self,
+        season: Optional[int] = None,
+        offline: Optional[bool] = None,
+        feeds: Sequence[str] = VOLATILE_FEEDS,
+        revalidate: bool = False,
+    ) -> Dict[str, Any]:
+        # a missing feed file is "not fetched" (None), not an empty feed
+        return self._read(season, [f for f in VOLATILE_FEEDS if f in feeds])
+
+    def _load(self, season: Optional[int], keys) -> Dict[str, Any]:
+        return complete_bundle(self._read(season, keys))
+
+    def _read(self, season: Optional[int], keys) -> Dict[str, Any]:
+        d = self._dir(season)
+        if not os.path.isdir(d):
+            raise RuntimeError(f"Fixture directory not found: {d}")
+        raw: Dict[str, Any] = {}
+        for key in keys:
+            path = os.path.join(d, f"{key}.json")
+            raw[key] = None
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    raw[key] = json.load(f)
+        return raw
+
+
+def record_fixture(bundle: Dict[str, Any], root: str) -> None:
+    """Write a provider bundle out in the layout FixtureProvider replays."""
+    os.makedirs(root, exist_ok=True)
+    for key in FEED_KEYS:
+        with open(os.path.join(root, f"{key}.json"), "w", encoding="utf-8") as f:
+            json.dump(bundle.get(key) or [], f)
+
+
+if __name__ == "__main__":
+    # python -m providers.fixture <out_dir> [season] [provider]   (records from the live feed by default)
+    from providers import get_provider
+
+    out = sys.argv[1] if len(sys.argv) > 1 else "fixtures"
+    season = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    src = get_provider(sys.argv[3] if len(sys.argv) > 3 else "sportsdata")
+    record_fixture(asyncio.run(src.fetch_all(season)), out)
+    print(f"recorded {src.name} bundle -> {out}")
@@ -0,0 +1,99 @@
+import os
+import json
+import time
+import hashlib
+from typing import Any, Dict, Optional
+
+
+class CacheEntry:
+    __slots__ = ("url", "body", "etag", "last_modified", "fetched_at")
+
+    def __init__(self, url: str, body: bytes, etag: Optional[str], last_modified: Optional[str], fetched_at: float):
+        self.url = url
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at
+
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    def validators(self) -> Dict[str, str]:
+        """Headers for a conditional GET against the origin."""
+        h: Dict[str, str] = {}
+        if self.etag:
+            h["If-None-Match"] = self.etag
+        if self.last_modified:
+            h["If-Modified-Since"] = self.last_modified
+        return h
+
+
+class HttpCache:
+    """
+    Tiny on-disk response cache keyed by URL.
+    Each entry is two files: <sha1>.body (raw payload) and <sha1>.meta (validators + fetch time).
+    Writes go through a temp file + os.replace so a crash never leaves a torn entry.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _base(self, url: str) -> str:
+        return os.path.join(self.root, hashlib.sha1(url.encode("utf-8")).hexdigest())
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        base = self._base(url)
+        try:
+            with open(base + ".meta", "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(base + ".body", "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(
+            url=url,
+            body=body,
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            fetched_at=float(meta.get("fetched_at") or 0.0),
+        )
+
+    def put(self, url: str, body: bytes, headers: Any = None) -> CacheEntry:
+        headers = headers or {}
+        entry = CacheEntry(
+            url=url,
+            body=body,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            fetched_at=time.time(),
+        )
+        os.makedirs(self.root, exist_ok=True)
+        base = self._base(url)
+        self._write(base + ".body", body)
+        self._write_meta(base, entry)
+        return entry
+
+    def touch(self, entry: CacheEntry, headers: Any = None) -> CacheEntry:
+        """Origin said 304: keep the body, refresh fetch time (and validators if re-sent)."""
+        headers = headers or {}
+        entry.etag = headers.get("ETag") or entry.etag
+        entry.last_modified = headers.get("Last-Modified") or entry.last_modified
+        entry.fetched_at = time.time()
+        self._write_meta(self._base(entry.url), entry)
+        return entry
+
+    def _write_meta(self, base: str, entry: CacheEntry) -> None:
+        meta = {
+            "url": entry.url,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "fetched_at": entry.fetched_at,
+        }
+        self._write(base + ".meta", json.dumps(meta).encode("utf-8"))
+
+    @staticmethod
+    def _write(path: str, data: bytes) -> None:
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
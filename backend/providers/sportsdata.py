@@ -1,8 +1,15 @@
 import os
+import asyncio
+import random
+import contextvars
 import httpx
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence
 from dotenv import load_dotenv
 
+from providers.http_cache import HttpCache
+from logic.ingest import decode_feed
+from providers.base import VOLATILE_FEEDS
+
 load_dotenv()
 
 API_KEY = (
@@ -19,26 +26,182 @@ BASE_SCORES = f"{BASE}/scores/json"
 BASE_STATS  = f"{BASE}/stats/json"
 HEADERS = {"Ocp-Apim-Subscription-Key": API_KEY} if API_KEY else {}
 
+# ---- Transport tuning ----
+MAX_CONCURRENCY = int(os.getenv("SPORTSDATA_MAX_CONCURRENCY", "6"))
+MAX_RETRIES = int(os.getenv("SPORTSDATA_MAX_RETRIES", "3"))
+RETRY_BASE_DELAY = 0.5   # seconds, doubled per attempt
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# ---- Response cache ----
+# Per-feed freshness (seconds). Inside the TTL we never touch the network;
+# past it we revalidate with ETag / If-Modified-Since.
+FEED_TTLS: Dict[str, float] = {
+    "players": 6 * 3600,
+    "byes": 7 * 24 * 3600,
+    "depth": 3600,
+    "projections": 6 * 3600,
+    "season_stats": 7 * 24 * 3600,
+    "injuries": 15 * 60,
+}
+CACHE = HttpCache(
+    os.getenv("SPORTSDATA_CACHE_DIR")
+    or os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "sportsdata")
+)
+# Offline mode: serve only from cache (env default, overridable per fetch_all_data call)
+OFFLINE = os.getenv("SPORTSDATA_OFFLINE", "").lower() in ("1", "true", "yes")
+_offline: contextvars.ContextVar[bool] = contextvars.ContextVar("sportsdata_offline", default=OFFLINE)
+# Revalidate mode: ignore TTLs and always send a conditional GET (background refresh)
+_revalidate: contextvars.ContextVar[bool] = contextvars.ContextVar("sportsdata_revalidate", default=False)
+
+
+class OfflineCacheMiss(RuntimeError):
+    pass
+
+# One pooled client (and concurrency gate) per event loop, shared by every feed.
+_client: Optional[httpx.AsyncClient] = None
+_gate: Optional[asyncio.Semaphore] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# season -> URL that answered last time, so re-inits skip the 404 probing
+_PROJECTION_ROUTES: Dict[str, str] = {}
+_INJURY_ROUTES: Dict[str, str] = {}
+
 def _season_clean(s: str | int) -> str:
     s = str(s)
     return s.replace("REG", "").replace("POST", "").replace("PRE", "")
 
-async def _get(client: httpx.AsyncClient, url: str) -> Any:
-    r = await client.get(url, headers=HEADERS, timeout=30.0)
-    r.raise_for_status()
-    return r.json()
+def _get_client() -> httpx.AsyncClient:
+    global _client, _gate, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            headers=HEADERS,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=MAX_CONCURRENCY,
+                max_keepalive_connections=MAX_CONCURRENCY,
+            ),
+        )
+        _gate = asyncio.Semaphore(MAX_CONCURRENCY)
+        _client_loop = loop
+    return _client
+
+async def aclose() -> None:
+    """Close the shared client (called on app shutdown)."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
 
-async def _get_path(client: httpx.AsyncClient, path: str) -> Any:
-    url = f"{BASE}{path}"
-    r = await client.get(url, headers=HEADERS, timeout=30.0)
+def _retry_delay(attempt: int, r: Optional[httpx.Response] = None) -> float:
+    if r is not None:
+        try:
+            return min(30.0, float(r.headers.get("Retry-After", "")))
+        except ValueError:
+            pass
+    return RETRY_BASE_DELAY * (2 ** attempt) * (1.0 + random.random() * 0.25)
+
+async def _fetch(url: str, headers: Dict[str, str]) -> httpx.Response:
+    """
+    GET through the shared client. Retries 429/5xx and transport errors
+    with exponential backoff; the last response is returned as-is.
+    """
+    if not API_KEY:
+        raise RuntimeError("Missing SportsData.io API key (set SPORTSDATA_API_KEY).")
+    client = _get_client()
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            async with _gate:
+                r = await client.get(url, headers=headers)
+        except httpx.TransportError:
+            if attempt >= MAX_RETRIES:
+                raise
+            await asyncio.sleep(_retry_delay(attempt))
+            continue
+        if r.status_code in RETRY_STATUSES and attempt < MAX_RETRIES:
+            await asyncio.sleep(_retry_delay(attempt, r))
+            continue
+        return r
+
+async def _get(url: str, feed: str) -> Any:
+    """
+    Cached GET, decoded through the feed's streaming filter (logic.ingest) so
+    non-fantasy rows and unused fields are dropped before they pile up. Fresh entries (age < FEED_TTLS[feed]) are served from disk;
+    stale ones are revalidated (304 keeps the cached body). If the origin is
+    unreachable or erroring we fall back to the stale copy rather than fail.
+    """
+    entry = CACHE.get(url)
+    if _offline.get():
+        if entry is None:
+            raise OfflineCacheMiss(f"offline and not cached: {url}")
+        return decode_feed(feed, entry.body)
+    if entry is not None and not _revalidate.get() and entry.age() < FEED_TTLS.get(feed, 0.0):
+        return decode_feed(feed, entry.body)
+
+    try:
+        r = await _fetch(url, entry.validators() if entry else {})
+    except httpx.TransportError:
+        if entry is None:
+            raise
+        return decode_feed(feed, entry.body)
+
+    if r.status_code == 304 and entry is not None:
+        CACHE.touch(entry, r.headers)
+        return decode_feed(feed, entry.body)
+    if r.status_code >= 500 and entry is not None:
+        return decode_feed(feed, entry.body)
     r.raise_for_status()
-    return r.json()
+    CACHE.put(url, r.content, r.headers)
+    return decode_feed(feed, r.content)
+
+async def _first_ok(urls: List[str], feed: str, memo: Dict[str, str], key: str,
+                    want_list: bool = False, batch: int = 3) -> Optional[Any]:
+    """
+    Return the payload of the first URL (in priority order) that answers.
+    The remembered URL for `key` is tried alone first; otherwise the candidates
+    are probed `batch` at a time, in order, so a cold start sends at most one
+    batch past the winner; the rest of a batch is cancelled once a better URL answers.
+    """
+    known = memo.get(key)
+    if known:
+        try:
+            data = await _get(known, feed)
+            if not want_list or isinstance(data, list):
+                return data
+        except Exception:
+            pass
+        memo.pop(key, None)
+
+    for start in range(0, len(urls), max(1, batch)):
+        group = urls[start:start + max(1, batch)]
+        tasks = [asyncio.ensure_future(_get(u, feed)) for u in group]
+        try:
+            for url, task in zip(group, tasks):
+                try:
+                    data = await task
+                except Exception:
+                    continue
+                if want_list and not isinstance(data, list):
+                    continue
+                memo[key] = url
+                return data
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    return None
 
 async def fetch_player_projections(season: str | int) -> List[Dict[str, Any]]:
     """
     Try several valid projections routes + several season formats.
     Some accounts/seasons only exist as PRE or REG during August.
     """
+    data = await _projections(season)
+    # If nothing worked, return empty list (caller will fall back to season stats)
+    return data if isinstance(data, list) else []
+
+async def _projections(season: str | int) -> Optional[Any]:
+    """The first projections route that answers, or None if none did."""
     year = _season_clean(season)
     season_forms = [year, f"{year}REG", f"{year}PRE"]
     path_templates = [
@@ -46,64 +209,55 @@ async def fetch_player_projections(season: str | int) -> List[Dict[str, Any]]:
         "/projections/json/PlayerSeasonProjectionStatsWithADP/{s}",   # legacy alias, includes ADP
         "/projections/json/PlayerSeasonProjectedStats/{s}",           # fallback (no ADP)
     ]
+    urls = [f"{BASE}{tpl.format(s=s)}" for s in season_forms for tpl in path_templates]
 
-    errs: List[str] = []
-    async with httpx.AsyncClient() as client:
-        for s in season_forms:
-            for tpl in path_templates:
-                path = tpl.format(s=s)
-                try:
-                    data = await _get_path(client, path)
-                    return data if isinstance(data, list) else []
-                except httpx.HTTPStatusError as e:
-                    errs.append(f"{e.response.status_code} {path}")
-                    continue
-    # If nothing worked, return empty list (caller will fall back to season stats)
-    return []
+    # one batch per season form: the next form is only asked if every route of this one failed
+    return await _first_ok(urls, "projections", _PROJECTION_ROUTES, year, batch=len(path_templates))
 
 async def fetch_player_season_stats(season: int | str) -> List[Dict[str, Any]]:
     """
     Broadly-available season stats endpoint as a fallback when projections are unavailable.
     """
     year = int(_season_clean(season))
-    async with httpx.AsyncClient() as client:
-        url = f"{BASE_STATS}/PlayerSeasonStats/{year}"
-        try:
-            data = await _get(client, url)
-            return data if isinstance(data, list) else []
-        except Exception:
-            return []
+    try:
+        data = await _get(f"{BASE_STATS}/PlayerSeasonStats/{year}", "season_stats")
+        return data if isinstance(data, list) else []
+    except Exception:
+        return []
 
-async def fetch_injuries(season: int | str) -> List[Dict[str, Any]]:
+async def fetch_injuries(season: int | str) -> Optional[List[Dict[str, Any]]]:
+    """The injury report; [] if it lists nobody, None if no route answered."""
     year = _season_clean(season)
-    async with httpx.AsyncClient() as client:
-        for url in (f"{BASE_SCORES}/Injuries/{year}", f"{BASE_STATS}/Injuries/{year}"):
-            try:
-                data = await _get(client, url)
-                if isinstance(data, list):
-                    return data
-            except Exception:
-                continue
-    return []
-
-async def fetch_all_data(season: str) -> Dict[str, Any]:
+    urls = [f"{BASE_SCORES}/Injuries/{year}", f"{BASE_STATS}/Injuries/{year}"]
+    return await _first_ok(urls, "injuries", _INJURY_ROUTES, year, want_list=True)
+
+async def fetch_all_data(season: Optional[str | int] = None, offline: Optional[bool] = None) -> Dict[str, Any]:
     """
     Pull: players, byes, depth charts, projections (if available),
     injuries (best effort), and fallback season stats (prev year) if projections are empty.
+    All feeds go out concurrently over one pooled client, through the on-disk cache.
+    offline=True serves only from cache (no network at all).
     """
-    if not API_KEY:
+    token = _offline.set(OFFLINE if offline is None else offline)
+    try:
+        return await _fetch_all(season)
+    finally:
+        _offline.reset(token)
+
+async def _fetch_all(season: Optional[str | int]) -> Dict[str, Any]:
+    if not API_KEY and not _offline.get():
         raise RuntimeError("Missing SportsData.io API key (set SPORTSDATA_API_KEY).")
 
-    s = _season_clean(season)
+    s = _season_clean(season or os.getenv("SPORTSDATA_SEASON") or "2025")
     year = int(s)
 
-    async with httpx.AsyncClient() as client:
-        players = await _get(client, f"{BASE_SCORES}/PlayersByAvailable")
-        byes    = await _get(client, f"{BASE_SCORES}/Byes/{s}")
-        depth   = await _get(client, f"{BASE_SCORES}/DepthChartsAll")
-
-    projections = await fetch_player_projections(year)
-    injuries    = await fetch_injuries(year)
+    players, byes, depth, projections, injuries = await asyncio.gather(
+        _get(f"{BASE_SCORES}/PlayersByAvailable", "players"),
+        _get(f"{BASE_SCORES}/Byes/{s}", "byes"),
+        _get(f"{BASE_SCORES}/DepthChartsAll", "depth"),
+        fetch_player_projections(year),
+        fetch_injuries(year),
+    )
 
     # If projections are missing (404s), fall back to last season stats
     season_stats = []
@@ -118,3 +272,59 @@ async def fetch_all_data(season: str) -> Dict[str, Any]:
         "season_stats": season_stats or [],  # NEW: used as a fallback in util.normalize_players
         "injuries": injuries or [],
     }
+
+
+async def _feed_or_none(job) -> Optional[List[Dict[str, Any]]]:
+    """A volatile feed's rows, or None if it failed (an error, or no route answered with a list)."""
+    try:
+        data = await job
+    except Exception:
+        return None
+    return data if isinstance(data, list) else None
+
+
+async def fetch_volatile_data(
+    season: Optional[str | int] = None,
+    offline: Optional[bool] = None,
+    feeds: Sequence[str] = VOLATILE_FEEDS,
+    revalidate: bool = False,
+) -> Dict[str, Any]:
+    """
+    Just the feeds that move mid-draft (any of depth, projections (+ADP), injuries).
+    A feed that failed (offline cache miss, transport error, no route answered) is None,
+    as opposed to [] for a feed that answered with nothing; the others still come back.
+    revalidate=True bypasses the TTLs: every feed is a conditional GET, so unchanged
+    feeds cost a 304 and no download.
+    """
+    token = _offline.set(OFFLINE if offline is None else offline)
+    rtoken = _revalidate.set(revalidate)
+    try:
+        year = int(_season_clean(season or os.getenv("SPORTSDATA_SEASON") or "2025"))
+        jobs = {
+            "depth": lambda: _get(f"{BASE_SCORES}/DepthChartsAll", "depth"),
+            "projections": lambda: _projections(year),
+            "injuries": lambda: fetch_injuries(year),
+        }
+        wanted = [f for f in VOLATILE_FEEDS if f in feeds]
+        results = await asyncio.gather(*(_feed_or_none(jobs[f]()) for f in wanted))
+        return dict(zip(wanted, results))
+    finally:
+        _revalidate.reset(rtoken)
+        _offline.reset(token)
+
+
+class SportsDataProvider:
+    """Provider-protocol wrapper around the live SportsData.io feeds."""
+    name = "sportsdata"
+
+    async def fetch_all(self, season: Optional[int] = None, offline: Optional[bool] = None) -> Dict[str, Any]:
+        return await fetch_all_data(season, offline=offline)
+
+    async def fetch_volatile(
+        self,
+        season: Optional[int] = None,
+        offline: Optional[bool] = None,
+        feeds: Sequence[str] = VOLATILE_FEEDS,
+        revalidate: bool = False,
+    ) -> Dict[str, Any]:
+        return await fetch_volatile_data(season, offline=offline, feeds=feeds, revalidate=revalidate)
@@ -0,0 +1,164 @@
+import random
+from typing import Any, Dict, List, Optional, Sequence
+
+from providers.base import VOLATILE_FEEDS, complete_bundle
+
+NFL_TEAMS = [
+    "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE", "DAL", "DEN", "DET", "GB",
+    "HOU", "IND", "JAX", "KC", "LAC", "LAR", "LV", "MIA", "MIN", "NE", "NO", "NYG",
+    "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WAS",
+]
+FIRST = ["James", "Michael", "Chris", "David", "Justin", "Tyler", "Josh", "Jalen", "Derrick", "Amon-Ra",
+         "Travis", "Davante", "Saquon", "Patrick", "Lamar", "CeeDee", "Ja'Marr", "Breece", "Kenneth", "Tony"]
+LAST = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Miller", "Davis", "Moore", "Jackson", "Allen",
+        "Hill", "St. Brown", "Kelce", "Adams", "Barkley", "Mahomes", "Lamb", "Chase", "Hall", "Walker"]
+
+# Share of a team's roster by position (real PlayersByAvailable is roughly 1/3 fantasy-relevant)
+ROSTER_SHARE = {
+    "QB": 0.05, "RB": 0.08, "WR": 0.11, "TE": 0.06, "K": 0.02, "DST": 0.01,
+    "OL": 0.17, "DL": 0.14, "LB": 0.12, "CB": 0.13, "S": 0.09, "P": 0.01, "LS": 0.01,
+}
+INJURY_STATUSES = ["Questionable", "Questionable", "Doubtful", "Out", "IR", "PUP"]
+
+
+def _n(rng: random.Random, mu: float, sd: float) -> float:
+    return max(0.0, rng.gauss(mu, sd))
+
+
+def _statline(rng: random.Random, pos: str, depth: int) -> Dict[str, float]:
+    """Season projection with a starter-vs-backup falloff (0.5x per depth slot)."""
+    f = 0.5 ** (depth - 1)
+    s: Dict[str, float] = {}
+    if pos == "QB":
+        f = f * 0.4 if depth > 1 else 1.0
+        att = _n(rng, 560, 50) * f
+        s.update(PassingYards=att * rng.uniform(6.4, 8.0), PassingTouchdowns=_n(rng, 25, 6) * f,
+                 Interceptions=_n(rng, 11, 3) * f, RushingYards=_n(rng, 250, 180) * f,
+                 RushingTouchdowns=_n(rng, 2.5, 2) * f, FumblesLost=_n(rng, 3, 1.5) * f)
+    elif pos == "RB":
+        rush = _n(rng, 210, 60) * f
+        rec = _n(rng, 38, 16) * f
+        s.update(RushingYards=rush * rng.uniform(3.8, 5.0), RushingTouchdowns=_n(rng, 7, 3) * f,
+                 Receptions=rec, ReceivingYards=rec * rng.uniform(6.5, 9.0),
+                 ReceivingTouchdowns=_n(rng, 1.5, 1) * f, FumblesLost=_n(rng, 1.2, 0.6) * f)
+    elif pos in ("WR", "TE"):
+        base = 80 if pos == "WR" else 58
+        rec = _n(rng, base, 16) * (0.72 ** (depth - 1))
+        s.update(Receptions=rec, ReceivingYards=rec * rng.uniform(10.5, 14.5),
+                 ReceivingTouchdowns=_n(rng, 6 if pos == "WR" else 5, 2.5) * (0.72 ** (depth - 1)),
+                 RushingYards=_n(rng, 25, 30) * f if pos == "WR" else 0.0, FumblesLost=_n(rng, 0.8, 0.4) * f)
+    s["TwoPointConversionReceptions"] = _n(rng, 0.5, 0.5) * f if pos in ("RB", "WR", "TE") else 0.0
+    return {k: round(v, 1) for k, v in s.items()}
+
+
+def _ppr(s: Dict[str, float]) -> float:
+    return (
+        s.get("PassingYards", 0) * 0.04 + s.get("PassingTouchdowns", 0) * 4 + s.get("Interceptions", 0) * -2
+        + s.get("RushingYards", 0) * 0.1 + s.get("RushingTouchdowns", 0) * 6
+        + s.get("Receptions", 0) * 1.0 + s.get("ReceivingYards", 0) * 0.1
+        + s.get("ReceivingTouchdowns", 0) * 6 - s.get("FumblesLost", 0) * 2
+    )
+
+
+def generate_bundle(players: int = 2500, teams: int = 32, seed: int = 7, season: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Build a provider bundle of ~`players` players spread over `teams` teams, in SportsData.io
+    field names. Deterministic for a given seed so benchmarks are comparable run to run.
+    """
+    rng = random.Random(seed)
+    abbrs = [NFL_TEAMS[i] if i < len(NFL_TEAMS) else f"T{i + 1:02d}" for i in range(teams)]
+    per_team = max(len(ROSTER_SHARE), players // max(1, teams))
+
+    raw_players: List[Dict[str, Any]] = []
+    depth: List[Dict[str, Any]] = []
+    projections: List[Dict[str, Any]] = []
+    injuries: List[Dict[str, Any]] = []
+    byes = [{"Team": t, "ByeWeek": rng.randint(5, 14), "Season": season} for t in abbrs]
+
+    pid = 10000
+    for team in abbrs:
+        for pos, share in ROSTER_SHARE.items():
+            n_pos = 1 if pos in ("DST", "K", "P", "LS") else max(1, round(per_team * share))
+            for d in range(1, n_pos + 1):
+                pid += 1
+                age = int(min(38, max(21, rng.gauss(26.5, 3.2))))
+                first, last = rng.choice(FIRST), rng.choice(LAST)
+                name = f"{team} Defense" if pos == "DST" else f"{first} {last}"
+                raw_players.append({
+                    "PlayerID": pid, "Name": name, "FirstName": first, "LastName": last,
+                    "Position": pos, "Team": team, "Age": age,
+                    "Experience": max(0, age - 22 + rng.randint(-1, 1)), "Status": "Active",
+                })
+                depth.append({"PlayerID": pid, "Team": team, "Position": pos, "DepthOrder": d})
+                if pos not in ("QB", "RB", "WR", "TE", "K", "DST"):
+                    continue
+                if pos in ("K", "DST"):
+                    proj: Dict[str, Any] = {"FantasyPoints": round(_n(rng, 125 if pos == "K" else 110, 18), 1)}
+                else:
+                    proj = _statline(rng, pos, d)
+                    proj["FantasyPointsPPR"] = round(_ppr(proj), 1)
+                proj.update(PlayerID=pid, Name=name, Team=team, Position=pos)
+                projections.append(proj)
+                if rng.random() < 0.08:
+                    injuries.append({"PlayerID": pid, "Name": name, "Team": team, "Position": pos,
+                                     "Status": rng.choice(INJURY_STATUSES), "BodyPart": "Undisclosed"})
+
+    # ADP for the draftable top of the pool: rank by points, with noise that widens down the board
+    projections.sort(key=lambda r: -(r.get("FantasyPointsPPR") or r.get("FantasyPoints") or 0.0))
+    for rank, proj in enumerate(projections[: 10 * teams], start=1):
+        proj["AverageDraftPositionPPR"] = round(max(1.0, rng.gauss(rank, 2.0 + rank * 0.12)), 1)
+
+    return complete_bundle({
+        "players": raw_players,
+        "byes": byes,
+        "depth": depth,
+        "projections": projections,
+        "injuries": injuries,
+    })
+
+
+class SyntheticProvider:
+    """Generated N players x M teams pool — no API key, no network (benchmarks / load tests)."""
+    name = "synthetic"
+
+    def __init__(self, players: int = 2500, teams: int = 32, seed: int = 7, drift: float = 0.02):
+        self.players = players
+        self.teams = teams
+        self.seed = seed
+        self.drift = drift     # share of players whose injury/depth/projection moves per volatile fetch
+        self._ticks = 0
+
+    async def fetch_all(self, season: Optional[int] = None, offline: Optional[bool] = None) -> Dict[str, Any]:
+        return generate_bundle(self.players, self.teams, self.seed, season)
+
+    async def fetch_volatile(
+        self,
+        season: Optional[int] = None,
+        offline: Optional[bool] = None,
+        feeds: Sequence[str] = VOLATILE_FEEDS,
+        revalidate: bool = False,
+    ) -> Dict[str, Any]:
+        """Same pool, with a seeded `drift` share of players re-rolled each call (simulates news)."""
+        self._ticks += 1
+        raw = generate_bundle(self.players, self.teams, self.seed, season)
+        rng = random.Random(self.seed * 1000003 + self._ticks)
+        injured = {r["PlayerID"]: r for r in raw["injuries"]}
+        depth = {r["PlayerID"]: r for r in raw["depth"]}
+        for proj in raw["projections"]:
+            if rng.random() >= self.drift:
+                continue
+            pid = proj["PlayerID"]
+            roll = rng.random()
+            if roll < 0.4:
+                if pid in injured:
+                    del injured[pid]
+                else:
+                    injured[pid] = {"PlayerID": pid, "Position": proj.get("Position"),
+                                    "Status": rng.choice(INJURY_STATUSES)}
+            elif roll < 0.6 and pid in depth:
+                depth[pid]["DepthOrder"] = max(1, depth[pid]["DepthOrder"] + rng.choice((-1, 1)))
+            else:
+                key = "FantasyPointsPPR" if "FantasyPointsPPR" in proj else "FantasyPoints"
+                proj[key] = round(proj[key] * rng.uniform(0.85, 1.1), 1)
+        out = {"injuries": list(injured.values()), "depth": list(depth.values()), "projections": raw["projections"]}
+        return {f: out[f] for f in VOLATILE_FEEDS if f in feeds}
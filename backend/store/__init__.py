@@ -0,0 +1 @@
+from store.table import PlayerTable, PlayerView, POSITIONS, STAT_COLUMNS
@@ -0,0 +1,119 @@
+import json
+import asyncio
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+
+def suggestion_delta(old: List[Dict[str, Any]], new: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Rows from the first position where the ranking differs (by player id) to the end.
+    The untouched head of the list is not resent: {"from": k, "rows": new[k:], "size": len(new)}.
+    """
+    k = 0
+    for a, b in zip(old, new):
+        if a["player"]["player_id"] != b["player"]["player_id"]:
+            break
+        k += 1
+    return {"from": k, "rows": new[k:], "size": len(new)}
+
+
+class EventHub:
+    """
+    Fan-out of draft events to push subscribers (WebSocket / SSE).
+
+    - version: monotonically increasing state version, bumped once per published event
+    - each event is serialized once and handed to every subscriber queue
+    - the last `backlog` events are kept so a reconnecting client can resume from the
+      version it last saw; older than that and it gets a "reset" (full reload)
+
+    Publishers may run in worker threads (sync endpoints); delivery hops onto each
+    subscriber's event loop with call_soon_threadsafe.
+    """
+
+    def __init__(self, backlog: int = 256, queue_size: int = 512):
+        self.version = 0
+        self.queue_size = queue_size
+        self.lock = threading.RLock()
+        self._recent: Deque[Tuple[int, str]] = deque(maxlen=backlog)
+        self._subs: Dict[asyncio.Queue, asyncio.AbstractEventLoop] = {}
+        self.last_suggest: List[Dict[str, Any]] = []
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subs)
+
+    # ---- Publish ----
+    def publish(
+        self,
+        kind: str,
+        build: Optional[Callable[[], Dict[str, Any]]] = None,
+        version: Optional[int] = None,
+        **payload: Any,
+    ) -> int:
+        """
+        Bump the version and broadcast {"v", "type", **payload, **build()}.
+        `build` runs under the hub lock only when someone is listening, so expensive
+        deltas (suggestions) are skipped when nobody would receive them.
+        `version` jumps ahead to a version assigned elsewhere (another worker's change).
+        """
+        with self.lock:
+            self.version = max(self.version + 1, version or 0)
+            msg: Dict[str, Any] = {"v": self.version, "type": kind, **payload}
+            if build is not None and self._subs:
+                msg.update(build())
+            elif build is not None:
+                # nobody saw this change, so there is no delta base any more
+                self.last_suggest = []
+            item = (self.version, json.dumps(msg, separators=(",", ":")))
+            self._recent.append(item)
+            for q, loop in list(self._subs.items()):
+                try:
+                    loop.call_soon_threadsafe(self._offer, q, item)
+                except RuntimeError:  # subscriber's loop is gone
+                    self._subs.pop(q, None)
+            return self.version
+
+    def advance(self, version: int) -> None:
+        """Move the version up to `version` without an event (changes that needed no push)."""
+        with self.lock:
+            self.version = max(self.version, version)
+
+    def _offer(self, q: asyncio.Queue, item: Tuple[int, str]) -> None:
+        try:
+            q.put_nowait(item)
+        except asyncio.QueueFull:
+            # too far behind: cut it off (None = close); the client resumes from its last version
+            self._subs.pop(q, None)
+            while not q.empty():
+                q.get_nowait()
+            q.put_nowait(None)
+
+    # ---- Subscribe ----
+    def subscribe(self, since: Optional[int] = None) -> Tuple[asyncio.Queue, List[Tuple[int, str]]]:
+        """
+        Register a queue on the running loop. Returns it plus the (version, json) messages
+        to send first: the backlog after `since`, or a hello/reset carrying the current version.
+        Queue items are (version, json); None means the hub cut the subscriber off.
+        """
+        q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        with self.lock:
+            first: List[Tuple[int, str]]
+            if since is not None and since == self.version:
+                first = []
+            elif since is not None and self._recent and self._recent[0][0] <= since + 1 and since < self.version:
+                first = [item for item in self._recent if item[0] > since]
+            else:
+                first = [self._notice("hello" if since is None else "reset")]
+            self._subs[q] = asyncio.get_running_loop()
+        return q, first
+
+    def unsubscribe(self, q: asyncio.Queue) -> None:
+        with self.lock:
+            self._subs.pop(q, None)
+
+    def ping(self) -> Tuple[int, str]:
+        return self._notice("ping")
+
+    def _notice(self, kind: str) -> Tuple[int, str]:
+        return self.version, json.dumps({"v": self.version, "type": kind}, separators=(",", ":"))
@@ -0,0 +1,100 @@
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from store.table import PlayerTable, POSITIONS
+
+
+class DraftIndex:
+    """
+    Undrafted/drafted bookkeeping for one draft over a PlayerTable.
+
+    - available: bool mask over catalog rows (True = still on the board)
+    - drafted:   pid -> teamName, in pick order
+    - by_team:   teamName -> {pid: None}, in pick order (dict as an ordered set)
+
+    The sorted per-position orders live on the catalog (PlayerTable.order) and are
+    shared; draft/undraft only flip a mask bit and touch two dicts (O(1)). Reading
+    "top N undrafted RBs" walks the shared order skipping drafted rows, so it costs
+    N + (drafted players ranked above them) instead of a scan + sort of the catalog.
+    """
+
+    def __init__(self, table: PlayerTable):
+        self.available = np.ones(len(table), dtype=bool)
+        self.remaining = len(table)
+        self.remaining_by_pos: Dict[str, int] = {p: 0 for p in POSITIONS}
+        for code, n in zip(*np.unique(table.pos[table.pos >= 0], return_counts=True)):
+            self.remaining_by_pos[POSITIONS[int(code)]] = int(n)
+        self.drafted: Dict[int, str] = {}
+        self.by_team: Dict[str, Dict[int, None]] = {}
+
+    @classmethod
+    def from_picks(cls, table: PlayerTable, drafted: Dict[int, str]) -> "DraftIndex":
+        """Rebuild from pid -> teamName picks (in pick order), e.g. after a catalog rebuild or reload."""
+        idx = cls(table)
+        for pid, team_name in drafted.items():
+            if not idx.draft(table, pid, team_name):
+                # player gone from the catalog: keep the pick so rosters stay complete
+                idx.drafted[pid] = team_name
+                idx.by_team.setdefault(team_name, {})[pid] = None
+        return idx
+
+    # ---- Mutations ----
+    def draft(self, table: PlayerTable, pid: int, team_name: str) -> bool:
+        i = table.row_of(pid)
+        if i is None or not self.available[i]:
+            return False
+        self.available[i] = False
+        self.remaining -= 1
+        pos = table.position_of(i)
+        if pos in self.remaining_by_pos:
+            self.remaining_by_pos[pos] -= 1
+        self.drafted[pid] = team_name
+        self.by_team.setdefault(team_name, {})[pid] = None
+        return True
+
+    def undraft(self, table: PlayerTable, pid: int) -> bool:
+        team_name = self.drafted.pop(pid, None)
+        if team_name is None:
+            return False
+        roster = self.by_team.get(team_name)
+        if roster is not None:
+            roster.pop(pid, None)
+            if not roster:
+                del self.by_team[team_name]
+        i = table.row_of(pid)
+        if i is not None and not self.available[i]:
+            self.available[i] = True
+            self.remaining += 1
+            pos = table.position_of(i)
+            if pos in self.remaining_by_pos:
+                self.remaining_by_pos[pos] += 1
+        return True
+
+    # ---- Reads ----
+    def is_available(self, table: PlayerTable, pid: int) -> bool:
+        i = table.row_of(pid)
+        return i is not None and bool(self.available[i])
+
+    def iter_rows(self, table: PlayerTable, pos: Optional[str] = None, start: int = 0, chunk: int = 256) -> Iterator[int]:
+        """
+        Undrafted rows in board order (projection desc, ADP asc, name); all rows if nothing is left.
+        `start` skips that many entries of the board order. Walks the order a chunk at a time,
+        so a caller that stops early (one page) never touches the rest of the board.
+        """
+        order = table.order(pos)
+        avail = self.available if self.remaining else None
+        for s in range(max(0, start), len(order), chunk):
+            part = order[s:s + chunk]
+            if avail is not None:
+                part = part[avail[part]]
+            yield from part.tolist()
+
+    def rows(self, table: PlayerTable, pos: Optional[str] = None) -> np.ndarray:
+        order = table.order(pos)
+        if not self.remaining:
+            return order
+        return order[self.available[order]]
+
+    def team_rows(self, table: PlayerTable, team_name: str) -> List[int]:
+        return [table.index[pid] for pid in self.by_team.get(team_name, {}) if pid in table.index]
@@ -0,0 +1,153 @@
+import os
+import json
+import time
+from contextlib import nullcontext
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def replay(state: Dict[str, Any], events: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Apply logged events on top of a snapshot state (DraftSession.to_state shape).
+    Works on plain dicts and player ids only, so it needs no catalog.
+    """
+    drafted: Dict[int, str] = {int(pid): team for pid, team in state.get("drafted", [])}
+    history: List[Dict[str, Any]] = list(state.get("history", []))
+    for ev in events:
+        t = ev.get("t")
+        entry = {k: v for k, v in ev.items() if k != "v"}
+        if t == "draft":
+            if ev["pid"] not in drafted:
+                drafted[ev["pid"]] = ev["teamName"]
+                history.append(entry)
+        elif t == "bulk":
+            for pick in ev["picks"]:
+                if pick["pid"] not in drafted:
+                    drafted[pick["pid"]] = pick["teamName"]
+                    history.append(pick)
+        elif t == "undraft":
+            if drafted.pop(ev["pid"], None) is not None:
+                history.append(entry)
+        elif t in ("rules", "context", "strategy", "opponents"):
+            state[t] = ev[t]
+        elif t == "reset":
+            drafted = {}
+        if "catalog" in ev:
+            state["catalog"] = ev["catalog"]
+        state["version"] = max(int(state.get("version", 0)), int(ev.get("v", 0)))
+    state["drafted"] = [[pid, team] for pid, team in drafted.items()]
+    state["history"] = history
+    return state
+
+
+class DraftJournal:
+    """
+    Crash safety for one draft: an append-only JSON-lines event log plus a snapshot.
+
+    - append(): one line per state change, flushed to the OS right away (survives a
+      process crash); fsync is batched every `fsync_every` events / `fsync_seconds`
+    - snapshot(): atomically replace <id>.json with the full state, then start a new log,
+      so recovery = load snapshot + replay at most `snapshot_every` events
+    Log lines at or below the snapshot's version are skipped, so a crash between the
+    snapshot and the log truncation is harmless; a torn last line is cut off on recovery.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        draft_id: str,
+        snapshot_every: int = 50,
+        fsync_every: int = 8,
+        fsync_seconds: float = 1.0,
+    ):
+        self.root = root
+        self.snapshot_path = os.path.join(root, f"{draft_id}.json")
+        self.log_path = os.path.join(root, f"{draft_id}.log")
+        self.snapshot_every = max(1, snapshot_every)
+        self.fsync_every = max(1, fsync_every)
+        self.fsync_seconds = fsync_seconds
+        self.since_snapshot = 0
+        self._f = None
+        self._unsynced = 0
+        self._synced_at = time.monotonic()
+
+    # ---- Write ----
+    def append(self, version: int, event: Dict[str, Any]) -> None:
+        if self._f is None:
+            os.makedirs(self.root, exist_ok=True)
+            self._f = open(self.log_path, "a", encoding="utf-8")
+        self._f.write(json.dumps({"v": version, **event}, separators=(",", ":")) + "\n")
+        self._f.flush()
+        self._unsynced += 1
+        self.since_snapshot += 1
+        if self._unsynced >= self.fsync_every or time.monotonic() - self._synced_at >= self.fsync_seconds:
+            self.sync()
+
+    def sync(self) -> None:
+        if self._f is not None and self._unsynced:
+            os.fsync(self._f.fileno())
+        self._unsynced = 0
+        self._synced_at = time.monotonic()
+
+    def due(self) -> bool:
+        return self.since_snapshot >= self.snapshot_every
+
+    def transaction(self):
+        # one process owns the files, so the session lock is all the isolation needed
+        return nullcontext()
+
+    def snapshot(self, state: Dict[str, Any]) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        tmp = f"{self.snapshot_path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.snapshot_path)
+        # everything in the log is now covered by the snapshot
+        self.close()
+        open(self.log_path, "w").close()
+        self.since_snapshot = 0
+
+    def close(self) -> None:
+        if self._f is not None:
+            self.sync()
+            self._f.close()
+            self._f = None
+
+    # ---- Recover ----
+    def changes(self, version: int) -> None:
+        """Nothing: this process is the only writer (see SharedJournal for the multi-worker case)."""
+        return None
+
+    def recover(self) -> Optional[Tuple[Dict[str, Any], int]]:
+        """(snapshot state with the log tail replayed, events replayed), or None if there is nothing."""
+        state: Optional[Dict[str, Any]] = None
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            pass
+        base = int((state or {}).get("version", 0))
+        tail: List[Dict[str, Any]] = []
+        try:
+            with open(self.log_path, "rb+") as f:
+                good = 0
+                for line in f:
+                    try:
+                        ev = json.loads(line)
+                    except ValueError:
+                        ev = None
+                    if ev is None or not line.endswith(b"\n"):
+                        # torn write at the end of the log: cut it so new appends start clean
+                        f.truncate(good)
+                        break
+                    good += len(line)
+                    if int(ev.get("v", 0)) > base:
+                        tail.append(ev)
+        except OSError:
+            pass
+        if state is None and not tail:
+            return None
+        state = replay(state or {}, tail)
+        self.since_snapshot = len(tail)
+        return state, len(tail)
@@ -0,0 +1,102 @@
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from models import ScoringRules
+from store.table import PlayerTable
+from logic.engine_v2.reproject import reproject_matrix, reproject_points
+
+
+class ProjectionCache:
+    """
+    League-scored projections (reproject_points) for a whole catalog, computed once per
+    (catalog version, ScoringRules hash) and kept as {player_id: points}.
+    A catalog version is a PlayerTable object (refresh swaps in a new one), so entries
+    are held weakly per table and vanish with it, along with the rules they were scored under.
+
+    - get() returns the mapping, computing it (or waiting for a background run) if needed
+    - prime() starts the computation in the background (e.g. right after a rules change)
+    - carry() moves cached rulesets onto a refreshed table, re-scoring only changed players
+    Only the last `keep` rulesets per table are kept.
+    """
+
+    def __init__(self, keep: int = 4):
+        self.keep = max(1, keep)
+        # table -> rules hash -> (rules, points); carry() re-scores from the stored rules
+        self._done: "weakref.WeakKeyDictionary[PlayerTable, OrderedDict[str, Tuple[Dict[str, Any], Dict[int, float]]]]" = weakref.WeakKeyDictionary()
+        self._running: Dict[Tuple[int, str], Future] = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reproject")
+
+    @staticmethod
+    def compute(table: PlayerTable, rules: Dict[str, Any], rows: Optional[Iterable[int]] = None) -> Dict[int, float]:
+        views = table.views(rows)
+        pts = reproject_points(views, ScoringRules(**rules))
+        return {p.player_id: v for p, v in zip(views, pts)}
+
+    def _store(self, table: PlayerTable, rules_hash: str, rules: Dict[str, Any], points: Dict[int, float]) -> None:
+        per = self._done.get(table)
+        if per is None:
+            per = self._done[table] = OrderedDict()
+        per[rules_hash] = (rules, points)
+        per.move_to_end(rules_hash)
+        while len(per) > self.keep:
+            per.popitem(last=False)
+
+    def _submit(self, table: PlayerTable, rules_hash: str, rules: Dict[str, Any]) -> Future:
+        """Caller holds the lock."""
+        key = (id(table), rules_hash)
+        fut = self._running.get(key)
+        if fut is None:
+            def run() -> Dict[int, float]:
+                try:
+                    points = self.compute(table, rules)
+                    with self._lock:
+                        self._store(table, rules_hash, rules, points)
+                    return points
+                finally:
+                    with self._lock:
+                        self._running.pop(key, None)
+
+            fut = self._running[key] = self._pool.submit(run)
+        return fut
+
+    def _cached(self, table: PlayerTable, rules_hash: str) -> Optional[Dict[int, float]]:
+        per = self._done.get(table)
+        if per is None or rules_hash not in per:
+            return None
+        per.move_to_end(rules_hash)
+        return per[rules_hash][1]
+
+    def prime(self, table: PlayerTable, rules_hash: str, rules: Dict[str, Any]) -> None:
+        with self._lock:
+            if self._cached(table, rules_hash) is None:
+                self._submit(table, rules_hash, rules)
+
+    def get(self, table: PlayerTable, rules_hash: str, rules: Dict[str, Any]) -> Dict[int, float]:
+        with self._lock:
+            points = self._cached(table, rules_hash)
+            if points is not None:
+                return points
+            fut = self._submit(table, rules_hash, rules)
+        return fut.result()
+
+    def carry(self, old: PlayerTable, new: PlayerTable, changed: Iterable[int]) -> None:
+        """After a refresh: copy each cached ruleset to the new table, re-scoring only `changed` pids."""
+        rows = new.rows_of(changed)
+        with self._lock:
+            per = self._done.get(old)
+            old_sets = list(per.items()) if per else []
+        if not old_sets:
+            return
+        # every cached ruleset re-scored in one (changed players x rulesets) product
+        views = new.views(rows)
+        fresh = reproject_matrix(views, [ScoringRules(**rules) for _, (rules, _) in old_sets])
+        pids = [p.player_id for p in views]
+        for j, (h, (rules, pts)) in enumerate(old_sets):
+            points = dict(pts)
+            points.update(zip(pids, fresh[:, j].tolist()))
+            with self._lock:
+                self._store(new, h, rules, points)
@@ -0,0 +1,60 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+class RefreshScheduler:
+    """
+    Background poller for the volatile feeds, run on the app's event loop.
+    Every `interval` seconds it awaits `tick()` (which fetches, builds the patched
+    catalog off to the side and swaps it in); failures are recorded, never raised.
+    """
+
+    def __init__(self, tick: Callable[[], Awaitable[List[int]]], interval: float):
+        self.tick = tick
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.last_run: Optional[float] = None
+        self.last_changed = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval > 0
+
+    def start(self) -> None:
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._run(), name="feed-refresh")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                changed = await self.tick()
+                self.last_changed = len(changed)
+                self.last_error = None
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+                print("background refresh failed:", self.last_error)
+            self.runs += 1
+            self.last_run = time.time()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "interval": self.interval,
+            "runs": self.runs,
+            "last_run": self.last_run,
+            "last_changed": self.last_changed,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,396 @@
+import os
+import re
+import json
+import time
+import hashlib
+import contextlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from models import ScoringRules, LeagueContext, StrategyProfile
+from store.table import PlayerTable
+from store.indexes import DraftIndex
+from store.events import EventHub
+from store.journal import DraftJournal
+from store.projections import ProjectionCache
+from store.suggestions import SuggestionCache
+from store.shared import SharedState, SharedJournal
+from logic.search import SearchIndex
+from logic.engine_v2.state import EngineState
+
+DEFAULT_DRAFT = "default"
+_DRAFT_ID = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+
+
+def catalog_key(season: Optional[int]) -> str:
+    return str(season) if season else "default"
+
+
+def settings_hash(*parts: Dict[str, Any]) -> str:
+    """Short stable hash of settings dicts (rules/context/strategy)."""
+    blob = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:12]
+
+
+class Catalog:
+    """
+    One season's player catalog + search index, shared read-only by every draft on it.
+    Refresh swaps `table` for a patched copy (same rows); a re-init rebuilds it and bumps
+    `gen`, which tells sessions their row-indexed draft state must be rebuilt.
+    `rev` bumps on either, so it identifies the catalog content (ETags).
+    `projections` caches league-scored points per (table, rules hash) for the engine.
+    """
+
+    def __init__(self, key: str, table: Optional[PlayerTable] = None, source: Any = None, season: Optional[int] = None):
+        self.key = key
+        self.source = source      # provider the catalog was built from (refresh re-uses it)
+        self.season = season
+        self.gen = 0
+        self.rev = 0
+        self.table = PlayerTable()
+        self.search = SearchIndex(self.table)
+        self.projections = ProjectionCache()
+        if table is not None:
+            self.rebuild(table)
+
+    def rebuild(self, table: PlayerTable) -> None:
+        self.table = table
+        self.search = SearchIndex(table)
+        self.gen += 1
+        self.rev += 1
+
+    def swap(self, table: PlayerTable) -> None:
+        """Install a patched copy of the current table (same rows, so draft state stays valid)."""
+        self.table = table
+        self.rev += 1
+
+    def adopt(self, table: PlayerTable, gen: int, rev: int) -> None:
+        """Take over a table another worker published (shared state) at its gen/rev."""
+        if gen != self.gen:
+            self.search = SearchIndex(table)
+        self.table = table
+        self.gen, self.rev = gen, rev
+
+    def points(self, table: PlayerTable, rules: Dict[str, Any]) -> Dict[int, float]:
+        """player_id -> projected points under `rules` for this table (cached; computed once per ruleset)."""
+        return self.projections.get(table, settings_hash(rules), rules)
+
+
+class DraftSession:
+    """
+    Everything one draft owns: picks (DraftIndex over the shared catalog), history,
+    rules/context/strategy/opponents and its push channel. A few KB on top of the
+    catalog: the availability mask is one byte per catalog row, the rest is picks.
+    """
+
+    def __init__(self, draft_id: str, catalog: Catalog, journal: Optional[DraftJournal] = None):
+        self.draft_id = draft_id
+        self.journal = journal
+        self.catalog = catalog
+        self.gen = catalog.gen
+        self.index = DraftIndex(catalog.table)
+        self.history: List[Dict[str, Any]] = []
+        self.rules: Dict[str, Any] = ScoringRules().dict()
+        self.context: Dict[str, Any] = LeagueContext().dict()
+        self.strategy: Dict[str, Any] = StrategyProfile().dict()
+        self.opponents: Dict[str, Dict[str, int]] = {}
+        self.engine: Optional[EngineState] = None   # suggest_v2 boards, rebuilt lazily by the app
+        self.suggested = SuggestionCache()            # engine output per state version (app._suggestions)
+        self.events = EventHub(backlog=64)
+        self.synced = 0      # version of the last journaled change this session reflects
+        self.touched = time.monotonic()
+        self.lock = threading.RLock()
+
+    def bind(self, catalog: Optional[Catalog] = None) -> PlayerTable:
+        """
+        Attach to `catalog` (default: the current one) and return its table snapshot.
+        If the catalog was rebuilt since we last looked, re-apply our picks by player id.
+        """
+        if catalog is not None:
+            self.catalog = catalog
+        c = self.catalog
+        table = c.table
+        if self.gen != c.gen:
+            self.index = DraftIndex.from_picks(table, self.index.drafted)
+            self.gen = c.gen
+        self.touched = time.monotonic()
+        return table
+
+    def etag(self) -> str:
+        """
+        Identifies everything a read endpoint's answer depends on: the draft's journaled
+        version (bumped by every pick/undo/settings change), the catalog revision (bumped
+        by refresh/re-init) and the rules/context/strategy hash. All of these are shared
+        between workers, so any worker can answer a conditional GET.
+        """
+        c = self.catalog
+        h = settings_hash(self.rules, self.context, self.strategy)
+        return f'W/"{self.draft_id}.{self.synced}.{c.key}.{c.rev}.{h}"'
+
+    def reset(self) -> None:
+        """Fresh board on the current catalog (what /api/init does to a draft)."""
+        self.index = DraftIndex(self.catalog.table)
+        self.gen = self.catalog.gen
+
+    # ---- Persistence (journal + eviction) ----
+    def record(self, event: Dict[str, Any]) -> None:
+        """Journal a state change at the current version; snapshot every `snapshot_every` events."""
+        self.synced = self.events.version
+        if self.journal is None:
+            return
+        self.journal.append(self.synced, event)
+        if self.journal.due():
+            self.journal.snapshot(self.to_state())
+
+    def transaction(self):
+        """Write scope for a change: exclusive across workers when the journal is shared."""
+        return self.journal.transaction() if self.journal is not None else contextlib.nullcontext()
+
+    def catch_up(self, resolve: Callable[[str], Catalog]) -> List[Dict[str, Any]]:
+        """
+        Apply changes other workers journaled since `synced` (shared state; a no-op with a
+        local journal). Returns the applied events ({"v", "t", ...}) so the caller can push
+        them; a single {"t": "reset"} if the draft had to be reloaded from a snapshot.
+        """
+        changes = self.journal.changes(self.synced) if self.journal is not None else None
+        if not changes:
+            return []
+        state, events = changes
+        with self.lock:
+            if state is not None:
+                self.load(state, resolve(state.get("catalog")))
+                return [{"v": self.synced, "t": "reset"}]
+            applied = []
+            for ev in events:
+                if ev["v"] > self.synced:
+                    if self.apply(ev, resolve):
+                        applied.append(ev)
+                    self.synced = ev["v"]
+            return applied
+
+    def apply(self, ev: Dict[str, Any], resolve: Callable[[str], Catalog]) -> bool:
+        """One journaled event on top of the live state (same rules as journal.replay)."""
+        if "catalog" in ev and ev["catalog"] != self.catalog.key:
+            self.catalog = resolve(ev["catalog"])
+            self.index = DraftIndex.from_picks(self.catalog.table, self.index.drafted)
+            self.gen = self.catalog.gen
+        table = self.bind()
+        t = ev.get("t")
+        entry = {k: v for k, v in ev.items() if k != "v"}
+        if t == "draft":
+            if not self.index.draft(table, ev["pid"], ev["teamName"]):
+                return False
+            self.history.append(entry)
+        elif t == "bulk":
+            picks = [p for p in ev["picks"] if self.index.draft(table, p["pid"], p["teamName"])]
+            if not picks:
+                return False
+            self.history.extend(picks)
+        elif t == "undraft":
+            if not self.index.undraft(table, ev["pid"]):
+                return False
+            self.history.append(entry)
+        elif t in ("rules", "context", "strategy", "opponents"):
+            setattr(self, t, ev[t])
+        elif t == "reset":
+            self.reset()
+        return True
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "draft_id": self.draft_id,
+            "catalog": self.catalog.key,
+            "drafted": [[pid, team] for pid, team in self.index.drafted.items()],
+            "history": self.history,
+            "rules": self.rules,
+            "context": self.context,
+            "strategy": self.strategy,
+            "opponents": self.opponents,
+            "version": self.synced,
+        }
+
+    def load(self, state: Dict[str, Any], catalog: Catalog) -> None:
+        """Replace the draft's state with a to_state() dict (keeps the push channel)."""
+        self.catalog = catalog
+        self.gen = catalog.gen
+        self.index = DraftIndex.from_picks(catalog.table, {int(pid): team for pid, team in state.get("drafted", [])})
+        self.history = state.get("history", [])
+        self.rules = state.get("rules", self.rules)
+        self.context = state.get("context", self.context)
+        self.strategy = state.get("strategy", self.strategy)
+        self.opponents = state.get("opponents", {})
+        self.synced = int(state.get("version", 0))
+        self.events.version = max(self.events.version, self.synced)
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any], catalog: Catalog, journal: Optional[DraftJournal] = None) -> "DraftSession":
+        s = cls(state["draft_id"], catalog, journal)
+        s.load(state, catalog)
+        return s
+
+
+class SessionStore:
+    """
+    Draft sessions keyed by draft id, plus the per-season catalogs they sit on.
+    Every session journals its changes under `root` (DraftJournal: <id>.log + <id>.json
+    snapshot), so a restart or crash loses nothing. At most `max_live` sessions stay in
+    memory; the least recently used idle one (no push subscribers) is snapshotted and
+    dropped, and is transparently recovered the next time its id is used.
+
+    With `shared` (several worker processes) journals live in the SharedState database
+    instead and catalogs are published there as memory-mapped column files; sync_catalogs()
+    and DraftSession.catch_up() bring this worker up to what the others wrote.
+    """
+
+    def __init__(self, root: str, max_live: int = 16, shared: Optional[SharedState] = None, **journal_opts: Any):
+        self.root = root
+        self.max_live = max(1, max_live)
+        self.shared = shared
+        self.journal_opts = journal_opts   # snapshot_every / fsync_every / fsync_seconds
+        self.catalogs: Dict[str, Catalog] = {}
+        self.default_catalog = Catalog(catalog_key(None))
+        self._live: "OrderedDict[str, DraftSession]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    # ---- Catalogs ----
+    def catalog(self, key: Optional[str] = None) -> Catalog:
+        if key is None:
+            return self.default_catalog
+        return self.catalogs.get(key) or self.default_catalog
+
+    def put_catalog(self, catalog: Catalog, default: bool = True) -> None:
+        self.catalogs[catalog.key] = catalog
+        if default:
+            self.default_catalog = catalog   # new drafts start on the latest init'd season
+
+    def publish_catalog(self, catalog: Catalog) -> None:
+        """A freshly rebuilt catalog: make it the one every worker uses."""
+        if self.shared is not None:
+            self.shared.publish_catalog(catalog)
+        self.put_catalog(catalog)
+
+    def swap_catalog(self, catalog: Catalog, base: PlayerTable, new: PlayerTable, changed: List[int]) -> bool:
+        """
+        Install a patched copy of `base` unless the catalog moved on meanwhile (a re-init
+        here, or another worker's refresh/re-init); False means `new` was dropped.
+        """
+        if catalog.table is not base:
+            return False
+        if self.shared is None:
+            catalog.swap(new)
+            return True
+        staged = Catalog(catalog.key, source=catalog.source, season=catalog.season)
+        staged.table, staged.gen, staged.rev = new, catalog.gen, catalog.rev
+        if not self.shared.publish_catalog(staged, base_rev=catalog.rev, changed=changed):
+            return False
+        catalog.table, catalog.rev = new, staged.rev
+        return True
+
+    def sync_catalogs(self, make_source: Callable[[Optional[str]], Any]) -> List[Tuple[Catalog, PlayerTable, Optional[List[int]]]]:
+        """
+        Load catalogs other workers published since we last looked (shared state only).
+        Returns (catalog, previous table, changed pids) per catalog that moved; changed is
+        None when it was rebuilt or we skipped revisions, i.e. the patch is not known.
+        """
+        if self.shared is None:
+            return []
+        with self._lock:
+            moved = []
+            rows = self.shared.catalogs()
+            for row in rows:
+                c = self.catalogs.get(row["key"])
+                if c is None and row["key"] == self.default_catalog.key:
+                    c = self.default_catalog   # the placeholder sessions started on
+                if c is not None and c.rev == row["rev"]:
+                    continue
+                try:
+                    table = PlayerTable.load(row["path"])
+                except OSError:
+                    continue   # superseded while we looked; the next sync picks up the newer one
+                if c is None:
+                    c = Catalog(row["key"], season=row["season"])
+                old = c.table
+                changed = json.loads(row["changed"]) if row["changed"] and c.rev == row["rev"] - 1 else None
+                if c.source is None or getattr(c.source, "name", None) != row["provider"]:
+                    c.source = make_source(row["provider"])
+                c.season = row["season"]
+                c.adopt(table, row["gen"], row["rev"])
+                self.put_catalog(c, default=False)
+                moved.append((c, old, changed))
+            if moved and rows[-1]["key"] in self.catalogs:
+                self.default_catalog = self.catalogs[rows[-1]["key"]]   # the most recently published season
+            return moved
+
+    # ---- Sessions ----
+    def get(self, draft_id: Optional[str] = None) -> DraftSession:
+        draft_id = draft_id or DEFAULT_DRAFT
+        if not _DRAFT_ID.match(draft_id):
+            raise ValueError(f"Invalid draft id: {draft_id!r}")
+        with self._lock:
+            s = self._live.get(draft_id)
+            if s is None:
+                s = self._load(draft_id) or DraftSession(draft_id, self.default_catalog, self._journal(draft_id))
+                self._live[draft_id] = s
+                self._evict()
+            else:
+                self._live.move_to_end(draft_id)
+            return s
+
+    def live(self, catalog: Optional[Catalog] = None) -> List[DraftSession]:
+        with self._lock:
+            return [s for s in self._live.values() if catalog is None or s.catalog is catalog]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            if self.shared is not None:
+                on_disk = self.shared.draft_count()
+            else:
+                on_disk = len([f for f in os.listdir(self.root) if f.endswith(".json")]) if os.path.isdir(self.root) else 0
+            return {"live": len(self._live), "max_live": self.max_live, "on_disk": on_disk,
+                    "catalogs": sorted(self.catalogs)}
+
+    def _journal(self, draft_id: str) -> DraftJournal:
+        if self.shared is not None:
+            return SharedJournal(self.shared, draft_id, **self.journal_opts)
+        return DraftJournal(self.root, draft_id, **self.journal_opts)
+
+    def _load(self, draft_id: str) -> Optional[DraftSession]:
+        """Latest snapshot + replay of the log tail (at most snapshot_every events)."""
+        journal = self._journal(draft_id)
+        recovered = journal.recover()
+        if recovered is None:
+            return None
+        state, _ = recovered
+        state.setdefault("draft_id", draft_id)
+        return DraftSession.from_state(state, self.catalog(state.get("catalog")), journal)
+
+    def _save(self, s: DraftSession) -> None:
+        if s.journal is None:
+            s.journal = self._journal(s.draft_id)
+        s.journal.snapshot(s.to_state())
+
+    def _evict(self) -> None:
+        """Write out least-recently-used idle sessions until we're back under max_live."""
+        over = len(self._live) - self.max_live
+        if over <= 0:
+            return
+        for draft_id in list(self._live):
+            if over <= 0:
+                break
+            s = self._live[draft_id]
+            if s.events.subscribers:
+                continue   # someone is watching it live
+            with s.lock:
+                self._save(s)
+                s.journal.close()
+            del self._live[draft_id]
+            over -= 1
+
+    def flush(self) -> None:
+        """Snapshot every live session (clean shutdown: next start has no log to replay)."""
+        with self._lock:
+            for s in self._live.values():
+                with s.lock:
+                    self._save(s)
+                    s.journal.close()
@@ -0,0 +1,236 @@
+import os
+import json
+import time
+import shutil
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from store.table import PlayerTable
+from store.journal import replay
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS drafts (
+    draft_id TEXT PRIMARY KEY,
+    version  INTEGER NOT NULL DEFAULT 0,   -- latest event version
+    snap     INTEGER NOT NULL DEFAULT 0,   -- version the snapshot covers
+    state    TEXT                          -- DraftSession.to_state() JSON at `snap`
+);
+CREATE TABLE IF NOT EXISTS events (
+    draft_id TEXT NOT NULL,
+    v        INTEGER NOT NULL,
+    event    TEXT NOT NULL,
+    PRIMARY KEY (draft_id, v)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS catalogs (
+    key      TEXT PRIMARY KEY,
+    gen      INTEGER NOT NULL,
+    rev      INTEGER NOT NULL,
+    season   INTEGER,
+    provider TEXT,
+    path     TEXT NOT NULL,
+    changed  TEXT,                         -- pids patched by the swap that made `rev` (null = rebuild)
+    updated  REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS leases (
+    name  TEXT PRIMARY KEY,
+    until REAL NOT NULL
+);
+"""
+
+
+class SharedState:
+    """
+    State shared by every worker process of one deployment (FFL_STATE_DB):
+
+    - drafts/events: each draft's journal (SharedJournal); writers serialize on a
+      `BEGIN IMMEDIATE` transaction and event versions are primary keys, so two workers
+      can never both write version N
+    - catalogs: the current (gen, rev) of each season's catalog and the directory its
+      columns were saved to; workers memory-map those files instead of each holding a copy
+    - leases: "only one worker does this every N seconds" (background refresh)
+
+    SQLite in WAL mode: readers never block the writer, and a version check is one
+    indexed row read. Connections are per thread (sqlite3 objects are not shareable).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.catalog_dir = os.path.join(os.path.dirname(os.path.abspath(path)), "catalogs")
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn.executescript(_SCHEMA)
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        c = getattr(self._local, "conn", None)
+        if c is None:
+            c = sqlite3.connect(self.path, timeout=10.0, isolation_level=None, check_same_thread=False)
+            c.execute("PRAGMA journal_mode=WAL")
+            c.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = c
+            self._local.depth = 0
+        return c
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Exclusive write transaction (re-entrant per thread); rolled back on error."""
+        c = self.conn
+        if self._local.depth:
+            self._local.depth += 1
+            try:
+                yield c
+            finally:
+                self._local.depth -= 1
+            return
+        c.execute("BEGIN IMMEDIATE")
+        self._local.depth = 1
+        try:
+            yield c
+        except BaseException:
+            c.execute("ROLLBACK")
+            raise
+        else:
+            c.execute("COMMIT")
+        finally:
+            self._local.depth = 0
+
+    # ---- Catalogs ----
+    def catalogs(self) -> List[Dict[str, Any]]:
+        rows = self.conn.execute(
+            "SELECT key, gen, rev, season, provider, path, changed, updated FROM catalogs ORDER BY updated"
+        ).fetchall()
+        cols = ("key", "gen", "rev", "season", "provider", "path", "changed", "updated")
+        return [dict(zip(cols, r)) for r in rows]
+
+    def publish_catalog(self, catalog: Any, base_rev: Optional[int] = None, changed: Optional[List[int]] = None) -> bool:
+        """
+        Save `catalog.table` and make it the season's current catalog.
+        With `base_rev` (a refresh) this only succeeds if nobody moved the catalog past
+        base_rev meanwhile; otherwise the caller should drop its copy and load theirs.
+        A rebuild (base_rev None) always wins and takes the next gen. Sets catalog.gen/rev.
+        """
+        with self.transaction() as c:
+            row = c.execute("SELECT gen, rev, path FROM catalogs WHERE key = ?", (catalog.key,)).fetchone()
+            gen, rev, old_path = row if row else (0, 0, None)
+            if base_rev is not None and rev != base_rev:
+                return False
+            new_gen = gen if base_rev is not None else max(gen + 1, catalog.gen)
+            new_rev = max(rev + 1, catalog.rev)
+            path = os.path.join(self.catalog_dir, f"{catalog.key}.{new_rev}")
+            catalog.table.save(path)
+            c.execute(
+                "INSERT OR REPLACE INTO catalogs (key, gen, rev, season, provider, path, changed, updated)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (catalog.key, new_gen, new_rev, catalog.season, getattr(catalog.source, "name", None),
+                 path, None if changed is None else json.dumps(changed), time.time()),
+            )
+        catalog.gen, catalog.rev = new_gen, new_rev
+        if old_path and old_path != path:
+            # workers still mapping the old files keep them alive until they move on (POSIX)
+            shutil.rmtree(old_path, ignore_errors=True)
+        return True
+
+    # ---- Drafts ----
+    def draft_count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM drafts").fetchone()[0]
+
+    # ---- Leases ----
+    def claim(self, name: str, seconds: float) -> bool:
+        """True for exactly one caller per `seconds` window across all workers."""
+        now = time.time()
+        with self.transaction() as c:
+            row = c.execute("SELECT until FROM leases WHERE name = ?", (name,)).fetchone()
+            if row and row[0] > now:
+                return False
+            c.execute("INSERT OR REPLACE INTO leases (name, until) VALUES (?, ?)", (name, now + seconds))
+        return True
+
+
+class SharedJournal:
+    """
+    DraftJournal backed by SharedState, for multi-worker deployments: the same
+    append/snapshot/recover interface, plus transaction() (serialize a read-modify-write
+    of the draft across workers) and changes() (what other workers wrote since a version).
+    fsync batching does not apply: SQLite commits are durable per transaction.
+    """
+
+    def __init__(self, shared: SharedState, draft_id: str, snapshot_every: int = 50, **_: Any):
+        self.shared = shared
+        self.draft_id = draft_id
+        self.snapshot_every = max(1, snapshot_every)
+        self.since_snapshot = 0
+
+    def transaction(self):
+        return self.shared.transaction()
+
+    # ---- Write ----
+    def append(self, version: int, event: Dict[str, Any]) -> None:
+        with self.shared.transaction() as c:
+            cur = c.execute(
+                "INSERT INTO drafts (draft_id, version) VALUES (?, ?)"
+                " ON CONFLICT (draft_id) DO UPDATE SET version = excluded.version WHERE drafts.version < excluded.version",
+                (self.draft_id, version),
+            )
+            if cur.rowcount != 1:
+                raise RuntimeError(f"Draft {self.draft_id} moved past version {version} (concurrent write)")
+            c.execute(
+                "INSERT INTO events (draft_id, v, event) VALUES (?, ?, ?)",
+                (self.draft_id, version, json.dumps(event, separators=(",", ":"))),
+            )
+        self.since_snapshot += 1
+
+    def sync(self) -> None:
+        pass
+
+    def due(self) -> bool:
+        return self.since_snapshot >= self.snapshot_every
+
+    def snapshot(self, state: Dict[str, Any]) -> None:
+        """Store `state` unless a newer snapshot is already there; drop the events it covers."""
+        v = int(state.get("version", 0))
+        with self.shared.transaction() as c:
+            c.execute(
+                "INSERT INTO drafts (draft_id, version, snap, state) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (draft_id) DO UPDATE SET snap = excluded.snap, state = excluded.state"
+                " WHERE drafts.snap <= excluded.snap AND drafts.version <= excluded.snap",
+                (self.draft_id, v, v, json.dumps(state, separators=(",", ":"))),
+            )
+            c.execute("DELETE FROM events WHERE draft_id = ? AND v <= (SELECT snap FROM drafts WHERE draft_id = ?)",
+                      (self.draft_id, self.draft_id))
+        self.since_snapshot = 0
+
+    def close(self) -> None:
+        pass
+
+    # ---- Read ----
+    def _tail(self, after: int) -> List[Dict[str, Any]]:
+        rows = self.shared.conn.execute(
+            "SELECT v, event FROM events WHERE draft_id = ? AND v > ? ORDER BY v", (self.draft_id, after)
+        ).fetchall()
+        return [{"v": v, **json.loads(ev)} for v, ev in rows]
+
+    def changes(self, version: int) -> Optional[Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """
+        None if nobody wrote past `version`. Otherwise (None, events after version), or
+        (full state, []) if the events in between were folded into a snapshot since.
+        """
+        row = self.shared.conn.execute(
+            "SELECT version, snap, state FROM drafts WHERE draft_id = ?", (self.draft_id,)
+        ).fetchone()
+        if row is None or row[0] <= version:
+            return None
+        head, snap, state = row
+        if version < snap:
+            return replay(json.loads(state), self._tail(snap)), []
+        return None, self._tail(version)
+
+    def recover(self) -> Optional[Tuple[Dict[str, Any], int]]:
+        row = self.shared.conn.execute("SELECT snap, state FROM drafts WHERE draft_id = ?", (self.draft_id,)).fetchone()
+        if row is None:
+            return None
+        snap, state = row
+        tail = self._tail(snap)
+        self.since_snapshot = len(tail)
+        return replay(json.loads(state) if state else {}, tail), len(tail)
@@ -0,0 +1,38 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class SuggestionCache:
+    """
+    One draft's engine output, computed once per state key (draft version, catalog
+    revision, settings hash) and kept for the last `keep` keys. An entry holds up to
+    two rankings, each computed the first time it is asked for:
+
+    - None:          the unfiltered ranking
+    - "by_position": every position's filtered ranking, from one engine pass
+
+    Both are computed at the engine's full depth; a request's count is a prefix of them.
+    """
+
+    def __init__(self, keep: int = 4):
+        self.keep = max(1, keep)
+        self._entries: "OrderedDict[Hashable, Dict[Optional[str], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, part: Optional[str], compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if part in entry:
+                    return entry[part]
+        value = compute()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = {}
+                while len(self._entries) > self.keep:
+                    self._entries.popitem(last=False)
+            entry[part] = value
+        return value
@@ -0,0 +1,409 @@
+import os
+import json
+import shutil
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+import numpy as np
+
+from models import Player, STAT_FIELDS
+
+POSITIONS = ("QB", "RB", "WR", "TE", "K", "DST")
+POS_CODE = {p: i for i, p in enumerate(POSITIONS)}
+
+# Per-stat projection columns, in stats-matrix column order
+STAT_COLUMNS = STAT_FIELDS
+STAT_INDEX = {c: i for i, c in enumerate(STAT_COLUMNS)}
+
+# Small-int columns; -1 stands in for None
+INT_COLUMNS = ("age", "years_exp", "bye_week", "depth_order", "committee_size", "recent_injuries")
+# Float columns; NaN stands in for None
+FLOAT_COLUMNS = ("adp", "projected_points")
+
+NA = -1
+
+# Per-player features that depend on catalog fields only (logic.engine_v2.features.static_features
+# fills them); patching one of FEATURE_INPUTS marks the row for recompute
+FEATURE_COLUMNS = ("role_certainty_mult", "injury_risk", "age_penalty", "rookie_volatility", "role_uncertainty")
+FEATURE_INPUTS = ("injury_status", "depth_order", "committee_size", "age", "years_exp")
+
+
+def dumps(obj: Any) -> bytes:
+    """Compact JSON bytes, same output as FastAPI's JSONResponse."""
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+class PlayerTable:
+    """
+    Struct-of-arrays player catalog: one NumPy column per Player field, a
+    (players x STAT_COLUMNS) stats matrix and a player_id -> row index.
+    Strings (name/team/injury) are interned into small code columns.
+    `features` holds the engine's catalog-only per-player features (FEATURE_COLUMNS).
+    Build Player models only for the rows a response actually returns (player()).
+    """
+
+    def __init__(self, n: int = 0):
+        self.n = n
+        self.ids = np.zeros(n, dtype=np.int64)
+        self.names: List[str] = [""] * n
+        self.pos = np.full(n, NA, dtype=np.int8)
+        self.team = np.full(n, NA, dtype=np.int16)
+        self.team_names: List[str] = []
+        self.injury = np.zeros(n, dtype=np.int8)        # 0 = no status
+        self.injury_names: List[Optional[str]] = [None]
+        self.ints: Dict[str, np.ndarray] = {c: np.full(n, NA, dtype=np.int16) for c in INT_COLUMNS}
+        self.floats: Dict[str, np.ndarray] = {c: np.full(n, np.nan, dtype=np.float64) for c in FLOAT_COLUMNS}
+        self.stats = np.full((n, len(STAT_COLUMNS)), np.nan, dtype=np.float64)
+        self.features: Dict[str, np.ndarray] = {}       # FEATURE_COLUMNS, empty until computed
+        self.stale_features: Set[int] = set()           # rows patched since they were computed
+        self.index: Dict[int, int] = {}
+        self._lists: Dict[str, list] = {}
+        self._orders: Dict[str, np.ndarray] = {}
+        self._rank: Optional[List[int]] = None
+        self._json: List[Optional[bytes]] = [None] * n   # per-row serialized Player, filled lazily
+
+    # ---- Build ----
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]]) -> "PlayerTable":
+        rows = list(rows)
+        t = cls(len(rows))
+        team_code: Dict[str, int] = {}
+        injury_code: Dict[str, int] = {}
+        for i, r in enumerate(rows):
+            pid = int(r["player_id"])
+            t.ids[i] = pid
+            t.index[pid] = i
+            t.names[i] = r.get("name") or ""
+            t.pos[i] = POS_CODE.get(str(r.get("position") or "").upper(), NA)
+            team = r.get("team")
+            if team:
+                if team not in team_code:
+                    team_code[team] = len(t.team_names)
+                    t.team_names.append(team)
+                t.team[i] = team_code[team]
+            status = r.get("injury_status")
+            if status:
+                if status not in injury_code:
+                    injury_code[status] = len(t.injury_names)
+                    t.injury_names.append(status)
+                t.injury[i] = injury_code[status]
+            for c in INT_COLUMNS:
+                v = r.get(c)
+                if v is not None:
+                    t.ints[c][i] = int(v)
+            for c in FLOAT_COLUMNS:
+                v = r.get(c)
+                if v is not None:
+                    t.floats[c][i] = float(v)
+            for j, c in enumerate(STAT_COLUMNS):
+                v = r.get(c)
+                if v is not None:
+                    t.stats[i, j] = float(v)
+        return t
+
+    @classmethod
+    def from_players(cls, players: Iterable[Player]) -> "PlayerTable":
+        return cls.from_rows(p.model_dump() for p in players)
+
+    # ---- Lookup ----
+    def __len__(self) -> int:
+        return self.n
+
+    def __contains__(self, pid: int) -> bool:
+        return pid in self.index
+
+    def row_of(self, pid: int) -> Optional[int]:
+        return self.index.get(pid)
+
+    def rows_of(self, pids: Iterable[int]) -> np.ndarray:
+        return np.fromiter((self.index[p] for p in pids if p in self.index), dtype=np.int64)
+
+    def position_of(self, i: int) -> str:
+        c = int(self.pos[i])
+        return POSITIONS[c] if c >= 0 else ""
+
+    def team_of(self, i: int) -> Optional[str]:
+        c = int(self.team[i])
+        return self.team_names[c] if c >= 0 else None
+
+    def column(self, name: str) -> np.ndarray:
+        if name in self.floats:
+            return self.floats[name]
+        if name in self.ints:
+            return self.ints[name]
+        if name in STAT_INDEX:
+            return self.stats[:, STAT_INDEX[name]]
+        return getattr(self, name)
+
+    # ---- Scalar access (python lists, built lazily; views read these) ----
+    def _list(self, name: str) -> list:
+        lst = self._lists.get(name)
+        if lst is None:
+            if name == "position":
+                lst = [POSITIONS[c] if c >= 0 else "" for c in self.pos.tolist()]
+            elif name == "team":
+                lst = [self.team_names[c] if c >= 0 else None for c in self.team.tolist()]
+            elif name == "injury_status":
+                lst = [self.injury_names[c] for c in self.injury.tolist()]
+            elif name == "player_id":
+                lst = self.ids.tolist()
+            elif name == "name":
+                lst = self.names
+            elif name in self.ints:
+                lst = [None if v == NA else v for v in self.ints[name].tolist()]
+            else:
+                col = self.column(name)
+                lst = [None if v != v else v for v in col.tolist()]
+            self._lists[name] = lst
+        return lst
+
+    def value(self, i: int, name: str) -> Any:
+        return self._list(name)[i]
+
+    def view(self, i: int) -> "PlayerView":
+        return PlayerView(self, i)
+
+    def views(self, rows: Optional[Iterable[int]] = None) -> List["PlayerView"]:
+        if rows is None:
+            rows = range(self.n)
+        return [PlayerView(self, int(i)) for i in rows]
+
+    def get(self, pid: int) -> Optional["PlayerView"]:
+        i = self.index.get(pid)
+        return PlayerView(self, i) if i is not None else None
+
+    # ---- Board order ----
+    def order(self, pos: Optional[str] = None) -> np.ndarray:
+        """
+        Rows sorted by projection desc, ADP asc (missing = 9999), name — the board order
+        every list uses. Computed once per catalog (per position) and shared by all readers.
+        """
+        key = (pos or "").upper()
+        o = self._orders.get(key)
+        if o is None:
+            if key == "":
+                rows = np.arange(self.n)
+            elif key in POS_CODE:
+                rows = np.nonzero(self.pos == POS_CODE[key])[0]
+            else:
+                rows = np.zeros(0, dtype=np.int64)
+            proj = np.nan_to_num(self.floats["projected_points"][rows], nan=0.0)
+            adp = self.floats["adp"][rows]
+            adp = np.where(np.isnan(adp) | (adp == 0), 9999.0, adp)
+            names = np.array([self.names[i] for i in rows.tolist()], dtype=object)
+            o = rows[np.lexsort((names, adp, -proj))] if rows.size else rows
+            self._orders[key] = o
+        return o
+
+    def rank(self) -> List[int]:
+        """row -> position on the overall board (0 = best); inverse of order()."""
+        if self._rank is None:
+            r = np.empty(self.n, dtype=np.int64)
+            r[self.order()] = np.arange(self.n)
+            self._rank = r.tolist()
+        return self._rank
+
+    def _invalidate_order(self) -> None:
+        self._orders.clear()
+        self._rank = None
+
+    # ---- Materialize ----
+    def to_dict(self, i: int) -> Dict[str, Any]:
+        return {f: self.value(i, f) for f in Player.model_fields}
+
+    def to_dicts(self, rows: Iterable[int], fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """JSON-ready dicts for `rows`, limited to `fields` (default: every Player field)."""
+        cols = list(fields) if fields is not None else list(Player.model_fields)
+        lists = [self._list(f) for f in cols]
+        return [{f: lst[i] for f, lst in zip(cols, lists)} for i in rows]
+
+    def player(self, i: int) -> Player:
+        return Player.model_construct(**self.to_dict(i))
+
+    def players(self, rows: Iterable[int]) -> List[Player]:
+        return [self.player(int(i)) for i in rows]
+
+    # ---- Pre-serialized JSON ----
+    def fragment(self, i: int) -> bytes:
+        """Row i as Player JSON, serialized once and reused until the row is patched."""
+        frag = self._json[i]
+        if frag is None:
+            frag = self._json[i] = dumps(self.to_dict(i))
+        return frag
+
+    def json_array(self, rows: Iterable[int]) -> bytes:
+        """A JSON array of Players assembled from cached fragments (no model building)."""
+        return b"[" + b",".join([self.fragment(i) for i in rows]) + b"]"
+
+    def copy(self) -> "PlayerTable":
+        """
+        Copy for copy-on-write updates: value columns are duplicated, while the
+        pid -> row index and the name list (never patched) are shared.
+        """
+        t = PlayerTable.__new__(PlayerTable)
+        t.n = self.n
+        t.ids = self.ids
+        t.names = self.names
+        t.index = self.index
+        t.pos = self.pos
+        t.team = self.team
+        t.team_names = self.team_names
+        t.injury = self.injury.copy()
+        t.injury_names = list(self.injury_names)
+        t.ints = {c: a.copy() for c, a in self.ints.items()}
+        t.floats = {c: a.copy() for c, a in self.floats.items()}
+        t.stats = self.stats.copy()
+        t.features = {c: a.copy() for c, a in self.features.items()}
+        t.stale_features = set(self.stale_features)
+        t._lists = {c: list(v) for c, v in self._lists.items() if c != "name"}
+        t._orders = dict(self._orders)
+        t._rank = self._rank
+        t._json = list(self._json)   # fragments of unpatched rows carry over
+        return t
+
+    # ---- On disk (shared between worker processes) ----
+    def save(self, path: str) -> None:
+        """
+        Write the columns as .npy files (+ strings in meta.json) into directory `path`.
+        Built in a temp dir and renamed into place, so readers never see half a table.
+        """
+        tmp = f"{path}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        arrays = {"ids": self.ids, "pos": self.pos, "team": self.team, "injury": self.injury, "stats": self.stats}
+        arrays.update({f"int.{c}": a for c, a in self.ints.items()})
+        arrays.update({f"float.{c}": a for c, a in self.floats.items()})
+        if not self.stale_features:
+            arrays.update({f"feature.{c}": a for c, a in self.features.items()})
+        for name, a in arrays.items():
+            np.save(os.path.join(tmp, f"{name}.npy"), a)
+        with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"n": self.n, "names": self.names, "team_names": self.team_names,
+                       "injury_names": self.injury_names}, f, ensure_ascii=False)
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "PlayerTable":
+        """
+        Open a table written by save(). With mmap the numeric columns are read-only
+        memory maps: every process that loads the same files shares one copy in the
+        page cache. Patching goes through copy(), which makes private writable columns.
+        """
+        with open(os.path.join(path, "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        mode = "r" if mmap else None
+        col = lambda name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mode)
+        t = cls.__new__(cls)
+        t.n = int(meta["n"])
+        t.ids, t.pos, t.team, t.injury, t.stats = col("ids"), col("pos"), col("team"), col("injury"), col("stats")
+        t.names = meta["names"]
+        t.team_names = meta["team_names"]
+        t.injury_names = meta["injury_names"]
+        t.ints = {c: col(f"int.{c}") for c in INT_COLUMNS}
+        t.floats = {c: col(f"float.{c}") for c in FLOAT_COLUMNS}
+        has_features = all(os.path.exists(os.path.join(path, f"feature.{c}.npy")) for c in FEATURE_COLUMNS)
+        t.features = {c: col(f"feature.{c}") for c in FEATURE_COLUMNS} if has_features else {}
+        t.stale_features = set()
+        t.index = {pid: i for i, pid in enumerate(t.ids.tolist())}
+        t._lists = {}
+        t._orders = {}
+        t._rank = None
+        t._json = [None] * t.n
+        return t
+
+    # ---- Writes ----
+    def fill_missing_projections(self, rows: Sequence[int], pts: Sequence[float]) -> None:
+        """Only fill rows whose feed projected_points is missing (never overwrite feed values)."""
+        col = self.floats["projected_points"]
+        rows = np.asarray(rows, dtype=np.int64)
+        if rows.size == 0:
+            return
+        vals = np.asarray(pts, dtype=np.float64)
+        missing = np.isnan(col[rows])
+        if missing.any():
+            col[rows[missing]] = vals[missing]
+            for i in rows[missing].tolist():
+                self._json[i] = None
+            self._lists.pop("projected_points", None)
+            self._invalidate_order()
+
+    def patch(self, updates: Dict[int, Dict[str, Any]]) -> List[int]:
+        """
+        Write new field values for existing players (pid -> {field: value}).
+        Cost is proportional to the number of updates; returns the patched pids.
+        """
+        patched: List[int] = []
+        for pid, fields in updates.items():
+            i = self.index.get(pid)
+            if i is None:
+                continue
+            for f, v in fields.items():
+                self._set(i, f, v)
+            patched.append(pid)
+        return patched
+
+    def _set(self, i: int, f: str, v: Any) -> None:
+        if f == "injury_status":
+            if not v:
+                code = 0
+            elif v in self.injury_names:
+                code = self.injury_names.index(v)
+            else:
+                code = len(self.injury_names)
+                self.injury_names.append(v)
+            self.injury[i] = code
+        elif f in self.ints:
+            self.ints[f][i] = NA if v is None else int(v)
+        elif f in self.floats:
+            self.floats[f][i] = np.nan if v is None else float(v)
+        elif f in STAT_INDEX:
+            self.stats[i, STAT_INDEX[f]] = np.nan if v is None else float(v)
+        else:
+            raise KeyError(f"{f} is not a patchable column")
+        lst = self._lists.get(f)
+        if lst is not None:
+            lst[i] = v
+        if f in FEATURE_INPUTS and self.features:
+            self.stale_features.add(i)
+        self._json[i] = None
+        if f in ("projected_points", "adp"):
+            self._invalidate_order()
+
+    def nbytes(self) -> int:
+        arrays = [self.ids, self.pos, self.team, self.injury, self.stats, *self.ints.values(), *self.floats.values(),
+                  *self.features.values()]
+        return sum(a.nbytes for a in arrays) + sum(len(s) + 49 for s in self.names)
+
+
+class PlayerView:
+    """
+    Read-only, attribute-compatible stand-in for Player backed by one table row,
+    so engine code written against Player runs on the table without copying.
+    """
+    __slots__ = ("_t", "_i")
+
+    def __init__(self, table: PlayerTable, i: int):
+        self._t = table
+        self._i = i
+
+    @property
+    def row(self) -> int:
+        return self._i
+
+    @property
+    def table(self) -> PlayerTable:
+        return self._t
+
+    def to_player(self) -> Player:
+        return self._t.player(self._i)
+
+    def __repr__(self) -> str:
+        return f"PlayerView({self._t.value(self._i, 'player_id')}, {self._t.value(self._i, 'name')!r})"
+
+
+def _field(name: str):
+    return property(lambda self: self._t._list(name)[self._i])
+
+
+for _f in Player.model_fields:
+    setattr(PlayerView, _f, _field(_f))
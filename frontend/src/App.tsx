@@ -1,4 +1,4 @@
-import React, { useEffect, useMemo, useState } from "react";
+import React, { useEffect, useMemo, useRef, useState } from "react";
 import { Player, Suggestion, ScoringRules } from "./types";
 import {
   initSeason,
@@ -8,6 +8,8 @@ import {
   getDrafted,
   setRules as saveRulesApi,
   undraftPlayer,
+  subscribeDraftEvents,
+  DraftEvent,
 } from "./api";
 import DraftBoard from "./components/DraftBoard";
 import SettingsDrawer from "./components/SettingsDrawer";
@@ -19,6 +21,17 @@ function fmt(v: any, digits = 1) {
   return Number.isFinite(n) ? n.toFixed(digits) : '-';
 }
 
+// Same board order as the backend: projection desc, ADP asc (missing last), name
+function sortBoard(list: Player[]) {
+  const adp = (p: Player) => (p.adp ? p.adp : 9999);
+  return [...list].sort(
+    (a, b) =>
+      (b.projected_points ?? 0) - (a.projected_points ?? 0) ||
+      adp(a) - adp(b) ||
+      a.name.localeCompare(b.name)
+  );
+}
+
 export default function App() {
   // ---- Top bar / session ----
   const [season, setSeason] = useState("2025");
@@ -88,10 +101,60 @@ export default function App() {
     setDrafted(D);
   }
 
+  // ---- Live updates: apply pushed deltas instead of refetching everything ----
+  const [live, setLive] = useState(false);
+  const playersRef = useRef<Player[]>([]);
+  playersRef.current = players;
+  const posSugRef = useRef(posSug);
+  posSugRef.current = posSug;
+
+  function applyEvent(e: DraftEvent) {
+    if (e.type === "hello") { setLive(true); return; }
+    if (e.type === "ping") return;
+    if (e.type === "reset") { refreshLists(); return; }
+    if (e.removed?.length) {
+      const gone = new Set(e.removed);
+      const byId = new Map(playersRef.current.map(p => [p.player_id, p]));
+      const picks = e.picks ?? (e.teamName ? e.removed.map(pid => ({ pid, teamName: e.teamName! })) : []);
+      const rows = picks
+        .filter(x => byId.has(x.pid))
+        .map(x => ({ player: byId.get(x.pid)!, teamName: x.teamName }));
+      setPlayers(prev => prev.filter(p => !gone.has(p.player_id)));
+      if (rows.length) setDrafted(prev => [...prev, ...rows]);
+    }
+    if (e.added?.length) {
+      const back = new Set(e.added.map(p => p.player_id));
+      setPlayers(prev => sortBoard([...prev.filter(p => !back.has(p.player_id)), ...e.added!]));
+      setDrafted(prev => prev.filter(d => !back.has(d.player.player_id)));
+    }
+    if (e.rows?.length) {
+      const byId = new Map(e.rows.map(p => [p.player_id, p]));
+      setPlayers(prev => sortBoard(prev.map(p => byId.get(p.player_id) ?? p)));
+      setDrafted(prev => prev.map(d => ({ ...d, player: byId.get(d.player.player_id) ?? d.player })));
+    }
+    if (e.suggest) {
+      // pushed suggestions are the unfiltered top 12; a position view refetches its own
+      if (posSugRef.current) {
+        getSuggestions(12, posSugRef.current).then(setSuggestions);
+      } else {
+        const { from, rows } = e.suggest;
+        setSuggestions(prev => [...prev.slice(0, from), ...rows]);
+      }
+    }
+  }
+
+  useEffect(() => {
+    if (!initd) return;
+    const stop = subscribeDraftEvents(applyEvent);
+    return () => { stop(); setLive(false); };
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [initd]);
+
   // Initial load
   useEffect(() => {
     (async () => {
-      await initSeason(season);
+      // keep an in-progress draft across page reloads; "Re-Init" starts over
+      await initSeason(season, false);
       setInitd(true);
       await refreshLists();
     })();
@@ -130,18 +193,18 @@ export default function App() {
   const onSaveRules = async (r: ScoringRules) => {
     setRules(r);
     await saveRulesApi(r);
-    // Recompute suggestions after rule change
-    await refreshLists();
+    // Recompute suggestions after rule change (pushed when live)
+    if (!live) await refreshLists();
   };
 
   const onDraft = async (p: Player, teamName: string) => {
     await draftPlayer(p.player_id, teamName);
-    await refreshLists();
+    if (!live) await refreshLists();
   };
 
   const onUndraft = async (p: Player) => {
     await undraftPlayer(p.player_id);
-    await refreshLists();
+    if (!live) await refreshLists();
   };
 
   const onDrop = (p: Player, teamName: string) => {
@@ -22,8 +22,11 @@ async function postJSON<T = any>(url: string, body: any): Promise<T> {
 }
 
 // ---- API ----
-export async function initSeason(season?: number | string) {
-  const q = season ? `?season=${encodeURIComponent(String(season))}` : "";
+export async function initSeason(season?: number | string, reset = true) {
+  const params = new URLSearchParams();
+  if (season) params.set("season", String(season));
+  if (!reset) params.set("reset", "false");
+  const q = params.toString() ? `?${params.toString()}` : "";
   return getJSON(`${API_BASE}/api/init${q}`);
 }
 
@@ -36,6 +39,20 @@ export async function draftPlayer(player_id: number, teamName: string) {
   return postJSON(`${API_BASE}/api/draft`, { playerId: player_id, teamName });
 }
 
+export type BulkPick = {
+  teamName: string;
+  playerId?: number;
+  // or by name (fuzzy), optionally narrowed by NFL team / position
+  name?: string;
+  team?: string;
+  pos?: string;
+};
+
+export async function draftBulk(picks: BulkPick[]) {
+  // All-or-nothing: a 422 lists the picks that could not be resolved
+  return postJSON(`${API_BASE}/api/draft/bulk`, { picks });
+}
+
 export async function undraftPlayer(player_id: number) {
   // Backend expects { playerId }
   return postJSON(`${API_BASE}/api/undraft`, { playerId: player_id });
@@ -73,3 +90,31 @@ export async function getSuggestions(count = 12, pos?: string): Promise<Suggesti
 export async function setRules(rules: any) {
   return postJSON(`${API_BASE}/api/rules`, rules);
 }
+
+// ---- Push channel (server-sent draft events) ----
+export type DraftEvent = {
+  v: number; // state version, +1 per event
+  type: "hello" | "reset" | "ping" | "draft" | "bulk" | "undraft" | "refresh" | "rules" | "context" | "strategy";
+  pid?: number;
+  teamName?: string;
+  picks?: { pid: number; teamName: string; pos?: string }[];
+  removed?: number[];
+  added?: Player[];
+  changed?: number[];
+  rows?: Player[];
+  // keep the first `from` suggestions, replace the rest with `rows`
+  suggest?: { from: number; rows: Suggestion[]; size: number };
+};
+
+export function subscribeDraftEvents(onEvent: (e: DraftEvent) => void): () => void {
+  // EventSource reconnects on its own and resumes via Last-Event-ID
+  const es = new EventSource(`${API_BASE}/api/events`);
+  es.onmessage = (m) => {
+    try {
+      onEvent(JSON.parse(m.data));
+    } catch (err) {
+      console.error("bad draft event:", err);
+    }
+  };
+  return () => es.close();
+}